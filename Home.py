@@ -2,7 +2,7 @@ import sys
 import os
 import streamlit as st
 import config
-from persistencia import auth, database, logger
+from persistencia import auth, bootstrap
 
 def validar_configuracoes():
     """
@@ -59,20 +59,11 @@ sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
 st.set_page_config(page_title="Painel de Controle", layout="wide")
 
-if 'logger_setup' not in st.session_state:
-    logger.setup_loggers()
-    st.session_state.logger_setup = True
-
-if 'db_initialized' not in st.session_state and config.DATABASE_ENABLED:
-    if config.INITIALIZE_DATABASE_ON_STARTUP:
-        try:
-            database.DatabaseManager.initialize_database()
-            st.session_state.db_initialized = True
-        except Exception as e:
-            st.error(f"Falha crítica na inicialização do banco de dados: {e}")
-            st.stop()
-    else:
-        st.session_state.db_initialized = True
+try:
+    bootstrap.AppInitializer.ensure_initialized()
+except Exception as e:
+    st.error(f"Falha crítica na inicialização do banco de dados: {e}")
+    st.stop()
 
 if 'user_info' not in st.session_state:
     st.session_state.user_info = None
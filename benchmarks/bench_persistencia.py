@@ -0,0 +1,256 @@
+import argparse
+import json
+import logging
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import pandas as pd
+import sqlalchemy
+
+from benchmarks.synthetic_db import (create_database, use_database, vegetal_name, seeded_tipo,
+                                     BENCH_USER, BENCH_PASSWORD, TIPOS_COUNT)
+from persistencia.auth import verify_user_credentials
+from persistencia.cache import query_cache
+from persistencia.data_service import DataService
+from persistencia.repository import GenericRepository
+
+BENCH_DIR = Path(__file__).parent.resolve()
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+RESULTS_DIR = BENCH_DIR / "results"
+TIPOS_NOMES = ['Raízes e Tubérculos', 'Folhas', 'Flores e Inflorescências', 'Frutos', 'Legumes']
+
+def summarize(samples_ms: list) -> dict:
+    ordered = sorted(samples_ms)
+    return {
+        'amostras': len(ordered),
+        'mediana_ms': statistics.median(ordered),
+        'media_ms': statistics.fmean(ordered),
+        'min_ms': ordered[0],
+        'max_ms': ordered[-1],
+        'p95_ms': ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))],
+        'desvio_ms': statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+    }
+
+class PersistenciaBenchmark:
+    """
+    Mede as operações de persistência num banco SQLite temporário ('warmup' rodadas descartadas, 'repeat' medidas).
+    O cache de queries fica desligado, salvo use_cache=True; THROUGHPUT_CASES também reportam linhas/s.
+    """
+
+    THROUGHPUT_CASES = ('auditoria',)
+    AUDIT_INSERT_SQL = sqlalchemy.text(
+        "INSERT INTO log_alteracoes (timestamp, login_usuario, acao) VALUES (:ts, :login, :acao)")
+
+    def __init__(self, rows: int, log_rows: int, repeat: int = 10, warmup: int = 1, write_batch: int = 1000,
+                 use_cache: bool = False):
+        if rows < 2 * (repeat + warmup):
+            raise ValueError(f"São necessárias ao menos {2 * (repeat + warmup)} linhas em 'vegetais'.")
+        if log_rows < repeat + warmup:
+            raise ValueError(f"São necessárias ao menos {repeat + warmup} linhas em 'log_alteracoes'.")
+        self.rows = rows
+        self.log_rows = log_rows
+        self.repeat = repeat
+        self.warmup = warmup
+        self.write_batch = write_batch
+        self.use_cache = use_cache
+
+    def _log_batch(self, iteration: int) -> pd.DataFrame:
+        now = datetime.now()
+        return pd.DataFrame({
+            'timestamp': [now] * self.write_batch,
+            'login_usuario': [BENCH_USER] * self.write_batch,
+            'acao': [f"Benchmark {iteration}-{index}" for index in range(self.write_batch)],
+        })
+
+    def _reclassificar(self, iteration: int):
+        index = iteration + 1
+        novo_tipo = TIPOS_NOMES[seeded_tipo(index) % TIPOS_COUNT]
+        ok, message = DataService.reclassificar_vegetal_e_logar(vegetal_name(index), novo_tipo, BENCH_USER)
+        if not ok:
+            raise RuntimeError(f"reclassificar_vegetal_e_logar falhou: {message}")
+
+    def _reclassificar_em_lote(self, iteration: int):
+        offset = self.repeat + self.warmup
+        pares = []
+        for position in range(self.write_batch):
+            index = offset + (iteration * self.write_batch + position) % (self.rows - offset) + 1
+            novo_tipo = TIPOS_NOMES[(seeded_tipo(index) + iteration % (TIPOS_COUNT - 1)) % TIPOS_COUNT]
+            pares.append((vegetal_name(index), novo_tipo))
+        resultados = DataService.reclassificar_vegetais_em_lote(pares, BENCH_USER)
+        if not any(item['sucesso'] for item in resultados):
+            raise RuntimeError(f"reclassificar_vegetais_em_lote falhou: {resultados[0]['mensagem']}")
+
+    def _auditar(self, iteration: int):
+        engine = GenericRepository.get_engine()
+        for index in range(self.write_batch):
+            with engine.begin() as connection:
+                connection.execute(self.AUDIT_INSERT_SQL, {'ts': datetime.now(), 'login': BENCH_USER,
+                                                           'acao': f"Auditoria {iteration}-{index}"})
+
+    def _verify_credentials(self, iteration: int):
+        if not isinstance(verify_user_credentials(BENCH_USER, BENCH_PASSWORD), dict):
+            raise RuntimeError("verify_user_credentials não autenticou o usuário de benchmark.")
+
+    def cases(self) -> list:
+        """Operações medidas: (nome, função que recebe o número da iteração)."""
+        return [
+            ('read_table_to_dataframe', lambda i: GenericRepository.read_table_to_dataframe('vegetais')),
+            ('read_table_to_dataframe_filtrado', lambda i: GenericRepository.read_table_to_dataframe(
+                'log_alteracoes', where_conditions={'login_usuario': BENCH_USER})),
+            ('read_vegetais_com_tipo', lambda i: GenericRepository.read_vegetais_com_tipo()),
+            ('write_dataframe_to_table', lambda i: GenericRepository.write_dataframe_to_table(
+                self._log_batch(i), 'log_alteracoes')),
+            ('write_dataframe_to_table_bulk', lambda i: GenericRepository.write_dataframe_to_table(
+                self._log_batch(i), 'log_alteracoes', bulk=True)),
+            ('update_table', lambda i: GenericRepository.update_table(
+                'vegetais', {'id_tipo': (i % TIPOS_COUNT) + 1}, {'id': self.rows - i})),
+            ('delete_from_table', lambda i: GenericRepository.delete_from_table('log_alteracoes', {'id': i + 1})),
+            ('reclassificar_vegetal_e_logar', self._reclassificar),
+            ('reclassificar_vegetais_em_lote', self._reclassificar_em_lote),
+            ('auditoria', self._auditar),
+            ('verify_user_credentials', self._verify_credentials),
+        ]
+
+    def run(self, db_path: Path, only: list = None) -> dict:
+        create_database(db_path, self.rows, self.log_rows)
+        results = {}
+        with use_database(db_path):
+            cache_enabled = query_cache.enabled
+            query_cache.enabled = self.use_cache
+            try:
+                for name, case in self.cases():
+                    if only and name not in only:
+                        continue
+                    for iteration in range(self.warmup):
+                        case(iteration)
+                    samples = []
+                    for iteration in range(self.warmup, self.warmup + self.repeat):
+                        start = time.perf_counter()
+                        case(iteration)
+                        samples.append((time.perf_counter() - start) * 1000)
+                    results[name] = summarize(samples)
+                    throughput = ''
+                    if name in self.THROUGHPUT_CASES:
+                        results[name]['linhas_por_s'] = self.write_batch * 1000 / results[name]['mediana_ms']
+                        throughput = f"   {results[name]['linhas_por_s']:10.0f} linhas/s"
+                    print(f"  {name:<36} mediana {results[name]['mediana_ms']:10.2f} ms   "
+                          f"p95 {results[name]['p95_ms']:10.2f} ms{throughput}")
+            finally:
+                query_cache.enabled = cache_enabled
+        return results
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Compara as medianas com a linha de base (mesmo tamanho de carga). Retorna uma linha por
+    operação com o status 'regressao' (acima de 1 + tolerance), 'melhora' ou 'ok'.
+    """
+    rows = []
+    for size, cases in results.get('resultados', {}).items():
+        baseline_cases = baseline.get('resultados', {}).get(size, {})
+        for name, stats in cases.items():
+            reference = baseline_cases.get(name)
+            if reference is None:
+                rows.append({'linhas': size, 'operacao': name, 'base_ms': None,
+                             'atual_ms': stats['mediana_ms'], 'razao': None, 'status': 'sem_base'})
+                continue
+            ratio = stats['mediana_ms'] / reference['mediana_ms'] if reference['mediana_ms'] else float('inf')
+            if ratio > 1 + tolerance:
+                status = 'regressao'
+            elif ratio < 1 - tolerance:
+                status = 'melhora'
+            else:
+                status = 'ok'
+            rows.append({'linhas': size, 'operacao': name, 'base_ms': reference['mediana_ms'],
+                         'atual_ms': stats['mediana_ms'], 'razao': ratio, 'status': status})
+    return rows
+
+def print_comparison(rows: list, tolerance: float):
+    print(f"\nComparação com a linha de base (tolerância de {tolerance:.0%} na mediana):")
+    for row in rows:
+        if row['razao'] is None:
+            print(f"  [{row['linhas']:>8}] {row['operacao']:<36} {'-':>10}    {row['atual_ms']:10.2f} ms   sem base")
+        else:
+            print(f"  [{row['linhas']:>8}] {row['operacao']:<36} {row['base_ms']:10.2f} -> {row['atual_ms']:10.2f} ms"
+                  f"   x{row['razao']:.2f}  {row['status']}")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmarks do GenericRepository e do DataService sobre um SQLite temporário com dados sintéticos.")
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000],
+                        help="Tamanhos de 'vegetais' a medir (ex.: 10000 100000 1000000).")
+    parser.add_argument('--log-rows', type=int, default=None,
+                        help="Linhas em 'log_alteracoes' (padrão: o mesmo valor de --rows).")
+    parser.add_argument('--repeat', type=int, default=10, help="Execuções medidas por operação.")
+    parser.add_argument('--warmup', type=int, default=1, help="Execuções de aquecimento (não medidas).")
+    parser.add_argument('--write-batch', type=int, default=1000, help="Linhas por chamada de escrita.")
+    parser.add_argument('--only', nargs='+', default=None, help="Mede apenas as operações informadas.")
+    parser.add_argument('--cache', action='store_true', help="Mantém o cache de queries ligado durante as leituras.")
+    parser.add_argument('--output', type=Path, default=None,
+                        help="Arquivo JSON de resultados (padrão: benchmarks/results/bench_<data>.json).")
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE, help="Linha de base para comparação.")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="Aumento relativo da mediana tolerado antes de acusar regressão (0.25 = 25%%).")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="Grava os resultados como nova linha de base em --baseline.")
+    return parser.parse_args(argv)
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    logging.getLogger().setLevel(logging.WARNING)
+
+    report = {
+        'meta': {
+            'data': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'plataforma': platform.platform(),
+            'sqlalchemy': sqlalchemy.__version__,
+            'pandas': pd.__version__,
+            'repeat': args.repeat,
+            'warmup': args.warmup,
+            'write_batch': args.write_batch,
+            'cache': args.cache,
+        },
+        'resultados': {},
+    }
+    with tempfile.TemporaryDirectory(prefix="nexlify_bench_") as temp_dir:
+        for rows in args.rows:
+            log_rows = args.log_rows if args.log_rows is not None else rows
+            print(f"\n{rows} vegetais / {log_rows} registros de auditoria:")
+            benchmark = PersistenciaBenchmark(rows, log_rows, repeat=args.repeat, warmup=args.warmup,
+                                              write_batch=args.write_batch, use_cache=args.cache)
+            report['resultados'][str(rows)] = benchmark.run(Path(temp_dir) / f"bench_{rows}.db", only=args.only)
+
+    output = args.output or RESULTS_DIR / f"bench_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding='utf-8')
+    print(f"\nResultados gravados em '{output}'.")
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding='utf-8')
+        print(f"Linha de base atualizada em '{args.baseline}'.")
+        return 0
+
+    if not args.baseline.is_file():
+        print(f"Linha de base '{args.baseline}' não encontrada; use --save-baseline para criá-la.")
+        return 0
+
+    rows = compare(report, json.loads(args.baseline.read_text(encoding='utf-8')), args.tolerance)
+    print_comparison(rows, args.tolerance)
+    regressions = [row for row in rows if row['status'] == 'regressao']
+    if regressions:
+        print(f"\n{len(regressions)} regressão(ões) acima da tolerância.")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,333 @@
+import argparse
+import json
+import logging
+import platform
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import streamlit
+from sqlalchemy import event
+from streamlit import config as st_config
+from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+from streamlit.runtime.media_file_manager import MediaFileManager
+from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+from streamlit.runtime.pages_manager import PagesManager
+from streamlit.runtime.runtime import Runtime
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1 import app_test as app_test_module
+
+import config
+from benchmarks.synthetic_db import (create_database, use_database, vegetal_name, seeded_tipo,
+                                     BENCH_USER, BENCH_PASSWORD, TIPOS_COUNT)
+from persistencia.repository import GenericRepository
+
+HOME_SCRIPT = PROJECT_ROOT / "Home.py"
+PAGES_DIR = PROJECT_ROOT / "pages"
+RESULTS_DIR = Path(__file__).parent.resolve() / "results"
+GATOS_PAGE = "3_🐱_Gatos_CRUD.py"
+VEGETAIS_PAGE = "4_🌿_Vegetais_e_Auditoria.py"
+TIPOS_NOMES = ['Raízes e Tubérculos', 'Folhas', 'Flores e Inflorescências', 'Frutos', 'Legumes']
+LOCK_MARKERS = ('database is locked', 'database table is locked', 'deadlock', 'lock wait timeout')
+
+def percentile(ordered: list, fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+def is_lock_error(message: str) -> bool:
+    message = str(message).lower()
+    return any(marker in message for marker in LOCK_MARKERS)
+
+@contextmanager
+def shared_apptest_runtime(main_script: Path = HOME_SCRIPT):
+    """
+    Faz as instâncias de AppTest do bloco compartilharem um Runtime simulado e um ScriptCache, permitindo
+    rodá-las em threads simultâneas (o AppTest descarta o Runtime ao fim de cada run()).
+    """
+    runtime = MagicMock(spec=Runtime)
+    runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+    runtime.cache_storage_manager = MemoryCacheStorageManager()
+    script_cache = ScriptCache()
+    shadow_runtime = type('AppTestRuntime', (Runtime,), {})
+    saved_instance = Runtime._instance
+    saved_app_test = st_config.get_option("global.appTest")
+    saved_pages_directory = PagesManager.uses_pages_directory
+    Runtime._instance = runtime
+    PagesManager.uses_pages_directory = (Path(main_script).parent / "pages").exists()
+    st_config.set_option("global.appTest", True)
+    try:
+        with patch.object(app_test_module, 'Runtime', shadow_runtime), \
+                patch.object(app_test_module, 'ScriptCache', lambda: script_cache), \
+                patch.object(app_test_module, 'patch_config_options', lambda options: nullcontext()):
+            yield runtime
+    finally:
+        Runtime._instance = saved_instance
+        PagesManager.uses_pages_directory = saved_pages_directory
+        st_config.set_option("global.appTest", saved_app_test)
+
+class LoadStats:
+    """Coleta, de forma thread-safe, a latência de cada rerun e os erros observados."""
+
+    def __init__(self, expected_errors: dict = None):
+        self._lock = threading.Lock()
+        self.expected_errors = expected_errors or {}
+        self.latencies = []
+        self.by_step = {}
+        self.exceptions = 0
+        self.ui_errors = 0
+        self.lock_errors = 0
+        self.failures = []
+
+    def add_run(self, step: str, elapsed_ms: float, exceptions: list, errors: list):
+        """Registra um rerun; mensagens de st.error que a página sempre exibe (expected_errors) são ignoradas."""
+        errors = [message for message in errors if message not in self.expected_errors.get(step, ())]
+        with self._lock:
+            self.latencies.append(elapsed_ms)
+            self.by_step.setdefault(step, []).append(elapsed_ms)
+            self.exceptions += len(exceptions)
+            self.ui_errors += len(errors)
+            for message in exceptions + errors:
+                if len(self.failures) < 20:
+                    self.failures.append(f"{step}: {str(message)[:200]}")
+
+    def add_failure(self, step: str, message: str):
+        with self._lock:
+            self.exceptions += 1
+            if len(self.failures) < 20:
+                self.failures.append(f"{step}: {message[:200]}")
+
+    def add_lock_error(self):
+        with self._lock:
+            self.lock_errors += 1
+
+class LoadSession:
+    """
+    Um usuário simulado: faz login pelo Home.py, navega pelas páginas e executa ações de CRUD,
+    cada página em sua própria instância de AppTest.
+    """
+
+    def __init__(self, index: int, stats: LoadStats, pages: list, timeout: float):
+        self.index = index
+        self.stats = stats
+        self.pages = pages
+        self.timeout = timeout
+        self.user_info = None
+
+    def _run(self, app_test: AppTest, step: str) -> AppTest:
+        start = time.perf_counter()
+        app_test.run(timeout=self.timeout)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.stats.add_run(step, elapsed_ms, [element.value for element in app_test.exception],
+                           [element.value for element in app_test.error])
+        return app_test
+
+    def _page(self, page_file: str) -> AppTest:
+        app_test = AppTest.from_file(str(PAGES_DIR / page_file), default_timeout=self.timeout)
+        app_test.session_state.user_info = self.user_info
+        return app_test
+
+    def login(self):
+        app_test = self._run(AppTest.from_file(str(HOME_SCRIPT), default_timeout=self.timeout), 'login')
+        if config.USE_LOGIN:
+            app_test.text_input(key='username_input_dialog').input(BENCH_USER)
+            app_test.text_input(key='password_input_dialog').input(BENCH_PASSWORD)
+            next(button for button in app_test.button if button.label == 'Entrar').click()
+            self._run(app_test, 'login')
+        self.user_info = app_test.session_state['user_info'] if 'user_info' in app_test.session_state else None
+        if not self.user_info:
+            raise RuntimeError(f"Sessão {self.index}: login do usuário de benchmark falhou.")
+
+    def browse(self):
+        for page_file in self.pages:
+            self._run(self._page(page_file), Path(page_file).stem)
+
+    def crud_gatos(self, iteration: int):
+        nome = f"Carga {self.index}-{iteration}"
+        app_test = self._run(self._page(GATOS_PAGE), 'gatos_crud')
+        next(button for button in app_test.button if button.label.startswith('➕')).click()
+        self._run(app_test, 'gatos_crud')
+        app_test.text_input[0].input(nome)
+        app_test.text_input[1].input('Brasil')
+        app_test.text_area[0].input('Teste de carga')
+        next(button for button in app_test.button if button.label == 'Salvar').click()
+        self._run(app_test, 'gatos_crud')
+
+        df = GenericRepository.read_table_to_dataframe('especie_gatos', columns=['id'],
+                                                       where_conditions={'nome_especie': nome})
+        if df.empty:
+            self.stats.add_failure('gatos_crud', f"espécie '{nome}' não foi cadastrada")
+            return
+        key = f"del_{int(df.iloc[0]['id'])}"
+        if key not in {button.key for button in app_test.button}:
+            self.stats.add_failure('gatos_crud', f"botão de exclusão '{key}' não encontrado")
+            return
+        app_test.button(key=key).click()
+        self._run(app_test, 'gatos_crud')
+
+    def reclassificar(self, vegetal_index: int):
+        app_test = self._run(self._page(VEGETAIS_PAGE), 'reclassificacao')
+        selecao = f"{vegetal_name(vegetal_index)} (ID: {vegetal_index})"
+        novo_tipo = TIPOS_NOMES[seeded_tipo(vegetal_index) % TIPOS_COUNT]
+        next(box for box in app_test.selectbox if box.label.startswith('1.')).select(selecao)
+        next(box for box in app_test.selectbox if box.label.startswith('2.')).select(novo_tipo)
+        self._run(app_test, 'reclassificacao')
+        next(button for button in app_test.button if button.label == 'Executar').click()
+        self._run(app_test, 'reclassificacao')
+
+        df = GenericRepository.read_table_to_dataframe('vegetais', columns=['id_tipo'],
+                                                       where_conditions={'id': vegetal_index})
+        if df.empty or GenericRepository.reference_name('tipos_vegetais', int(df.iloc[0]['id_tipo'])) != novo_tipo:
+            self.stats.add_failure('reclassificacao', f"vegetal '{selecao}' não foi reclassificado para '{novo_tipo}'")
+
+    def run(self, iterations: int, crud: bool):
+        try:
+            self.login()
+            for iteration in range(iterations):
+                self.browse()
+                if crud:
+                    self.crud_gatos(iteration)
+                    self.reclassificar(self.index * iterations + iteration + 1)
+        except Exception as e:
+            self.stats.add_failure('sessao', f"{type(e).__name__}: {e}")
+
+class LoadTest:
+    """
+    Executa LoadSession em 'sessions' threads simultâneas contra um banco SQLite sintético novo
+    para cada nível de concorrência e resume vazão, latência dos reruns e erros de bloqueio.
+    """
+
+    def __init__(self, rows: int = 2000, iterations: int = 2, crud: bool = True, pages: list = None,
+                 timeout: float = 120.0):
+        self.rows = rows
+        self.iterations = iterations
+        self.crud = crud
+        self.pages = pages or sorted(path.name for path in PAGES_DIR.glob('*.py'))
+        self.timeout = timeout
+
+    def _warm_up(self) -> dict:
+        """
+        Roda cada página uma vez, em série e fora da medição, e devolve as mensagens de st.error
+        que ela exibe mesmo sem carga (ex.: exemplos de componentes), para não contá-las como erros.
+        """
+        user_info = {'username': BENCH_USER, 'name': 'Usuário de Benchmark', 'access_level': 'Administrador Global'}
+        expected = {}
+        for page_file in self.pages:
+            app_test = AppTest.from_file(str(PAGES_DIR / page_file), default_timeout=self.timeout)
+            app_test.session_state.user_info = user_info
+            app_test.run()
+            expected[Path(page_file).stem] = {element.value for element in app_test.error}
+        return expected
+
+    def run_level(self, sessions: int, db_path: Path) -> dict:
+        if self.crud and self.rows < sessions * self.iterations:
+            raise ValueError(f"São necessárias ao menos {sessions * self.iterations} linhas em 'vegetais'.")
+        create_database(db_path, self.rows, self.rows)
+
+        def count_lock_errors(context):
+            if is_lock_error(context.original_exception):
+                stats.add_lock_error()
+
+        with use_database(db_path) as engine:
+            stats = LoadStats(self._warm_up())
+            event.listen(engine, "handle_error", count_lock_errors)
+            workers = [LoadSession(index, stats, self.pages, self.timeout) for index in range(sessions)]
+            threads = [threading.Thread(target=worker.run, args=(self.iterations, self.crud),
+                                        name=f"carga-{index}") for index, worker in enumerate(workers)]
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - start
+
+        ordered = sorted(stats.latencies)
+        return {
+            'sessoes': sessions,
+            'reruns': len(ordered),
+            'duracao_s': elapsed,
+            'reruns_por_s': len(ordered) / elapsed if elapsed else 0.0,
+            'p50_ms': percentile(ordered, 0.50),
+            'p95_ms': percentile(ordered, 0.95),
+            'p99_ms': percentile(ordered, 0.99),
+            'max_ms': ordered[-1] if ordered else 0.0,
+            'bloqueios_banco': stats.lock_errors,
+            'erros_ui': stats.ui_errors,
+            'excecoes': stats.exceptions,
+            'por_etapa': {step: {'reruns': len(values), 'p50_ms': percentile(sorted(values), 0.50),
+                                 'p95_ms': percentile(sorted(values), 0.95)}
+                          for step, values in sorted(stats.by_step.items())},
+            'falhas': stats.failures,
+        }
+
+    def run(self, levels: list) -> list:
+        results = []
+        with tempfile.TemporaryDirectory(prefix="nexlify_load_") as temp_dir, shared_apptest_runtime():
+            for sessions in levels:
+                result = self.run_level(sessions, Path(temp_dir) / f"load_{sessions}.db")
+                results.append(result)
+                print(f"  {sessions:>4} sessões | {result['reruns']:>6} reruns | {result['reruns_por_s']:8.1f} reruns/s | "
+                      f"p50 {result['p50_ms']:8.1f} ms | p95 {result['p95_ms']:8.1f} ms | p99 {result['p99_ms']:8.1f} ms | "
+                      f"bloqueios {result['bloqueios_banco']:>4} | erros {result['erros_ui'] + result['excecoes']:>4}")
+        return results
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Teste de carga multi-sessão do Home.py e das páginas com streamlit.testing.v1.AppTest.")
+    parser.add_argument('--sessions', type=int, nargs='+', default=[1, 2, 4, 8, 16],
+                        help="Níveis de sessões simultâneas (uma thread por sessão).")
+    parser.add_argument('--iterations', type=int, default=2,
+                        help="Rodadas de navegação + CRUD por sessão, após o login.")
+    parser.add_argument('--rows', type=int, default=2000,
+                        help="Linhas sintéticas em 'vegetais' e 'log_alteracoes' em cada nível.")
+    parser.add_argument('--pages', nargs='+', default=None,
+                        help="Arquivos de pages/ a navegar (padrão: todos).")
+    parser.add_argument('--no-crud', action='store_true', help="Apenas login e navegação, sem escritas.")
+    parser.add_argument('--timeout', type=float, default=120.0, help="Tempo máximo de cada rerun, em segundos.")
+    parser.add_argument('--output', type=Path, default=None,
+                        help="Arquivo JSON de resultados (padrão: benchmarks/results/carga_<data>.json).")
+    return parser.parse_args(argv)
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    load_test = LoadTest(rows=args.rows, iterations=args.iterations, crud=not args.no_crud, pages=args.pages,
+                         timeout=args.timeout)
+    print(f"Teste de carga: {len(load_test.pages)} páginas, {args.iterations} rodada(s) por sessão, "
+          f"CRUD {'desligado' if args.no_crud else 'ligado'}.")
+    logging.disable(logging.WARNING)
+    try:
+        levels = load_test.run(args.sessions)
+    finally:
+        logging.disable(logging.NOTSET)
+
+    report = {
+        'meta': {
+            'data': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'plataforma': platform.platform(),
+            'streamlit': streamlit.__version__,
+            'rows': args.rows,
+            'iterations': args.iterations,
+            'crud': not args.no_crud,
+            'paginas': load_test.pages,
+        },
+        'niveis': levels,
+    }
+    output = args.output or RESULTS_DIR / f"carga_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding='utf-8')
+    print(f"\nResultados gravados em '{output}'.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+import random
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from sqlalchemy import create_engine, event
+
+import config
+from persistencia.auth import hash_password
+from persistencia.cache import query_cache
+from persistencia.reference_index import reference_index
+from persistencia.database import DatabaseManager, SQLITE_PROFILE_DEFAULTS, _remember_spec, _sqlite_pragma_listener
+from persistencia.query_metrics import QueryMetrics
+from persistencia.schema import SchemaRegistry
+
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+SCHEMA_PATH = PROJECT_ROOT / "persistencia" / "sql_schema_SQLLite.sql"
+
+BENCH_USER = 'bench.user'
+BENCH_PASSWORD = 'bench123'
+TIPOS_COUNT = 5
+
+def vegetal_name(index: int) -> str:
+    return f"Vegetal {index:07d}"
+
+def seeded_tipo(index: int) -> int:
+    """Tipo atribuído ao vegetal 'index' pela carga sintética (determinístico)."""
+    return index % TIPOS_COUNT + 1
+
+def create_database(db_path: Path, vegetais_rows: int = 10000, log_rows: int = 10000, seed: int = 42) -> Path:
+    """
+    Cria um banco SQLite com o schema do projeto, vegetais_rows vegetais, log_rows registros de auditoria
+    e o usuário BENCH_USER.
+    """
+    db_path = Path(db_path)
+    if db_path.exists():
+        db_path.unlink()
+    rng = random.Random(seed)
+    logins = [BENCH_USER, 'admin', 'gerente.ti', 'carla.analista', 'bruno.operador']
+    start = datetime(2024, 1, 1)
+
+    connection = sqlite3.connect(db_path)
+    try:
+        connection.executescript(SCHEMA_PATH.read_text(encoding='utf-8'))
+        connection.execute("DELETE FROM vegetais")
+        connection.execute("DELETE FROM sqlite_sequence WHERE name = 'vegetais'")
+        connection.execute(
+            "INSERT INTO usuarios (login_usuario, senha_criptografada, nome_completo, tipo_acesso) VALUES (?, ?, ?, ?)",
+            (BENCH_USER, hash_password(BENCH_PASSWORD), 'Usuário de Benchmark', 'Administrador Global'))
+        connection.executemany(
+            "INSERT INTO vegetais (id, nome, id_tipo) VALUES (?, ?, ?)",
+            ((index, vegetal_name(index), seeded_tipo(index)) for index in range(1, vegetais_rows + 1)))
+        connection.executemany(
+            "INSERT INTO log_alteracoes (id, timestamp, login_usuario, acao) VALUES (?, ?, ?, ?)",
+            ((index, (start + timedelta(seconds=index)).isoformat(sep=' '), rng.choice(logins),
+              f"Alteração sintética {index} no vegetal {vegetal_name(rng.randint(1, max(vegetais_rows, 1)))}")
+             for index in range(1, log_rows + 1)))
+        connection.commit()
+        connection.execute("ANALYZE")
+    finally:
+        connection.close()
+    return db_path
+
+@contextmanager
+def use_database(db_path: Path, profile: dict = None):
+    """
+    Aponta o DatabaseManager para o arquivo SQLite durante o bloco, sem ler banco.ini nem secret.key,
+    e restaura o estado anterior ao sair.
+    """
+    db_path = Path(db_path).resolve()
+    profile = dict(SQLITE_PROFILE_DEFAULTS, **(profile or {}))
+    saved = (config.DATABASE_ENABLED, DatabaseManager._engine, DatabaseManager._read_engine,
+             DatabaseManager._sqlite_settings, DatabaseManager._replica_engines)
+
+    connect_args = {'timeout': profile['busy_timeout'] / 1000, 'check_same_thread': False}
+    engine = create_engine(f"sqlite:///{db_path}", echo=False, connect_args=connect_args)
+    event.listen(engine, "connect", _sqlite_pragma_listener(profile))
+    _remember_spec(engine, engine.url, {'connect_args': connect_args}, profile)
+    DatabaseManager._register_pool_listeners(engine)
+    QueryMetrics.install(engine)
+
+    config.DATABASE_ENABLED = True
+    DatabaseManager._engine = engine
+    DatabaseManager._read_engine = None
+    DatabaseManager._sqlite_settings = (db_path, profile)
+    DatabaseManager._replica_engines = []
+    SchemaRegistry.reset()
+    query_cache.clear()
+    reference_index.clear()
+    try:
+        yield engine
+    finally:
+        if DatabaseManager._read_engine is not None:
+            DatabaseManager._read_engine.dispose()
+        engine.dispose()
+        (config.DATABASE_ENABLED, DatabaseManager._engine, DatabaseManager._read_engine,
+         DatabaseManager._sqlite_settings, DatabaseManager._replica_engines) = saved
+        SchemaRegistry.reset()
+        query_cache.clear()
+        reference_index.clear()
@@ -0,0 +1,70 @@
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+import config
+from persistencia.bootstrap import AppInitializer
+from persistencia.database import DatabaseManager
+from persistencia.repository import GenericRepository
+from persistencia.query_metrics import QueryMetrics
+from utils.perf_telemetry import PerfTelemetry
+from components.desempenho_view import DesempenhoView
+
+class DesempenhoController:
+    QUERY_COLUMNS = ['sql', 'execucoes', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms', 'media_ms', 'total_ms',
+                     'linhas', 'origens']
+
+    def __init__(self):
+        self.view = DesempenhoView(self)
+        self._initialize_state()
+
+    def _initialize_state(self):
+        if "desempenho_index_report" not in st.session_state:
+            st.session_state.desempenho_index_report = None
+
+    def run(self):
+        self.view.render()
+
+    def get_query_stats(self) -> pd.DataFrame:
+        """Latência por statement (QueryMetrics), da maior para a menor latência total."""
+        rows = QueryMetrics.snapshot()
+        for row in rows:
+            row['origens'] = ', '.join(f"{caller} ({count})" for caller, count in row['origens'].items())
+        return pd.DataFrame(rows, columns=self.QUERY_COLUMNS)
+
+    def get_histogram(self, sql: str) -> pd.DataFrame:
+        """Histograma de latência de um statement, em faixas de milissegundos."""
+        for row in QueryMetrics.snapshot():
+            if row['sql'] == sql:
+                return pd.DataFrame({'execucoes': list(row['histograma'].values())},
+                                    index=list(row['histograma'].keys()))
+        return pd.DataFrame(columns=['execucoes'])
+
+    def get_pool_status(self) -> dict:
+        if not config.DATABASE_ENABLED:
+            return {}
+        return DatabaseManager.pool_status()
+
+    def get_cache_stats(self) -> dict:
+        return GenericRepository.cache_stats()
+
+    def get_sessions(self) -> pd.DataFrame:
+        rows = PerfTelemetry.active_sessions()
+        for row in rows:
+            row['ultimo_acesso'] = datetime.fromtimestamp(row['ultimo_acesso']).strftime('%H:%M:%S')
+        return pd.DataFrame(rows, columns=['sessao', 'usuario', 'pagina', 'ultimo_acesso'])
+
+    def get_render_stats(self) -> pd.DataFrame:
+        return pd.DataFrame(PerfTelemetry.render_stats(),
+                            columns=['pagina', 'renderizacoes', 'p50_ms', 'p95_ms', 'max_ms', 'media_ms'])
+
+    def get_initialization_status(self) -> dict:
+        return AppInitializer.status()
+
+    def run_index_report(self):
+        st.session_state.desempenho_index_report = GenericRepository.index_report()
+
+    def reset_metrics(self):
+        QueryMetrics.reset()
+        PerfTelemetry.reset()
+        st.session_state.desempenho_index_report = None
+        st.toast("Métricas de desempenho zeradas.")
@@ -0,0 +1,113 @@
+import streamlit as st
+
+class DesempenhoView:
+    def __init__(self, controller):
+        self.controller = controller
+
+    def render(self):
+        """Renderiza o painel de desempenho do processo."""
+        st.title("📈 Desempenho")
+        st.markdown("Telemetria deste processo desde a última inicialização (ou desde que as métricas foram zeradas).")
+
+        col1, col2, _ = st.columns([1, 1, 4])
+        col1.button("🔄 Atualizar", width='stretch')
+        col2.button("🧹 Zerar métricas", on_click=self.controller.reset_metrics, width='stretch')
+
+        self._render_summary()
+        st.divider()
+        self._render_queries()
+        st.divider()
+
+        col_sessions, col_renders = st.columns(2)
+        with col_sessions:
+            self._render_sessions()
+        with col_renders:
+            self._render_renders()
+
+        st.divider()
+        self._render_pool()
+        st.divider()
+        self._render_index_report()
+        st.divider()
+        self._render_initialization()
+
+    def _render_summary(self):
+        pool = self.controller.get_pool_status()
+        cache = self.controller.get_cache_stats()
+        sessions = self.controller.get_sessions()
+
+        cols = st.columns(5)
+        cols[0].metric("Sessões ativas", len(sessions))
+        cols[1].metric("Acerto do cache", f"{cache['hit_ratio']:.1%}",
+                       help=f"{cache['hits']} acertos / {cache['misses']} falhas")
+        cols[2].metric("Entradas no cache", f"{cache['entries']} / {cache['max_entries']}")
+        cols[3].metric("Checkouts do pool", pool.get('checkouts', 0))
+        cols[4].metric("Overflow do pool", pool.get('overflow', '-'),
+                       help="Conexões abertas além do pool_size (negativo quando há folga no pool).")
+
+    def _render_queries(self):
+        st.subheader("Latência por Query")
+        df_queries = self.controller.get_query_stats()
+        if df_queries.empty:
+            st.info("Nenhuma query registrada ainda.")
+            return
+
+        st.dataframe(df_queries, hide_index=True, width='stretch', column_config={
+            'sql': st.column_config.TextColumn("SQL", width='large'),
+            'p50_ms': st.column_config.NumberColumn("p50 (ms)", format="%.1f"),
+            'p95_ms': st.column_config.NumberColumn("p95 (ms)", format="%.1f"),
+            'p99_ms': st.column_config.NumberColumn("p99 (ms)", format="%.1f"),
+            'max_ms': st.column_config.NumberColumn("máx (ms)", format="%.1f"),
+            'media_ms': st.column_config.NumberColumn("média (ms)", format="%.1f"),
+            'total_ms': st.column_config.NumberColumn("total (ms)", format="%.0f"),
+        })
+
+        sql = st.selectbox("Histograma da query", df_queries['sql'].tolist(), index=0)
+        st.bar_chart(self.controller.get_histogram(sql))
+
+    def _render_sessions(self):
+        st.subheader("Sessões Ativas")
+        df_sessions = self.controller.get_sessions()
+        if df_sessions.empty:
+            st.info("Nenhuma sessão ativa.")
+        else:
+            st.dataframe(df_sessions, hide_index=True, width='stretch')
+
+    def _render_renders(self):
+        st.subheader("Renderização por Página")
+        df_renders = self.controller.get_render_stats()
+        if df_renders.empty:
+            st.info("Nenhuma página renderizada ainda.")
+        else:
+            st.dataframe(df_renders, hide_index=True, width='stretch', column_config={
+                column: st.column_config.NumberColumn(format="%.1f")
+                for column in ('p50_ms', 'p95_ms', 'max_ms', 'media_ms')
+            })
+
+    def _render_pool(self):
+        st.subheader("Pool de Conexões e Cache")
+        col1, col2 = st.columns(2)
+        with col1:
+            pool = self.controller.get_pool_status()
+            if pool:
+                st.json(pool)
+            else:
+                st.info("Banco de dados desabilitado ou ainda não conectado.")
+        with col2:
+            st.json(self.controller.get_cache_stats())
+
+    def _render_index_report(self):
+        st.subheader("Assistente de Índices")
+        st.button("🔎 Analisar queries registradas", on_click=self.controller.run_index_report)
+        report = st.session_state.desempenho_index_report
+        if report is None:
+            return
+        if report.empty:
+            st.success("Nenhuma varredura completa de tabela nas queries registradas.")
+        else:
+            st.dataframe(report, hide_index=True, width='stretch')
+
+    def _render_initialization(self):
+        status = self.controller.get_initialization_status()
+        with st.expander(f"Inicialização do processo: {status['estado']}"):
+            st.json(status)
@@ -5,6 +5,8 @@ from persistencia.repository import GenericRepository
 from components.gatos_view import GatosView
 
 class GatosController:
+    PAGE_SIZE = 50
+
     def __init__(self):
         self.view = GatosView(self)
         self._initialize_state()
@@ -14,6 +16,8 @@ class GatosController:
             st.session_state.show_form = False
         if "editing_item" not in st.session_state:  
             st.session_state.editing_item = None  
+        if "gatos_cursor_stack" not in st.session_state:
+            st.session_state.gatos_cursor_stack = [None]
 
     def run(self):
         if not config.DATABASE_ENABLED:
@@ -68,12 +72,22 @@ class GatosController:
         except Exception as e:
             st.error(f"Erro ao excluir: {e}")
 
-    def get_all_gatos(self):
+    def get_gatos_page(self):
+        """Retorna a página atual de espécies e o cursor da próxima página."""
         try:
-                                              
-            df = GenericRepository.read_table_to_dataframe('especie_gatos')
-
-            return df   
+            cursor = st.session_state.gatos_cursor_stack[-1]
+            return GenericRepository.read_table_page('especie_gatos', page_size=self.PAGE_SIZE, cursor=cursor,
+                                                     columns=self.view.COLUMNS)
         except Exception as e:
             st.error(f"Não foi possível carregar as espécies. Detalhe: {e}")
-            return pd.DataFrame()
\ No newline at end of file
+            return pd.DataFrame(), None
+
+    def next_page(self, cursor):
+        st.session_state.gatos_cursor_stack.append(cursor)
+
+    def previous_page(self):
+        if len(st.session_state.gatos_cursor_stack) > 1:
+            st.session_state.gatos_cursor_stack.pop()
+
+    def has_previous_page(self):
+        return len(st.session_state.gatos_cursor_stack) > 1
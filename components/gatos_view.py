@@ -1,6 +1,8 @@
 import streamlit as st
 
 class GatosView:
+    COLUMNS = ['id', 'nome_especie', 'pais_origem', 'temperamento']
+
     def __init__(self, controller):
         self.controller = controller
 
@@ -18,8 +20,8 @@ class GatosView:
         self._render_table()
 
     def _render_table(self):
-        df_gatos = self.controller.get_all_gatos()
-        if df_gatos.empty and not st.session_state.show_form:
+        df_gatos, next_cursor = self.controller.get_gatos_page()
+        if df_gatos.empty and not st.session_state.show_form and not self.controller.has_previous_page():
             st.info("Nenhuma espécie cadastrada. Clique em 'Adicionar' para começar.")
             return
 
@@ -42,6 +44,15 @@ class GatosView:
             popover.button("Confirmar Exclusão", key=f"del_{row_data['id']}", on_click=self.controller.delete_item,
                            args=(row_data,))
 
+        self._render_pagination(next_cursor)
+
+    def _render_pagination(self, next_cursor):
+        nav_cols = st.columns([1, 1, 4])
+        nav_cols[0].button("⬅️ Anterior", key="gatos_prev_page", on_click=self.controller.previous_page,
+                           disabled=not self.controller.has_previous_page(), width='stretch')
+        nav_cols[1].button("Próxima ➡️", key="gatos_next_page", on_click=self.controller.next_page,
+                           args=(next_cursor,), disabled=next_cursor is None, width='stretch')
+
     def _render_form(self):
         is_edit_mode = st.session_state.editing_item is not None
         title = "✏️ Editando Espécie" if is_edit_mode else "➕ Adicionar Nova Espécie"
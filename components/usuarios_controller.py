@@ -6,6 +6,8 @@ from persistencia.auth import hash_password
 from components.usuarios_view import UsuariosView
 
 class UsuariosController:
+    PAGE_SIZE = 50
+
     def __init__(self):
         self.view = UsuariosView(self)
         self._initialize_state()
@@ -15,6 +17,8 @@ class UsuariosController:
             st.session_state.show_user_form = False
         if "editing_user_item" not in st.session_state:
             st.session_state.editing_user_item = None
+        if "usuarios_cursor_stack" not in st.session_state:
+            st.session_state.usuarios_cursor_stack = [None]
 
     def run(self):
         if not config.DATABASE_ENABLED:
@@ -94,13 +98,22 @@ class UsuariosController:
         except Exception as e:
             st.error(f"Erro ao excluir: {e}")
 
-    def get_all_users(self):
+    def get_users_page(self):
+        """Retorna a página atual de usuários (sem a senha) e o cursor da próxima página."""
         try:
-                                                    
-            df = GenericRepository.read_table_to_dataframe("usuarios")
-            if 'senha_criptografada' in df.columns:
-                df = df.drop(columns=['senha_criptografada'])
-            return df
+            cursor = st.session_state.usuarios_cursor_stack[-1]
+            return GenericRepository.read_table_page("usuarios", page_size=self.PAGE_SIZE, cursor=cursor,
+                                                     columns=self.view.COLUMNS)
         except Exception as e:
             st.error(f"Não foi possível carregar os usuários. Detalhe: {e}")
-            return pd.DataFrame()
\ No newline at end of file
+            return pd.DataFrame(), None
+
+    def next_page(self, cursor):
+        st.session_state.usuarios_cursor_stack.append(cursor)
+
+    def previous_page(self):
+        if len(st.session_state.usuarios_cursor_stack) > 1:
+            st.session_state.usuarios_cursor_stack.pop()
+
+    def has_previous_page(self):
+        return len(st.session_state.usuarios_cursor_stack) > 1
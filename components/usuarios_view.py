@@ -11,6 +11,8 @@ PERFIS_DE_ACESSO = [
 ]
 
 class UsuariosView:
+    COLUMNS = ['login_usuario', 'nome_completo', 'tipo_acesso']
+
     def __init__(self, controller):
         self.controller = controller
 
@@ -31,8 +33,8 @@ class UsuariosView:
         """Renderiza a tabela de usuários."""
         st.subheader("Usuários Cadastrados")
 
-        df_users = self.controller.get_all_users()
-        if df_users.empty and not st.session_state.show_user_form:
+        df_users, next_cursor = self.controller.get_users_page()
+        if df_users.empty and not st.session_state.show_user_form and not self.controller.has_previous_page():
             st.info("Nenhum usuário cadastrado. Clique em 'Adicionar' para começar.")
             return
 
@@ -58,6 +60,16 @@ class UsuariosView:
             popover.button("Confirmar", key=f"del_{row_data['login_usuario']}",
                            on_click=self.controller.delete_item, args=(row_data,))
 
+        self._render_pagination(next_cursor)
+
+    def _render_pagination(self, next_cursor):
+        """Renderiza os botões de navegação entre páginas."""
+        nav_cols = st.columns([1, 1, 4])
+        nav_cols[0].button("⬅️ Anterior", key="usuarios_prev_page", on_click=self.controller.previous_page,
+                           disabled=not self.controller.has_previous_page(), width='stretch')
+        nav_cols[1].button("Próxima ➡️", key="usuarios_next_page", on_click=self.controller.next_page,
+                           args=(next_cursor,), disabled=next_cursor is None, width='stretch')
+
     def _render_form(self):
         """Renderiza o formulário de adição/edição."""
         is_edit_mode = st.session_state.editing_user_item is not None
@@ -6,6 +6,8 @@ from persistencia.data_service import DataService
 from components.vegetais_auditoria_view import VegetaisAuditoriaView
 
 class VegetaisAuditoriaController:
+    PAGE_SIZE = 50
+
     def __init__(self):
         self.view = VegetaisAuditoriaView(self)
         self._initialize_state()
@@ -16,6 +18,10 @@ class VegetaisAuditoriaController:
             st.session_state.veg_show_tipo_form = False  
         if "veg_editing_tipo_item" not in st.session_state:  
             st.session_state.veg_editing_tipo_item = None  
+        if "veg_cursor_stack" not in st.session_state:
+            st.session_state.veg_cursor_stack = [None]
+        if "veg_log_cursor_stack" not in st.session_state:
+            st.session_state.veg_log_cursor_stack = [None]
 
     def run(self):
         """Renderiza a view principal."""
@@ -47,12 +53,10 @@ class VegetaisAuditoriaController:
 
         try:
                                             
-            df_tipo = GenericRepository.read_table_to_dataframe("tipos_vegetais", where_conditions={'nome': tipo_nome})  
-            if df_tipo.empty:
+            id_tipo = GenericRepository.reference_id("tipos_vegetais", tipo_nome)
+            if id_tipo is None:
                 st.error(f"O tipo '{tipo_nome}' não foi encontrado.")
                 return
-
-            id_tipo = int(df_tipo.iloc[0]['id'])  
                                             
             data = {'nome': nome, 'id_tipo': id_tipo}  
 
@@ -116,16 +120,47 @@ class VegetaisAuditoriaController:
             st.error(mensagem)
 
     def get_all_tipos(self):
-        return GenericRepository.read_table_to_dataframe("tipos_vegetais")
+        return GenericRepository.read_table_to_dataframe("tipos_vegetais", columns=self.view.TIPO_COLUMNS)
+
+    def get_vegetal_options(self):
+        """Retorna id e nome de todos os vegetais, em ordem de nome, para a seleção da reclassificação."""
+        try:
+            return (GenericRepository.table("vegetais").select(*self.view.VEGETAL_OPTION_COLUMNS)
+                    .order_by('nome').to_pandas())
+        except Exception as e:
+            st.error(f"Não foi possível carregar os vegetais. Detalhe: {e}")
+            return pd.DataFrame(columns=self.view.VEGETAL_OPTION_COLUMNS)
 
-    def get_all_vegetais(self):
-        return GenericRepository.read_vegetais_com_tipo()
+    def get_vegetais_page(self):
+        """Retorna a página atual de vegetais (pyarrow.Table, por nome) e o cursor da próxima página."""
+        try:
+            cursor = st.session_state.veg_cursor_stack[-1]
+            return GenericRepository.read_vegetais_com_tipo_page(page_size=self.PAGE_SIZE, cursor=cursor)
+        except Exception as e:
+            st.error(f"Não foi possível carregar os vegetais. Detalhe: {e}")
+            return None, None
 
-    def get_all_logs(self):  
-        df = GenericRepository.read_table_to_dataframe("log_alteracoes")
+    def get_logs_page(self):
+        """Retorna a página atual do log de auditoria (mais recentes primeiro) e o cursor da próxima página."""
+        try:
+            cursor = st.session_state.veg_log_cursor_stack[-1]
+            df, next_cursor = GenericRepository.read_table_page("log_alteracoes", page_size=self.PAGE_SIZE,
+                                                                cursor=cursor, columns=self.view.LOG_COLUMNS,
+                                                                descending=True)
+        except Exception as e:
+            st.error(f"Não foi possível carregar o log de auditoria. Detalhe: {e}")
+            return pd.DataFrame(), None
         if not df.empty and 'timestamp' in df.columns:
             df['timestamp'] = pd.to_datetime(df['timestamp'])
-            df = df.sort_values(by='timestamp', ascending=False)
-                                               
             df['timestamp'] = df['timestamp'].dt.strftime('%d/%m/%Y %H:%M:%S')
-        return df
\ No newline at end of file
+        return df, next_cursor
+
+    def next_page(self, stack_key, cursor):
+        st.session_state[stack_key].append(cursor)
+
+    def previous_page(self, stack_key):
+        if len(st.session_state[stack_key]) > 1:
+            st.session_state[stack_key].pop()
+
+    def has_previous_page(self, stack_key):
+        return len(st.session_state[stack_key]) > 1
@@ -2,6 +2,10 @@
 import streamlit as st
 
 class VegetaisAuditoriaView:
+    TIPO_COLUMNS = ['id', 'nome']
+    VEGETAL_OPTION_COLUMNS = ['id', 'nome']
+    LOG_COLUMNS = ['id', 'timestamp', 'login_usuario', 'acao']
+
     def __init__(self, controller):
         self.controller = controller
 
@@ -9,6 +13,7 @@ class VegetaisAuditoriaView:
         """Renderiza a página inteira de Vegetais e Auditoria."""
         st.title("🌿 Vegetais e Auditoria")
 
+        tabela_vegetais, next_cursor = self.controller.get_vegetais_page()
         self._render_transaction_section()
         if st.session_state.veg_show_tipo_form:
             self._render_tipo_form()
@@ -17,7 +22,7 @@ class VegetaisAuditoriaView:
 
         col1, col2 = st.columns([3, 2])
         with col1:
-            self._render_vegetais_table()
+            self._render_vegetais_table(tabela_vegetais, next_cursor)
         with col2:
             self._render_log_table()
 
@@ -26,10 +31,11 @@ class VegetaisAuditoriaView:
         with st.container(border=True):
             st.subheader("🔄 Operação Atômica (Transação)")
 
-            df_vegetais = self.controller.get_all_vegetais()
             df_tipos = self.controller.get_all_tipos()
+            df_vegetais = self.controller.get_vegetal_options()
 
-            vegetais_list = [f"{row['nome']} (ID: {row['id']})" for _, row in df_vegetais.iterrows()]
+            vegetais_list = [f"{nome} (ID: {vegetal_id})"
+                             for vegetal_id, nome in zip(df_vegetais['id'], df_vegetais['nome'])]
             tipos_list = df_tipos['nome'].tolist()
 
             col1, col2, col3 = st.columns([2, 2, 1])
@@ -89,16 +95,24 @@ class VegetaisAuditoriaView:
                 if cancelled:
                     self.controller.close_tipo_form()
 
-    def _render_vegetais_table(self):
-        """Renderiza a tabela principal de vegetais."""
+    def _render_vegetais_table(self, tabela_vegetais, next_cursor):
+        """Renderiza a tabela principal de vegetais, uma página por vez."""
         st.subheader("🍽️ Tabela 'VEGETAIS'")
-        df_vegetais = self.controller.get_all_vegetais()
-                                
-        st.dataframe(df_vegetais, width='stretch', hide_index=True)
+        if tabela_vegetais is not None:
+            st.dataframe(tabela_vegetais, width='stretch', hide_index=True)
+        self._render_pagination("veg_cursor_stack", next_cursor)
 
     def _render_log_table(self):
-        """Renderiza a tabela de logs de auditoria."""
+        """Renderiza a tabela de logs de auditoria, uma página por vez (mais recentes primeiro)."""
         st.subheader("🛡️ Tabela 'LOG_ALTERACOES'")
-        df_logs = self.controller.get_all_logs()
-                                
-        st.dataframe(df_logs, width='stretch', hide_index=True)
\ No newline at end of file
+        df_logs, next_cursor = self.controller.get_logs_page()
+        st.dataframe(df_logs, width='stretch', hide_index=True)
+        self._render_pagination("veg_log_cursor_stack", next_cursor)
+
+    def _render_pagination(self, stack_key, next_cursor):
+        nav_cols = st.columns(2)
+        nav_cols[0].button("⬅️ Anterior", key=f"{stack_key}_prev", on_click=self.controller.previous_page,
+                           args=(stack_key,), disabled=not self.controller.has_previous_page(stack_key),
+                           width='stretch')
+        nav_cols[1].button("Próxima ➡️", key=f"{stack_key}_next", on_click=self.controller.next_page,
+                           args=(stack_key, next_cursor), disabled=next_cursor is None, width='stretch')
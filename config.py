@@ -47,12 +47,43 @@ def _get_string_setting(key, default=""):
     except (configparser.Error, ValueError):
         return default
 
+def _get_int_setting(key, default=0):
+    try:
+        return _parser.getint('Settings', key, fallback=default)
+    except (configparser.Error, ValueError):
+        return default
+
+def _get_float_setting(key, default=0.0):
+    try:
+        return _parser.getfloat('Settings', key, fallback=default)
+    except (configparser.Error, ValueError):
+        return default
+
 DATABASE_ENABLED = _get_boolean_setting('database_enabled', default=True)
 INITIALIZE_DATABASE_ON_STARTUP = _get_boolean_setting('initialize_database_on_startup', default=True)
 USE_LOGIN = _get_boolean_setting('use_login', default=True)
 REDIRECT_CONSOLE_TO_LOG = _get_boolean_setting('redirect_console_to_log', default=False)
 ENABLE_THEME_MENU = _get_boolean_setting('enable_theme_menu', default=True)
 
+QUERY_CACHE_ENABLED = _get_boolean_setting('query_cache_enabled', default=True)
+QUERY_CACHE_MAX_ENTRIES = _get_int_setting('query_cache_max_entries', default=256)
+QUERY_CACHE_TTL_SECONDS = _get_float_setting('query_cache_ttl_seconds', default=60.0)
+
+REPLICA_STICKY_SECONDS = _get_float_setting('replica_sticky_seconds', default=5.0)
+REPLICA_RETRY_SECONDS = _get_float_setting('replica_retry_seconds', default=30.0)
+
+BULK_INSERT_CHUNK_SIZE = _get_int_setting('bulk_insert_chunk_size', default=1000)
+
+INDEX_ADVISOR_ENABLED = _get_boolean_setting('index_advisor_enabled', default=True)
+INDEX_ADVISOR_MAX_STATEMENTS = _get_int_setting('index_advisor_max_statements', default=200)
+
+QUERY_METRICS_ENABLED = _get_boolean_setting('query_metrics_enabled', default=True)
+SLOW_QUERY_THRESHOLD_MS = _get_float_setting('slow_query_threshold_ms', default=500.0)
+SLOW_QUERY_LOG_PATH = Path(__file__).parent / _get_string_setting('slow_query_log_path', default="logs/slow_queries.log")
+
+WARMUP_ON_STARTUP = _get_boolean_setting('warmup_on_startup', default=False)
+WARMUP_CONNECTIONS = _get_int_setting('warmup_connections', default=2)
+
 MAX_LOGIN_ATTEMPTS = 3
 
 LOG_LEVEL_STR = _get_string_setting('log_level', default="INFO").upper()
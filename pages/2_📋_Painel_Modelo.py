@@ -6,6 +6,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from utils.st_utils import st_check_session, check_access
+from utils.perf_telemetry import PerfTelemetry
 from components.painel_modelo_controller import PainelModeloController
 
 st.set_page_config(page_title="Painel Modelo", layout="wide")
@@ -13,4 +14,5 @@ st_check_session()
 check_access([])
 
 controller = PainelModeloController()
-controller.run()
\ No newline at end of file
+with PerfTelemetry.measure_render("Painel Modelo"):
+    controller.run()
\ No newline at end of file
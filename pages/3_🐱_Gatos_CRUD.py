@@ -3,6 +3,7 @@ import sys
 import os
 
 from utils.st_utils import st_check_session, check_access
+from utils.perf_telemetry import PerfTelemetry
 from components.gatos_controller import GatosController   
 
 st.set_page_config(page_title="Gerenciador de Gatos", layout="wide")
@@ -10,4 +11,5 @@ st_check_session()
 check_access([])
 
 controller = GatosController()
-controller.run()
\ No newline at end of file
+with PerfTelemetry.measure_render("Gerenciador de Gatos"):
+    controller.run()
\ No newline at end of file
@@ -1,6 +1,7 @@
                                    
 import streamlit as st
 from utils.st_utils import st_check_session, check_access
+from utils.perf_telemetry import PerfTelemetry
 from components.vegetais_auditoria_controller import VegetaisAuditoriaController
 
 st.set_page_config(page_title="Vegetais e Auditoria", layout="wide")
@@ -8,4 +9,5 @@ st_check_session()
 check_access(['Administrador Global', 'Diretor de Operações', 'Gerente de TI', 'Analista de Dados'])
 
 controller = VegetaisAuditoriaController()
-controller.run()
\ No newline at end of file
+with PerfTelemetry.measure_render("Vegetais e Auditoria"):
+    controller.run()
\ No newline at end of file
@@ -3,6 +3,7 @@ import sys
 import os
 
 from utils.st_utils import st_check_session, check_access
+from utils.perf_telemetry import PerfTelemetry
 from components.usuarios_controller import UsuariosController
 
 st.set_page_config(page_title="Gestão de Usuários", layout="wide")
@@ -12,4 +13,5 @@ st_check_session()
 check_access(['Administrador Global', 'Gerente de TI'])
 
 controller = UsuariosController()
-controller.run()
\ No newline at end of file
+with PerfTelemetry.measure_render("Gestão de Usuários"):
+    controller.run()
\ No newline at end of file
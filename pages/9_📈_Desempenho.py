@@ -0,0 +1,12 @@
+import streamlit as st
+from utils.st_utils import st_check_session, check_access
+from utils.perf_telemetry import PerfTelemetry
+from components.desempenho_controller import DesempenhoController
+
+st.set_page_config(page_title="Desempenho", layout="wide")
+st_check_session()
+check_access(['Administrador Global', 'Gerente de TI'])
+
+controller = DesempenhoController()
+with PerfTelemetry.measure_render("Desempenho"):
+    controller.run()
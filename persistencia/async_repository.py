@@ -0,0 +1,270 @@
+import asyncio
+import atexit
+import importlib.util
+import logging
+import threading
+import weakref
+import pandas as pd
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import config
+from .database import DatabaseManager, _session_key, _session_override, _sqlite_pragma_listener
+from .cache import query_cache, QueryCache, normalize_sql, tables_in_query
+from .query_metrics import QueryMetrics
+from .repository import GenericRepository
+from .schema import SchemaRegistry
+
+class AsyncDatabaseManager:
+    """
+    AsyncEngines equivalentes às engines do DatabaseManager (primário, réplicas, pool de leitura),
+    uma por loop de eventos; None quando o dialeto não tem driver assíncrono instalado.
+    """
+
+    ASYNC_DRIVERS = {
+        'sqlite': ('sqlite+aiosqlite', 'aiosqlite'),
+        'postgresql': ('postgresql+asyncpg', 'asyncpg'),
+        'mysql': ('mysql+aiomysql', 'aiomysql'),
+        'mariadb': ('mariadb+asyncmy', 'asyncmy'),
+        'oracle': ('oracle+oracledb_async', 'oracledb'),
+    }
+
+    _engines = weakref.WeakKeyDictionary()
+    _loop = None
+    _loop_thread = None
+    _loop_lock = threading.Lock()
+    _atexit_registered = False
+
+    @classmethod
+    def async_driver_name(cls):
+        """Retorna o driver assíncrono disponível para o banco ativo, ou None."""
+        sync_engine = DatabaseManager.get_engine()
+        if sync_engine is None:
+            return None
+        driver = cls.ASYNC_DRIVERS.get(sync_engine.dialect.name)
+        if driver is None or importlib.util.find_spec(driver[1]) is None:
+            return None
+        return driver[0]
+
+    @classmethod
+    def get_engine(cls):
+        """AsyncEngine do primário no loop atual, ou None sem driver assíncrono."""
+        return cls.engine_for(DatabaseManager.get_engine())
+
+    @classmethod
+    def engine_for(cls, sync_engine):
+        """
+        AsyncEngine do loop atual equivalente a 'sync_engine', com a mesma URL, opções de pool e
+        PRAGMAs. Se o primário foi trocado, as AsyncEngines do loop são descartadas e recriadas.
+        """
+        driver_name = cls.async_driver_name()
+        if driver_name is None or sync_engine is None:
+            return None
+        loop = asyncio.get_running_loop()
+        primary = DatabaseManager.get_engine()
+        source, engines = cls._engines.get(loop, (None, {}))
+        if source is not primary:
+            for stale in engines.values():
+                loop.create_task(stale.dispose())
+            engines = {}
+            cls._engines[loop] = (primary, engines)
+        engine = engines.get(sync_engine)
+        if engine is None:
+            spec = DatabaseManager.engine_spec(sync_engine)
+            engine = create_async_engine(spec['url'].set(drivername=driver_name), echo=False, **spec['options'])
+            if spec['sqlite_profile'] is not None:
+                event.listen(engine.sync_engine, "connect",
+                             _sqlite_pragma_listener(spec['sqlite_profile'], read_only=spec['read_only']))
+            QueryMetrics.install(engine.sync_engine)
+            engines[sync_engine] = engine
+            logging.info(f"Engine assíncrona criada com o driver '{driver_name}' para "
+                         f"'{sync_engine.url.render_as_string(hide_password=True)}'.")
+        return engine
+
+    @classmethod
+    async def dispose(cls):
+        """Fecha as conexões das engines do loop atual (chamar antes de encerrar o loop)."""
+        _, engines = cls._engines.pop(asyncio.get_running_loop(), (None, {}))
+        for engine in engines.values():
+            await engine.dispose()
+
+    @classmethod
+    def background_loop(cls):
+        """Retorna o loop de fundo (thread daemon), criando-o na primeira chamada."""
+        with cls._loop_lock:
+            if cls._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="async-repository-loop", daemon=True)
+                thread.start()
+                cls._loop, cls._loop_thread = loop, thread
+                if not cls._atexit_registered:
+                    atexit.register(cls.shutdown)
+                    cls._atexit_registered = True
+            return cls._loop
+
+    @classmethod
+    def shutdown(cls, timeout: float = 10.0):
+        """Fecha a engine do loop de fundo e encerra o loop; a próxima chamada cria outro."""
+        with cls._loop_lock:
+            loop, thread = cls._loop, cls._loop_thread
+            cls._loop = cls._loop_thread = None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(cls.dispose(), loop).result(timeout)
+        except Exception as e:
+            logging.error(f"Erro ao fechar a engine assíncrona do loop de fundo: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+
+class AsyncGenericRepository:
+    """
+    Versões assíncronas das operações do GenericRepository, com o mesmo cache e as mesmas regras de invalidação.
+    Use gather() para rodar várias consultas ao mesmo tempo.
+    """
+
+    @staticmethod
+    def gather(*coroutines, timeout: float = None):
+        """
+        Executa as corrotinas concorrentemente no loop de fundo e retorna seus resultados,
+        bloqueando até o fim. As corrotinas contam como a sessão de quem chamou (read-your-writes).
+        """
+        loop = AsyncDatabaseManager.background_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            raise RuntimeError("gather() não pode ser chamado de dentro do loop de fundo; use await asyncio.gather.")
+        session = _session_key()
+
+        async def _gather():
+            _session_override.set(session)
+            return await asyncio.gather(*coroutines)
+
+        return asyncio.run_coroutine_threadsafe(_gather(), loop).result(timeout)
+
+    @staticmethod
+    async def execute_query_to_dataframe(query, params: dict = None, use_cache: bool = True):
+        """Versão assíncrona de GenericRepository.execute_query_to_dataframe."""
+        if not config.DATABASE_ENABLED:
+            logging.warning("Banco de dados desabilitado. A query não será executada.")
+            return pd.DataFrame()
+
+        engine = AsyncDatabaseManager.get_engine()
+        if engine is None:
+            return await asyncio.to_thread(GenericRepository.execute_query_to_dataframe, query, params, use_cache)
+
+        statement, query = GenericRepository._as_statement(query)
+        is_read = normalize_sql(query).lower().startswith(('select', 'with'))
+        cache_key = None
+        if use_cache and query_cache.enabled and is_read:
+            cache_key = QueryCache.make_key(query, params)
+            cached = query_cache.get(cache_key)
+            if cached is not None:
+                return cached.copy()
+            versions = query_cache.versions_for(tables_in_query(query))
+
+        try:
+            if is_read:
+                source = DatabaseManager.get_read_engine()
+                df = await AsyncGenericRepository._run_read(source, statement, params)
+            else:
+                source = None
+                df = await AsyncGenericRepository._read(engine, statement, params)
+        except exc.SQLAlchemyError as e:
+            logging.error(f"Erro ao executar a query assíncrona: {query}\nErro: {e}")
+            raise
+        if cache_key is not None and not DatabaseManager.is_replica(source):
+            query_cache.put(cache_key, df.copy(), versions)
+        return df
+
+    @staticmethod
+    async def _read(engine, statement, params):
+        async with engine.connect() as connection:
+            result = await connection.execute(statement, params or {})
+            return pd.DataFrame(result.fetchall(), columns=[str(col).lower() for col in result.keys()])
+
+    @staticmethod
+    async def _run_read(source, statement, params):
+        """Lê pela equivalente assíncrona da engine de leitura 'source'; se ela falhar, repete uma vez no primário."""
+        try:
+            return await AsyncGenericRepository._read(AsyncDatabaseManager.engine_for(source), statement, params)
+        except exc.OperationalError as e:
+            if not DatabaseManager.report_read_failure(source):
+                raise
+            logging.warning(f"Leitura assíncrona falhou na engine de leitura; repetindo no primário. Erro: {e}")
+        return await AsyncGenericRepository._read(AsyncDatabaseManager.get_engine(), statement, params)
+
+    @staticmethod
+    async def read_table_to_dataframe(table_name: str, columns: list = None, where_conditions=None):
+        """Versão assíncrona de GenericRepository.read_table_to_dataframe."""
+        if not config.DATABASE_ENABLED:
+            return pd.DataFrame()
+        statement, params = GenericRepository._select_with_params(table_name, columns, where_conditions)
+        return await AsyncGenericRepository.execute_query_to_dataframe(statement, params=params or None)
+
+    @staticmethod
+    async def read_vegetais_com_tipo():
+        """Versão assíncrona de GenericRepository.read_vegetais_com_tipo."""
+        if not config.DATABASE_ENABLED:
+            return pd.DataFrame()
+        statement, params = GenericRepository.vegetais_com_tipo_query().statement()
+        return await AsyncGenericRepository.execute_query_to_dataframe(statement, params=params or None)
+
+    @staticmethod
+    async def _execute_write(table_name: str, statement, params, action: str):
+        engine = AsyncDatabaseManager.get_engine()
+        try:
+            async with engine.begin() as connection:
+                await connection.execute(statement, params)
+            GenericRepository.register_write(table_name)
+        except exc.SQLAlchemyError as e:
+            logging.error(f"Erro ao {action} a tabela '{table_name}' (assíncrono): {e}")
+            raise
+
+    @staticmethod
+    async def write_dataframe_to_table(df: pd.DataFrame, table_name: str):
+        """Versão assíncrona de GenericRepository.write_dataframe_to_table."""
+        if not config.DATABASE_ENABLED:
+            logging.warning(f"Banco de dados desabilitado. Nenhum dado será escrito em '{table_name}'.")
+            return
+        if AsyncDatabaseManager.get_engine() is None:
+            return await asyncio.to_thread(GenericRepository.write_dataframe_to_table, df, table_name)
+
+        records = GenericRepository._dataframe_to_records(df)
+        if not records:
+            return
+        statement = SchemaRegistry.insert_statement(table_name, records[0].keys())
+        await AsyncGenericRepository._execute_write(table_name, statement, records, "escrever em")
+        logging.info(f"{len(records)} registros inseridos com sucesso na tabela '{table_name}'.")
+
+    @staticmethod
+    async def update_table(table_name: str, update_values: dict, where_conditions):
+        """Versão assíncrona de GenericRepository.update_table."""
+        GenericRepository._require_where(table_name, where_conditions, 'Update')
+        if not config.DATABASE_ENABLED:
+            logging.warning(f"Banco de dados desabilitado. Nenhum dado será atualizado em '{table_name}'.")
+            return
+        if AsyncDatabaseManager.get_engine() is None:
+            return await asyncio.to_thread(GenericRepository.update_table, table_name, update_values, where_conditions)
+
+        statement, params = GenericRepository._update_with_params(table_name, update_values, where_conditions)
+        await AsyncGenericRepository._execute_write(table_name, statement, params, "atualizar")
+        logging.info(f"Tabela '{table_name}' atualizada com sucesso.")
+
+    @staticmethod
+    async def delete_from_table(table_name: str, where_conditions):
+        """Versão assíncrona de GenericRepository.delete_from_table."""
+        GenericRepository._require_where(table_name, where_conditions, 'Delete')
+        if not config.DATABASE_ENABLED:
+            logging.warning(f"Banco de dados desabilitado. Nenhum dado será deletado de '{table_name}'.")
+            return
+        if AsyncDatabaseManager.get_engine() is None:
+            return await asyncio.to_thread(GenericRepository.delete_from_table, table_name, where_conditions)
+
+        statement, params = GenericRepository._delete_with_params(table_name, where_conditions)
+        await AsyncGenericRepository._execute_write(table_name, statement, params, "deletar de")
+        logging.info(f"Registros da tabela '{table_name}' deletados com sucesso.")
@@ -0,0 +1,97 @@
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+
+import config
+from . import logger
+from .database import DatabaseManager
+from .schema import SchemaRegistry
+from .repository import GenericRepository
+
+class AppInitializer:
+    """
+    Inicialização única por processo: loggers, migrações, reflexão do schema e pré-aquecimento opcional.
+    Etapas que falharem são tentadas de novo na próxima chamada de ensure_initialized().
+    """
+
+    _lock = threading.Lock()
+    _done = False
+    _status = {
+        'estado': 'pendente',
+        'pid': os.getpid(),
+        'tentativas': 0,
+        'iniciado_em': None,
+        'concluido_em': None,
+        'duracao_ms': None,
+        'etapas': {},
+        'migracoes_aplicadas': [],
+        'erro': None,
+    }
+
+    @classmethod
+    def _steps(cls) -> list:
+        steps = [('loggers', cls._setup_loggers)]
+        if config.DATABASE_ENABLED:
+            steps.append(('banco', cls._setup_database))
+        return steps
+
+    @classmethod
+    def _setup_loggers(cls):
+        logger.setup_loggers()
+
+    @classmethod
+    def _setup_database(cls):
+        if config.INITIALIZE_DATABASE_ON_STARTUP:
+            applied = DatabaseManager.initialize_database()
+            cls._status['migracoes_aplicadas'] = applied
+            if applied:
+                SchemaRegistry.reset()
+        SchemaRegistry.reflect()
+        if config.WARMUP_ON_STARTUP:
+            GenericRepository.warm_up(config.WARMUP_CONNECTIONS)
+
+    @classmethod
+    def ensure_initialized(cls) -> dict:
+        """Garante a inicialização do processo e retorna o seu status; relança o erro da etapa que falhar."""
+        if cls._done:
+            return cls._status
+        with cls._lock:
+            if cls._done:
+                return cls._status
+            status = cls._status
+            status['estado'] = 'em_andamento'
+            status['tentativas'] += 1
+            status['erro'] = None
+            if status['iniciado_em'] is None:
+                status['iniciado_em'] = datetime.now().isoformat(timespec='seconds')
+            start = time.perf_counter()
+            for name, step in cls._steps():
+                if status['etapas'].get(name, {}).get('status') == 'concluida':
+                    continue
+                step_start = time.perf_counter()
+                try:
+                    step()
+                except Exception as e:
+                    status['etapas'][name] = {'status': 'falhou', 'erro': str(e),
+                                              'duracao_ms': (time.perf_counter() - step_start) * 1000}
+                    status['estado'] = 'falhou'
+                    status['erro'] = f"{name}: {e}"
+                    logging.error(f"Falha na inicialização do processo (etapa '{name}'): {e}")
+                    raise
+                status['etapas'][name] = {'status': 'concluida',
+                                          'duracao_ms': (time.perf_counter() - step_start) * 1000}
+            status['estado'] = 'concluido'
+            status['concluido_em'] = datetime.now().isoformat(timespec='seconds')
+            status['duracao_ms'] = (time.perf_counter() - start) * 1000
+            cls._done = True
+            logging.info(f"Inicialização do processo {status['pid']} concluída em {status['duracao_ms']:.1f} ms.")
+            return status
+
+    @classmethod
+    def status(cls) -> dict:
+        """Cópia do status da inicialização (estado, etapas, duração, migrações aplicadas, último erro)."""
+        status = dict(cls._status)
+        status['etapas'] = {name: dict(info) for name, info in list(status['etapas'].items())}
+        return status
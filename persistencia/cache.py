@@ -0,0 +1,119 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+
+import config
+
+_TABLE_PATTERN = re.compile(r'\b(?:from|join|into|update)\s+([a-zA-Z_][\w.]*)', re.IGNORECASE)
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+def normalize_sql(query: str) -> str:
+    """Remove espaços redundantes e o ';' final para que queries equivalentes compartilhem a chave."""
+    return _WHITESPACE_PATTERN.sub(' ', query).strip().rstrip(';').strip()
+
+def tables_in_query(query: str) -> frozenset:
+    """Extrai (em minúsculas) as tabelas referenciadas em FROM/JOIN/INTO/UPDATE de uma query."""
+    return frozenset(name.split('.')[-1].lower() for name in _TABLE_PATTERN.findall(query))
+
+class QueryCache:
+    """
+    Cache de resultados de queries do processo, com remoção por LRU e TTL.
+    Cada entrada guarda a versão das tabelas lidas; escritas nessas tabelas a descartam.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 60.0, enabled: bool = True):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self._entries = OrderedDict()
+        self._table_versions = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def make_key(query: str, params: dict = None):
+        normalized_params = tuple(sorted((str(k), repr(v)) for k, v in (params or {}).items()))
+        return normalize_sql(query), normalized_params
+
+    def get(self, key):
+        """Retorna o valor em cache ou None; entradas expiradas ou desatualizadas são descartadas."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            value, tables, created_at = entry
+            expired = self.ttl_seconds and (time.monotonic() - created_at) > self.ttl_seconds
+            stale = any(self._table_versions.get(table, 0) != version for table, version in tables.items())
+            if expired or stale:
+                del self._entries[key]
+                self._evictions += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def versions_for(self, tables) -> dict:
+        """Captura a versão atual das tabelas; deve ser chamada antes de executar a leitura."""
+        with self._lock:
+            return {table: self._table_versions.get(table, 0) for table in tables}
+
+    def put(self, key, value, versions: dict):
+        """Armazena um valor junto com as versões das tabelas capturadas antes da leitura."""
+        if not self.enabled:
+            return
+        with self._lock:
+            if any(self._table_versions.get(table, 0) != version for table, version in versions.items()):
+                return
+            self._entries[key] = (value, dict(versions), time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, *table_names):
+        """Incrementa a versão das tabelas e remove as entradas que dependem delas."""
+        affected = {name.lower() for name in table_names if name}
+        if not affected:
+            return
+        with self._lock:
+            for table in affected:
+                self._table_versions[table] = self._table_versions.get(table, 0) + 1
+            stale_keys = [key for key, (_, tables, _) in self._entries.items() if affected & tables.keys()]
+            for key in stale_keys:
+                del self._entries[key]
+            self._invalidations += len(stale_keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Retorna os contadores de acertos, falhas e remoções do cache."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'enabled': self.enabled,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_ratio': (self._hits / lookups) if lookups else 0.0,
+                'evictions': self._evictions,
+                'invalidations': self._invalidations,
+                'table_versions': dict(self._table_versions),
+            }
+
+query_cache = QueryCache(
+    max_entries=config.QUERY_CACHE_MAX_ENTRIES,
+    ttl_seconds=config.QUERY_CACHE_TTL_SECONDS,
+    enabled=config.QUERY_CACHE_ENABLED,
+)
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import text, exc
+from sqlalchemy import text, exc, bindparam
 from .repository import GenericRepository
 import logging
 
@@ -9,6 +9,8 @@ class DataService:
     Garante a integridade dos dados em operações que envolvem múltiplas tabelas.
     """
 
+    LOOKUP_CHUNK_SIZE = 900
+
     @staticmethod
     def reclassificar_vegetal_e_logar(nome_vegetal: str, novo_tipo_nome: str, usuario: str):
         """
@@ -20,22 +22,17 @@ class DataService:
         with engine.connect() as connection:
             with connection.begin() as transaction:
                 try:
-                                                              
+                    id_novo_tipo = GenericRepository.reference_id('tipos_vegetais', novo_tipo_nome)
                     res_vegetal = connection.execute(
-                        text("SELECT id, id_tipo FROM vegetais WHERE nome = :nome"),
+                        text("SELECT id, id_tipo FROM vegetais WHERE nome = :nome ORDER BY id"),
                         {'nome': nome_vegetal}
                     ).first()
                     if not res_vegetal:
                         return False, f"Vegetal '{nome_vegetal}' não encontrado."
                     id_vegetal, id_tipo_antigo = res_vegetal
 
-                    res_novo_tipo = connection.execute(
-                        text("SELECT id FROM tipos_vegetais WHERE nome = :nome"),
-                        {'nome': novo_tipo_nome}
-                    ).first()
-                    if not res_novo_tipo:
+                    if id_novo_tipo is None:
                         return False, f"Tipo '{novo_tipo_nome}' não encontrado."
-                    id_novo_tipo = res_novo_tipo[0]
 
                     if id_tipo_antigo == id_novo_tipo:
                         return False, "O vegetal já pertence a este tipo."
@@ -57,14 +54,99 @@ class DataService:
                     )
 
                     transaction.commit()
-                    logging.info(f"Transação de reclassificação do vegetal '{nome_vegetal}' concluída com sucesso.")
-                    return True, "Vegetal reclassificado e ação auditada com sucesso!"
 
                 except exc.SQLAlchemyError as e:
                     transaction.rollback()
                     logging.error(f"Falha na transação de reclassificação: {e}")
                     return False, f"Ocorreu um erro no banco de dados: {e}"
 
+        GenericRepository.register_write('vegetais', 'log_alteracoes')
+        logging.info(f"Transação de reclassificação do vegetal '{nome_vegetal}' concluída com sucesso.")
+        return True, "Vegetal reclassificado e ação auditada com sucesso!"
+
+    @staticmethod
+    def _lookup_by_name(connection, sql: str, nomes: list) -> dict:
+        """
+        Executa 'sql' (com o parâmetro expansível :nomes) em blocos e indexa as linhas pelo nome.
+        Para nomes repetidos vale a primeira linha retornada, como no .first() da versão unitária.
+        """
+        statement = text(sql).bindparams(bindparam('nomes', expanding=True))
+        rows = {}
+        for start in range(0, len(nomes), DataService.LOOKUP_CHUNK_SIZE):
+            chunk = nomes[start:start + DataService.LOOKUP_CHUNK_SIZE]
+            for row in connection.execute(statement, {'nomes': chunk}):
+                rows.setdefault(row[0], row[1:])
+        return rows
+
+    @staticmethod
+    def reclassificar_vegetais_em_lote(reclassificacoes: list, usuario: str) -> list:
+        """
+        Versão em lote de reclassificar_vegetal_e_logar, numa única transação com UPDATE e INSERT via executemany.
+        Retorna um dict por par ('vegetal', 'tipo', 'sucesso', 'mensagem'); pares inválidos não impedem os demais.
+        """
+        resultados = [{'vegetal': nome_vegetal, 'tipo': novo_tipo_nome, 'sucesso': False, 'mensagem': None}
+                      for nome_vegetal, novo_tipo_nome in reclassificacoes]
+        if not resultados:
+            return resultados
+
+        engine = GenericRepository.get_engine()
+        with engine.connect() as connection:
+            with connection.begin() as transaction:
+                try:
+                    tipos = {nome: GenericRepository.reference_id('tipos_vegetais', nome)
+                             for nome in {item['tipo'] for item in resultados}}
+                    vegetais = DataService._lookup_by_name(
+                        connection, "SELECT nome, id, id_tipo FROM vegetais WHERE nome IN :nomes ORDER BY id",
+                        list({item['vegetal'] for item in resultados}))
+
+                    agora = datetime.now()
+                    updates, logs, vistos = [], [], set()
+                    for item in resultados:
+                        vegetal = vegetais.get(item['vegetal'])
+                        id_novo_tipo = tipos[item['tipo']]
+                        if vegetal is None:
+                            item['mensagem'] = f"Vegetal '{item['vegetal']}' não encontrado."
+                        elif id_novo_tipo is None:
+                            item['mensagem'] = f"Tipo '{item['tipo']}' não encontrado."
+                        elif item['vegetal'] in vistos:
+                            item['mensagem'] = "O vegetal aparece mais de uma vez no lote."
+                        elif vegetal[1] == id_novo_tipo:
+                            item['mensagem'] = "O vegetal já pertence a este tipo."
+                        else:
+                            id_vegetal = vegetal[0]
+                            updates.append({'id_tipo': id_novo_tipo, 'id_vegetal': id_vegetal})
+                            logs.append({'ts': agora, 'login': usuario,
+                                         'acao': (f"O vegetal '{item['vegetal']}' (ID: {id_vegetal}) foi reclassificado "
+                                                  f"para o tipo '{item['tipo']}' (ID: {id_novo_tipo}).")})
+                            item['sucesso'] = True
+                            item['mensagem'] = "Vegetal reclassificado e ação auditada com sucesso!"
+                            vistos.add(item['vegetal'])
+
+                    if updates:
+                        connection.execute(
+                            text("UPDATE vegetais SET id_tipo = :id_tipo WHERE id = :id_vegetal"), updates)
+                        connection.execute(
+                            text("""
+                                 INSERT INTO log_alteracoes (timestamp, login_usuario, acao)
+                                 VALUES (:ts, :login, :acao)
+                                 """),
+                            logs
+                        )
+                    transaction.commit()
+
+                except exc.SQLAlchemyError as e:
+                    transaction.rollback()
+                    logging.error(f"Falha na transação de reclassificação em lote: {e}")
+                    for item in resultados:
+                        item['sucesso'] = False
+                        item['mensagem'] = f"Ocorreu um erro no banco de dados: {e}"
+                    return resultados
+
+        if updates:
+            GenericRepository.register_write('vegetais', 'log_alteracoes')
+        logging.info(f"Reclassificação em lote concluída: {len(updates)} de {len(resultados)} vegetais reclassificados.")
+        return resultados
+
     @staticmethod
     def rename_especie_gato_e_logar(nome_antigo: str, nome_novo: str, usuario: str):
         """
@@ -97,10 +179,12 @@ class DataService:
                     connection.execute(log_stmt, {'ts': datetime.now(), 'login': usuario, 'acao': acao_log})
 
                     transaction.commit()
-                    logging.info(f"Transação de renomeação da espécie '{nome_antigo}' concluída com sucesso.")
-                    return True, "Espécie renomeada e ação registrada no log com sucesso."
 
                 except exc.SQLAlchemyError as e:
                     transaction.rollback()
                     logging.error(f"Falha na transação de renomeação: {e}")
-                    return False, f"Ocorreu um erro no banco de dados: {e}"
\ No newline at end of file
+                    return False, f"Ocorreu um erro no banco de dados: {e}"
+
+        GenericRepository.register_write('especie_gatos', 'log_alteracoes')
+        logging.info(f"Transação de renomeação da espécie '{nome_antigo}' concluída com sucesso.")
+        return True, "Espécie renomeada e ação registrada no log com sucesso."
\ No newline at end of file
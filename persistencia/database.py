@@ -1,15 +1,38 @@
+import contextvars
+import itertools
 import logging
+import sqlite3
+import threading
+import time
+import weakref
 from pathlib import Path
-from sqlalchemy import create_engine, text, event
-from sqlalchemy.engine import Engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.exc import SQLAlchemyError, OperationalError
 
 import config
 from .security import load_key, decrypt_message
+from .migrator import MigrationRunner
+from .query_metrics import QueryMetrics
 
 project_root = Path(__file__).parent.parent.resolve()
 CONFIG_PATH = project_root / "banco.ini"
-SCHEMA_PATH = project_root / "persistencia/sql_schema_SQLLite.sql"
+
+SQLITE_PROFILE_DEFAULTS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'mmap_size': 268435456,
+    'cache_size': -65536,
+    'temp_store': 'MEMORY',
+    'busy_timeout': 15000,
+    'read_only_pool': True,
+}
+
+_SQLITE_PRAGMA_CHOICES = {
+    'journal_mode': ('DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF'),
+    'synchronous': ('OFF', 'NORMAL', 'FULL', 'EXTRA'),
+    'temp_store': ('DEFAULT', 'FILE', 'MEMORY'),
+}
 
 def _set_sqlite_pragma(dbapi_connection, connection_record):
     """Executa o PRAGMA para ativar o suporte a chaves estrangeiras no SQLite."""
@@ -17,122 +40,450 @@ def _set_sqlite_pragma(dbapi_connection, connection_record):
     cursor.execute("PRAGMA foreign_keys=ON")
     cursor.close()
 
+def _sqlite_profile(db_config: dict) -> dict:
+    """Lê o perfil de desempenho do SQLite do bloco ativo do banco.ini, validando cada valor."""
+    profile = dict(SQLITE_PROFILE_DEFAULTS)
+    for key in profile:
+        if key not in db_config:
+            continue
+        value = db_config[key].strip()
+        if key in _SQLITE_PRAGMA_CHOICES:
+            if value.upper() not in _SQLITE_PRAGMA_CHOICES[key]:
+                raise ValueError(f"Valor inválido para '{key}' no 'banco.ini': {value!r}")
+            profile[key] = value.upper()
+        elif key == 'read_only_pool':
+            profile[key] = value.lower() in ('1', 'true', 'yes', 'on')
+        else:
+            try:
+                profile[key] = int(value)
+            except ValueError as e:
+                raise ValueError(f"Valor inválido para '{key}' no 'banco.ini': {value!r}") from e
+    return profile
+
+def _sqlite_pragma_listener(profile: dict, read_only: bool = False):
+    """Cria o listener de 'connect' que aplica o perfil de PRAGMAs em cada nova conexão."""
+    pragmas = ['foreign_keys=ON', f"busy_timeout={profile['busy_timeout']}",
+               f"synchronous={profile['synchronous']}", f"mmap_size={profile['mmap_size']}",
+               f"cache_size={profile['cache_size']}", f"temp_store={profile['temp_store']}"]
+    if read_only:
+        pragmas.append('query_only=ON')
+    else:
+        pragmas.insert(0, f"journal_mode={profile['journal_mode']}")
+
+    def _set_sqlite_profile(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(f"PRAGMA {pragma}")
+        cursor.close()
+
+    return _set_sqlite_profile
+
+POOL_DEFAULTS = {
+    'postgresql': {'pool_size': 10, 'max_overflow': 20, 'pool_timeout': 30, 'pool_recycle': 1800,
+                   'pool_pre_ping': True, 'pool_use_lifo': True},
+    'mysql': {'pool_size': 10, 'max_overflow': 20, 'pool_timeout': 30, 'pool_recycle': 3600,
+              'pool_pre_ping': True, 'pool_use_lifo': True},
+    'mariadb': {'pool_size': 10, 'max_overflow': 20, 'pool_timeout': 30, 'pool_recycle': 3600,
+                'pool_pre_ping': True, 'pool_use_lifo': True},
+    'sqlserver': {'pool_size': 10, 'max_overflow': 20, 'pool_timeout': 30, 'pool_recycle': 1800,
+                  'pool_pre_ping': True, 'pool_use_lifo': True},
+    'oracle': {'pool_size': 5, 'max_overflow': 10, 'pool_timeout': 30, 'pool_recycle': 1800,
+               'pool_pre_ping': True, 'pool_use_lifo': True},
+    'firebird': {'pool_size': 5, 'max_overflow': 5, 'pool_timeout': 30, 'pool_recycle': 1800,
+                 'pool_pre_ping': True, 'pool_use_lifo': False},
+}
+
+_POOL_CONVERTERS = {
+    'pool_size': int,
+    'max_overflow': int,
+    'pool_timeout': float,
+    'pool_recycle': int,
+    'pool_pre_ping': lambda value: str(value).strip().lower() in ('1', 'true', 'yes', 'on'),
+    'pool_use_lifo': lambda value: str(value).strip().lower() in ('1', 'true', 'yes', 'on'),
+}
+
+_session_override = contextvars.ContextVar('nexlify_session_key', default=None)
+_engine_specs = weakref.WeakKeyDictionary()
+
+def _session_key():
+    """Identifica a sessão atual do Streamlit (ou a thread, fora do Streamlit) para read-your-writes."""
+    override = _session_override.get()
+    if override is not None:
+        return override
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx(suppress_warning=True)
+        if ctx is not None:
+            return ctx.session_id
+    except ImportError:
+        pass
+    return threading.get_ident()
+
+def _remember_spec(engine, url, options: dict, sqlite_profile: dict = None, read_only: bool = False):
+    """Guarda como a engine foi criada, para que a engine assíncrona equivalente use as mesmas opções."""
+    _engine_specs[engine] = {'url': url, 'options': options, 'sqlite_profile': sqlite_profile, 'read_only': read_only}
+
+def _sqlite_read_only_engine(db_path: Path, profile: dict):
+    """Cria uma engine de conexões SQLite somente leitura (mode=ro, query_only) para o arquivo."""
+    read_uri = f"{db_path.resolve().as_uri()}?mode=ro"
+    timeout = profile['busy_timeout'] / 1000
+
+    def _connect_read_only():
+        return sqlite3.connect(read_uri, uri=True, timeout=timeout, check_same_thread=False)
+
+    engine = create_engine(f"sqlite:///{db_path}", creator=_connect_read_only, echo=False)
+    event.listen(engine, "connect", _sqlite_pragma_listener(profile, read_only=True))
+    QueryMetrics.install(engine)
+    _remember_spec(engine, make_url(f"sqlite:///{read_uri}&uri=true"), {'connect_args': {'timeout': timeout}},
+                   profile, read_only=True)
+    return engine
+
 class DatabaseManager:
     _engine = None
+    _read_engine = None
+    _sqlite_settings = None
+    _replica_engines = []
+    _replica_cycle = itertools.count()
+    _replica_down_until = {}
+    _recent_writes = {}
+    _routing_lock = threading.Lock()
+    _pool_counters = {'connects': 0, 'checkouts': 0, 'checkins': 0, 'invalidations': 0}
+    _pool_counters_lock = threading.Lock()
+    _engine_lock = threading.Lock()
 
     @classmethod
-    def _parse_active_config(cls):
+    def _read_config_sections(cls):
+        """
+        Lê o banco.ini e separa as chaves ativas do banco principal das seções
+        '[replica...]', que descrevem réplicas de leitura opcionais.
+        """
         if not CONFIG_PATH.is_file():
             raise FileNotFoundError(f"Arquivo de configuração '{CONFIG_PATH}' não encontrado.")
         with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
             lines = f.readlines()
         active_config = {}
+        replicas = []
+        target = active_config
         for line in lines:
             clean_line = line.strip()
-            if not clean_line or (clean_line.startswith('#') or clean_line.startswith(';')) or clean_line.startswith(
-                    '['):
+            if not clean_line or (clean_line.startswith('#') or clean_line.startswith(';')):
+                continue
+            if clean_line.startswith('['):
+                section = clean_line.strip('[]').strip().lower()
+                if section.startswith('replica'):
+                    target = {}
+                    replicas.append(target)
+                else:
+                    target = active_config
                 continue
             if '=' in clean_line:
                 key, value = clean_line.split('=', 1)
-                active_config[key.strip()] = value.strip()
+                target[key.strip()] = value.strip()
+        return active_config, [replica for replica in replicas if replica]
+
+    @classmethod
+    def _parse_active_config(cls):
+        active_config, _ = cls._read_config_sections()
         if not active_config or 'type' not in active_config:
             raise ValueError(
                 "Nenhuma configuração de banco de dados ativa (descomentada) foi encontrada no 'banco.ini'.")
         return active_config
 
+    @classmethod
+    def _parse_replica_configs(cls, db_config: dict) -> list:
+        """Retorna a configuração de cada réplica, herdando do banco principal as chaves omitidas."""
+        _, replicas = cls._read_config_sections()
+        inherited = {key: value for key, value in db_config.items() if key not in ('path', 'host', 'port')}
+        return [{**inherited, **replica} for replica in replicas]
+
+    @classmethod
+    def _pool_options(cls, db_type: str, db_config: dict) -> dict:
+        """
+        Lê pool_size, max_overflow, pool_timeout, pool_recycle, pool_pre_ping e pool_use_lifo
+        do bloco ativo do banco.ini, completando com os padrões do dialeto.
+        """
+        options = dict(POOL_DEFAULTS.get(db_type, {}))
+        for key, convert in _POOL_CONVERTERS.items():
+            if key in db_config:
+                try:
+                    options[key] = convert(db_config[key])
+                except ValueError as e:
+                    raise ValueError(f"Valor inválido para '{key}' no 'banco.ini': {db_config[key]!r}") from e
+        return options
+
+    @classmethod
+    def _count_pool_event(cls, counter: str):
+        with cls._pool_counters_lock:
+            cls._pool_counters[counter] += 1
+
+    @classmethod
+    def _register_pool_listeners(cls, engine):
+        event.listen(engine, "connect", lambda *args: cls._count_pool_event('connects'))
+        event.listen(engine, "checkout", lambda *args: cls._count_pool_event('checkouts'))
+        event.listen(engine, "checkin", lambda *args: cls._count_pool_event('checkins'))
+        event.listen(engine, "invalidate", lambda *args: cls._count_pool_event('invalidations'))
+
+    @classmethod
+    def pool_status(cls) -> dict:
+        """Retorna o estado atual do pool de conexões e os contadores acumulados de checkout."""
+        if cls._engine is None:
+            return {}
+        pool = cls._engine.pool
+        status = {'pool_class': type(pool).__name__, 'status': pool.status()}
+        for attribute in ('size', 'checkedin', 'checkedout', 'overflow'):
+            method = getattr(pool, attribute, None)
+            if callable(method):
+                status[attribute] = method()
+        with cls._pool_counters_lock:
+            status.update(cls._pool_counters)
+        if cls._read_engine is not None:
+            status['read_pool'] = cls._read_engine.pool.status()
+        if cls._replica_engines:
+            now = time.monotonic()
+            status['replicas'] = [
+                {'url': engine.url.render_as_string(hide_password=True), 'status': engine.pool.status(),
+                 'healthy': cls._replica_down_until.get(index, 0) <= now}
+                for index, engine in enumerate(cls._replica_engines)
+            ]
+        return status
+
+    @classmethod
+    def note_write(cls):
+        """Registra que a sessão atual acabou de escrever, para que suas próximas leituras usem o primário."""
+        if not cls._replica_engines:
+            return
+        now = time.monotonic()
+        with cls._routing_lock:
+            cls._recent_writes[_session_key()] = now
+            if len(cls._recent_writes) > 1000:
+                window = config.REPLICA_STICKY_SECONDS
+                cls._recent_writes = {key: ts for key, ts in cls._recent_writes.items() if now - ts < window}
+
+    @classmethod
+    def _is_sticky(cls) -> bool:
+        last_write = cls._recent_writes.get(_session_key())
+        return last_write is not None and (time.monotonic() - last_write) < config.REPLICA_STICKY_SECONDS
+
+    @classmethod
+    def _next_replica(cls):
+        """Escolhe a próxima réplica saudável em round-robin (None se todas estiverem fora)."""
+        now = time.monotonic()
+        total = len(cls._replica_engines)
+        for _ in range(total):
+            index = next(cls._replica_cycle) % total
+            if cls._replica_down_until.get(index, 0) <= now:
+                return cls._replica_engines[index]
+        return None
+
+    @classmethod
+    def report_read_failure(cls, engine) -> bool:
+        """
+        Informa a falha de uma engine de leitura; réplicas saem do rodízio por 'replica_retry_seconds'.
+        Retorna True se a leitura deve ser repetida no primário.
+        """
+        if engine is None or engine is cls._engine:
+            return False
+        if engine in cls._replica_engines:
+            index = cls._replica_engines.index(engine)
+            with cls._routing_lock:
+                cls._replica_down_until[index] = time.monotonic() + config.REPLICA_RETRY_SECONDS
+            logging.warning(f"Réplica '{engine.url.render_as_string(hide_password=True)}' indisponível; "
+                            f"leituras redirecionadas ao primário por {config.REPLICA_RETRY_SECONDS}s.")
+        return True
+
+    @classmethod
+    def is_replica(cls, engine) -> bool:
+        """Indica se a engine é uma réplica, cujas leituras podem estar atrasadas em relação ao primário."""
+        return engine in cls._replica_engines
+
+    @classmethod
+    def engine_spec(cls, engine) -> dict:
+        """URL, opções de create_engine e perfil do SQLite com que a engine foi criada."""
+        spec = _engine_specs.get(engine)
+        if spec is None:
+            spec = {'url': engine.url, 'options': {}, 'sqlite_profile': None, 'read_only': False}
+        return spec
+
+    @classmethod
+    def get_read_engine(cls):
+        """
+        Engine para leituras: réplicas em round-robin (o primário para quem acabou de escrever), o pool somente
+        leitura do SQLite ('read_only_pool') ou a engine principal.
+        """
+        engine = cls.get_engine()
+        if engine is None:
+            return engine
+        if cls._replica_engines:
+            if cls._is_sticky():
+                return engine
+            return cls._next_replica() or engine
+        if cls._sqlite_settings is None:
+            return engine
+        db_path, profile = cls._sqlite_settings
+        if not profile['read_only_pool'] or profile['journal_mode'] != 'WAL' or not db_path.exists():
+            return engine
+        if cls._read_engine is None:
+            with cls._engine_lock:
+                if cls._read_engine is None:
+                    cls._read_engine = _sqlite_read_only_engine(db_path, profile)
+                    logging.info(f"Pool de leitura somente leitura do SQLite criado para '{db_path}'.")
+        return cls._read_engine
+
+    @classmethod
+    def _server_url(cls, db_type: str, db_config: dict, key: bytes) -> str:
+        user = decrypt_message(db_config['user'], key)
+        password = decrypt_message(db_config['password'], key)
+        host = db_config['host']
+        dbname = db_config['dbname']
+        port = db_config.get('port')
+
+        if db_type == 'postgresql':
+            return f"postgresql+psycopg2://{user}:{password}@{host}:{port}/{dbname}"
+        elif db_type == 'mysql':
+            return f"mysql+pymysql://{user}:{password}@{host}:{port}/{dbname}"
+        elif db_type == 'sqlserver':
+            return f"mssql+pymssql://{user}:{password}@{host}:{port}/{dbname}"
+        elif db_type == 'mariadb':
+            return f"mariadb+mariadbconnector://{user}:{password}@{host}:{port}/{dbname}"
+        elif db_type == 'oracle':
+            dsn = f"{host}:{port}/{dbname}"
+            return f"oracle+oracledb://{user}:{password}@{dsn}"
+        elif db_type == 'firebird':
+            return f"firebird+fdb://{user}:{password}@{host}:{port}/{dbname}"
+        raise ValueError(f"Tipo de banco de dados não suportado: '{db_type}'")
+
+    @classmethod
+    def _create_replica_engines(cls, db_type: str, db_config: dict, key: bytes) -> list:
+        """Cria (sem conectar) as engines das réplicas declaradas no banco.ini."""
+        engines = []
+        for replica_config in cls._parse_replica_configs(db_config):
+            if db_type == 'sqlite':
+                db_path = project_root / replica_config['path']
+                engine = _sqlite_read_only_engine(db_path, _sqlite_profile(replica_config))
+            else:
+                pool_options = cls._pool_options(db_type, replica_config)
+                engine = create_engine(cls._server_url(db_type, replica_config, key), echo=False, **pool_options)
+                _remember_spec(engine, engine.url, pool_options)
+            cls._register_pool_listeners(engine)
+            QueryMetrics.install(engine)
+            engines.append(engine)
+            logging.info(f"Réplica de leitura registrada: '{engine.url.render_as_string(hide_password=True)}'")
+        return engines
+
     @classmethod
     def get_engine(cls):
+        """Retorna a engine principal, criada uma única vez por processo (chamadas simultâneas esperam a primeira)."""
         if not config.DATABASE_ENABLED:
             logging.warning("Acesso ao banco de dados está desativado em config.py. Nenhuma engine será criada.")
             return None
-        if cls._engine is None:
-            try:
-                db_config = cls._parse_active_config()
-                key = load_key()
-            except (FileNotFoundError, ValueError, RuntimeError) as e:
-                logging.critical(f"Erro ao ler configuração do banco: {e}")
-                raise
-            except Exception as e:
-                logging.critical(f"Falha CRÍTICA ao carregar a chave de segurança: {e}")
-                raise RuntimeError("Não foi possível carregar a chave 'secret.key'.") from e
-
-            db_type = db_config.get('type', 'sqlite').lower()
-            connection_url = None
-            engine_options = {'echo': False}
-            logging.info(f"Configuração ativa detectada: '{db_type}'")
-            try:
-                if db_type == 'sqlite':
-                    db_path = project_root / db_config.get('path', 'sistema.db')
-                    connection_url = f"sqlite:///{db_path}"
-                    engine_options['connect_args'] = {'timeout': 15}
+        engine = cls._engine
+        if engine is not None:
+            return engine
+        with cls._engine_lock:
+            if cls._engine is None:
+                cls._create_engine()
+            return cls._engine
 
-                    engine = create_engine(connection_url, **engine_options)
+    @classmethod
+    def _create_engine(cls):
+        """Cria, testa e publica a engine principal e as réplicas (chamado com _engine_lock)."""
+        try:
+            db_config = cls._parse_active_config()
+            key = load_key()
+        except (FileNotFoundError, ValueError, RuntimeError) as e:
+            logging.critical(f"Erro ao ler configuração do banco: {e}")
+            raise
+        except Exception as e:
+            logging.critical(f"Falha CRÍTICA ao carregar a chave de segurança: {e}")
+            raise RuntimeError("Não foi possível carregar a chave 'secret.key'.") from e
 
-                    event.listen(engine, "connect", _set_sqlite_pragma)
-                    cls._engine = engine
-                else:
-                    user = decrypt_message(db_config['user'], key)
-                    password = decrypt_message(db_config['password'], key)
-                    host = db_config['host']
-                    dbname = db_config['dbname']
-                    port = db_config.get('port')
-
-                    if db_type == 'postgresql':
-                        connection_url = f"postgresql+psycopg2://{user}:{password}@{host}:{port}/{dbname}"
-                    elif db_type == 'mysql':
-                        connection_url = f"mysql+pymysql://{user}:{password}@{host}:{port}/{dbname}"
-                    elif db_type == 'sqlserver':
-                        connection_url = f"mssql+pymssql://{user}:{password}@{host}:{port}/{dbname}"
-                    elif db_type == 'mariadb':
-                        connection_url = f"mariadb+mariadbconnector://{user}:{password}@{host}:{port}/{dbname}"
-                    elif db_type == 'oracle':
-                        dsn = f"{host}:{port}/{dbname}"
-                        connection_url = f"oracle+oracledb://{user}:{password}@{dsn}"
-                    elif db_type == 'firebird':
-                        connection_url = f"firebird+fdb://{user}:{password}@{host}:{port}/{dbname}"
-                    else:
-                        raise ValueError(f"Tipo de banco de dados não suportado: '{db_type}'")
-
-                    cls._engine = create_engine(connection_url, **engine_options)
-
-                with cls._engine.connect() as connection:
-                    logging.info(f"Conexão com '{db_type}' estabelecida com sucesso.")
-            except (OperationalError, SQLAlchemyError) as e:
-                logging.error(
-                    f"Erro ao conectar ao banco '{db_type}'. Verifique as credenciais, rede e status do servidor.")
-                raise ConnectionError(f"Não foi possível conectar ao banco '{db_type}'.") from e
-            except KeyError as e:
-                logging.error(f"Parâmetro de configuração faltando no banco.ini para '{db_type}': {e}")
-                raise KeyError(f"Parâmetro '{e}' faltando no 'banco.ini' para a conexão '{db_type}'.") from e
-            except Exception as e:
-                logging.error(f"Erro inesperado durante a configuração do banco: {e}")
-                raise
-        return cls._engine
+        db_type = db_config.get('type', 'sqlite').lower()
+        engine = None
+        sqlite_settings = None
+        engine_options = {'echo': False}
+        logging.info(f"Configuração ativa detectada: '{db_type}'")
+        try:
+            if db_type == 'sqlite':
+                db_path = project_root / db_config.get('path', 'sistema.db')
+                profile = _sqlite_profile(db_config)
+                engine_options['connect_args'] = {'timeout': profile['busy_timeout'] / 1000}
+
+                engine = create_engine(f"sqlite:///{db_path}", **engine_options)
+
+                event.listen(engine, "connect", _sqlite_pragma_listener(profile))
+                _remember_spec(engine, engine.url, {'connect_args': engine_options['connect_args']}, profile)
+                logging.info(f"Perfil de desempenho do SQLite: {profile}")
+                sqlite_settings = (db_path, profile)
+            else:
+                connection_url = cls._server_url(db_type, db_config, key)
+                pool_options = cls._pool_options(db_type, db_config)
+                logging.info(f"Pool de conexões para '{db_type}': {pool_options}")
+                engine = create_engine(connection_url, **engine_options, **pool_options)
+                _remember_spec(engine, engine.url, pool_options)
+
+            cls._register_pool_listeners(engine)
+            QueryMetrics.install(engine)
+            with engine.connect() as connection:
+                logging.info(f"Conexão com '{db_type}' estabelecida com sucesso.")
+            replica_engines = cls._create_replica_engines(db_type, db_config, key)
+        except (OperationalError, SQLAlchemyError) as e:
+            if engine is not None:
+                engine.dispose()
+            logging.error(
+                f"Erro ao conectar ao banco '{db_type}'. Verifique as credenciais, rede e status do servidor.")
+            raise ConnectionError(f"Não foi possível conectar ao banco '{db_type}'.") from e
+        except KeyError as e:
+            if engine is not None:
+                engine.dispose()
+            logging.error(f"Parâmetro de configuração faltando no banco.ini para '{db_type}': {e}")
+            raise KeyError(f"Parâmetro '{e}' faltando no 'banco.ini' para a conexão '{db_type}'.") from e
+        except Exception as e:
+            if engine is not None:
+                engine.dispose()
+            logging.error(f"Erro inesperado durante a configuração do banco: {e}")
+            raise
+
+        cls._sqlite_settings = sqlite_settings
+        cls._replica_engines = replica_engines
+        cls._engine = engine
 
     @classmethod
     def initialize_database(cls):
+        """
+        Aplica ao banco ativo as migrações pendentes de persistencia/migrations/<dialeto>
+        (ver MigrationRunner) e retorna as versões aplicadas.
+        """
         engine = cls.get_engine()
         if not engine:
             logging.error("Não foi possível inicializar o banco: engine não disponível.")
-            return
-        if engine.url.drivername != 'sqlite':
-            logging.info("Inicialização de schema pulada para banco não-SQLite.")
-            return
-        db_path = Path(engine.url.database)
-        if db_path.exists() and db_path.stat().st_size > 0:
-            logging.info("Banco de dados SQLite já parece estar inicializado.")
-            return
-        if not SCHEMA_PATH.is_file():
-            raise FileNotFoundError(f"Arquivo de schema não encontrado em {SCHEMA_PATH}")
-        logging.info(f"Inicializando banco de dados SQLite a partir de '{SCHEMA_PATH}'...")
+            return []
         try:
-            schema_sql = SCHEMA_PATH.read_text(encoding='utf-8')
-            with engine.connect() as conn:
-                for command in schema_sql.split(';'):
-                    if command.strip():
-                        conn.execute(text(command))
-                conn.commit()
-            logging.info("Banco de dados SQLite inicializado com sucesso.")
+            return MigrationRunner(engine).migrate()
         except Exception as e:
-            logging.error(f"Erro ao executar o script de inicialização do SQLite: {e}")
-            raise
\ No newline at end of file
+            logging.error(f"Erro ao aplicar as migrações do banco: {e}")
+            raise
+
+    @classmethod
+    def warm_up(cls, connections: int = 2) -> dict:
+        """Abre até 'connections' conexões em cada pool (principal e leitura) e retorna quantas abriu por pool."""
+        opened = {}
+        engine = cls.get_engine()
+        if engine is None:
+            return opened
+        engines = {'principal': engine}
+        read_engine = cls.get_read_engine()
+        if read_engine is not engine:
+            engines['leitura'] = read_engine
+        for name, target in engines.items():
+            size = getattr(target.pool, 'size', None)
+            count = min(connections, size()) if callable(size) else connections
+            checked_out = []
+            try:
+                for _ in range(max(count, 0)):
+                    checked_out.append(target.connect())
+            finally:
+                for connection in checked_out:
+                    connection.close()
+            opened[name] = len(checked_out)
+        logging.info(f"Pools de conexão pré-aquecidos: {opened}")
+        return opened
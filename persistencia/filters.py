@@ -0,0 +1,196 @@
+import itertools
+from abc import ABC, abstractmethod
+from sqlalchemy import and_ as sql_and, or_ as sql_or, bindparam
+
+class Filter(ABC):
+    """
+    Expressão de filtro do GenericRepository, compilada para uma cláusula Core com bindparams posicionais.
+    Combine com '&' (E) e '|' (OU), ou com and_/or_ deste módulo.
+    """
+
+    def __and__(self, other):
+        return Group('and', self, other)
+
+    def __or__(self, other):
+        return Group('or', self, other)
+
+    @abstractmethod
+    def conditions(self):
+        """Retorna as condições simples da expressão, na ordem em que são compiladas."""
+
+    def columns(self) -> list:
+        return [condition.column for condition in self.conditions()]
+
+    @abstractmethod
+    def shape(self):
+        """Chave da forma da expressão (operadores e colunas, sem os valores)."""
+
+    def to_clause(self, table, prefix: str = "f"):
+        """Compila a expressão em uma cláusula Core sobre o objeto Table informado."""
+        return self._clause(table, prefix, itertools.count())
+
+    def params(self, prefix: str = "f") -> dict:
+        """Retorna os parâmetros da expressão com os mesmos nomes usados em to_clause."""
+        params = {}
+        for index, condition in enumerate(self.conditions()):
+            params.update(condition._params(f"{prefix}{index}_{condition.column}"))
+        return params
+
+    @abstractmethod
+    def _clause(self, table, prefix: str, names):
+        """Compila a expressão consumindo um nome de parâmetro de 'names' por condição simples."""
+
+class Condition(Filter):
+    """Condição simples sobre uma coluna (ex.: Column('nome').startswith('Ba'))."""
+
+    OPERATORS = ('eq', 'ne', 'gt', 'ge', 'lt', 'le', 'in', 'between', 'like', 'startswith', 'is_null', 'not_null')
+    LIKE_ESCAPE = '/'
+
+    def __init__(self, column: str, operator: str, *values):
+        if operator not in self.OPERATORS:
+            raise ValueError(f"Operador de filtro desconhecido: '{operator}'.")
+        self.column = str(column).lower()
+        self.operator = operator
+        self.values = values
+
+    def __repr__(self):
+        return f"Condition({self.column!r}, {self.operator!r}, {', '.join(map(repr, self.values))})"
+
+    def conditions(self):
+        return [self]
+
+    def shape(self):
+        return (self.operator, self.column)
+
+    def _clause(self, table, prefix: str, names):
+        name = f"{prefix}{next(names)}_{self.column}"
+        column = table.c[self.column]
+        operator = self.operator
+        if operator == 'eq':
+            return column == bindparam(name)
+        if operator == 'ne':
+            return column != bindparam(name)
+        if operator == 'gt':
+            return column > bindparam(name)
+        if operator == 'ge':
+            return column >= bindparam(name)
+        if operator == 'lt':
+            return column < bindparam(name)
+        if operator == 'le':
+            return column <= bindparam(name)
+        if operator == 'in':
+            return column.in_(bindparam(name, expanding=True))
+        if operator == 'between':
+            return column.between(bindparam(f"{name}_de"), bindparam(f"{name}_ate"))
+        if operator == 'like':
+            return column.like(bindparam(name))
+        if operator == 'startswith':
+            return column.like(bindparam(name), escape=self.LIKE_ESCAPE)
+        if operator == 'is_null':
+            return column.is_(None)
+        return column.is_not(None)
+
+    def _params(self, name: str) -> dict:
+        if self.operator in ('is_null', 'not_null'):
+            return {}
+        if self.operator == 'in':
+            return {name: list(self.values[0])}
+        if self.operator == 'between':
+            return {f"{name}_de": self.values[0], f"{name}_ate": self.values[1]}
+        if self.operator == 'startswith':
+            escape = self.LIKE_ESCAPE
+            prefix = str(self.values[0]).replace(escape, escape * 2).replace('%', f'{escape}%').replace('_', f'{escape}_')
+            return {name: f"{prefix}%"}
+        return {name: self.values[0]}
+
+class Group(Filter):
+    """Agrupa filtros com E ('and') ou OU ('or')."""
+
+    def __init__(self, kind: str, *filters):
+        if kind not in ('and', 'or'):
+            raise ValueError(f"Agrupamento de filtro desconhecido: '{kind}'.")
+        if not filters:
+            raise ValueError("Um grupo de filtros precisa de pelo menos uma condição.")
+        self.kind = kind
+        self.filters = []
+        for item in (as_filter(item) for item in filters):
+            if isinstance(item, Group) and item.kind == kind:
+                self.filters.extend(item.filters)
+            else:
+                self.filters.append(item)
+
+    def __repr__(self):
+        return f"Group({self.kind!r}, {', '.join(map(repr, self.filters))})"
+
+    def conditions(self):
+        return [condition for item in self.filters for condition in item.conditions()]
+
+    def shape(self):
+        return (self.kind,) + tuple(item.shape() for item in self.filters)
+
+    def _clause(self, table, prefix: str, names):
+        clauses = [item._clause(table, prefix, names) for item in self.filters]
+        return sql_and(*clauses) if self.kind == 'and' else sql_or(*clauses)
+
+class Column:
+    """Ponto de partida das condições: Column('id_tipo').in_([1, 2]), Column('nome').startswith('Ba')."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def eq(self, value):
+        return Condition(self.name, 'eq', value)
+
+    def ne(self, value):
+        return Condition(self.name, 'ne', value)
+
+    def gt(self, value):
+        return Condition(self.name, 'gt', value)
+
+    def ge(self, value):
+        return Condition(self.name, 'ge', value)
+
+    def lt(self, value):
+        return Condition(self.name, 'lt', value)
+
+    def le(self, value):
+        return Condition(self.name, 'le', value)
+
+    def in_(self, values):
+        return Condition(self.name, 'in', tuple(values))
+
+    def between(self, lower, upper):
+        return Condition(self.name, 'between', lower, upper)
+
+    def like(self, pattern: str):
+        return Condition(self.name, 'like', pattern)
+
+    def startswith(self, prefix: str):
+        """
+        LIKE 'prefixo%' com curingas escapados. Não usa índice no SQLite (LIKE com ESCAPE não é
+        otimizado) nem no PostgreSQL sem text_pattern_ops ou collation C.
+        """
+        return Condition(self.name, 'startswith', prefix)
+
+    def is_null(self):
+        return Condition(self.name, 'is_null')
+
+    def not_null(self):
+        return Condition(self.name, 'not_null')
+
+def and_(*filters) -> Filter:
+    return Group('and', *filters)
+
+def or_(*filters) -> Filter:
+    return Group('or', *filters)
+
+def as_filter(where) -> Filter:
+    """Converte um dict de igualdades (formato antigo de where_conditions) em Filter."""
+    if isinstance(where, Filter):
+        return where
+    if isinstance(where, dict):
+        conditions = [Condition(key, 'eq', value) for key, value in where.items()]
+        if not conditions:
+            raise ValueError("where_conditions vazio não pode ser convertido em filtro.")
+        return conditions[0] if len(conditions) == 1 else Group('and', *conditions)
+    raise TypeError(f"Filtro inválido: {where!r}")
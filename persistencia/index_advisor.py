@@ -0,0 +1,211 @@
+import logging
+import re
+import threading
+from collections import OrderedDict
+import pandas as pd
+from sqlalchemy import event, inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+import config
+from .database import DatabaseManager
+from .cache import normalize_sql
+
+_CLAUSE_PATTERN = re.compile(
+    r'\b(WHERE|ON)\b(.*?)(?=\b(?:WHERE|GROUP\s+BY|ORDER\s+BY|LIMIT|OFFSET|FETCH|LEFT|RIGHT|INNER|FULL|JOIN|UNION|HAVING)\b|$)',
+    re.IGNORECASE | re.DOTALL)
+_PREDICATE_PATTERN = re.compile(
+    r'(?:(\w+)\.)?(\w+)\s*(=|<>|!=|<=|>=|<|>|\bNOT\s+IN\b|\bIN\b|\bNOT\s+LIKE\b|\bLIKE\b|\bBETWEEN\b|\bIS\b)',
+    re.IGNORECASE)
+_QUALIFIED_PATTERN = re.compile(r'\b(\w+)\.(\w+)\b')
+_ORDER_BY_PATTERN = re.compile(r'\bORDER\s+BY\b(.*?)(?=\b(?:LIMIT|OFFSET|FETCH)\b|$)', re.IGNORECASE | re.DOTALL)
+_SQLITE_SCAN_PATTERN = re.compile(r'^SCAN (?:TABLE )?(\w+)(?: AS \w+)?\s*$', re.IGNORECASE)
+_POSTGRES_SCAN_PATTERN = re.compile(r'Seq Scan on (\w+)', re.IGNORECASE)
+
+class IndexAdvisor:
+    """
+    Registra as queries executadas e, sob demanda, roda EXPLAIN em cada uma, relatando varreduras completas
+    de tabela e sugerindo índices (SQLite, PostgreSQL, MySQL e MariaDB).
+    """
+
+    EXPLAIN_PREFIX = {
+        'sqlite': 'EXPLAIN QUERY PLAN ',
+        'postgresql': 'EXPLAIN ',
+        'mysql': 'EXPLAIN ',
+        'mariadb': 'EXPLAIN ',
+    }
+    EQUALITY_OPERATORS = ('=', 'IN', 'IS')
+
+    max_statements = config.INDEX_ADVISOR_MAX_STATEMENTS
+    _statements = OrderedDict()
+    _lock = threading.Lock()
+    _installed = False
+
+    @classmethod
+    def install(cls):
+        """Passa a registrar as queries de todas as engines do processo (idempotente)."""
+        with cls._lock:
+            if not cls._installed:
+                event.listen(Engine, "before_cursor_execute", cls._record)
+                cls._installed = True
+
+    @classmethod
+    def uninstall(cls):
+        with cls._lock:
+            if cls._installed:
+                event.remove(Engine, "before_cursor_execute", cls._record)
+                cls._installed = False
+
+    @classmethod
+    def _record(cls, conn, cursor, statement, parameters, context, executemany):
+        if executemany:
+            return
+        normalized = normalize_sql(statement)
+        if not normalized.lower().startswith(('select', 'with', 'update', 'delete')):
+            return
+        key = (conn.dialect.name, normalized)
+        with cls._lock:
+            entry = cls._statements.get(key)
+            if entry is None:
+                entry = {'dialect': conn.dialect.name, 'sql': normalized, 'parameters': parameters, 'executions': 0}
+                cls._statements[key] = entry
+                while len(cls._statements) > cls.max_statements:
+                    cls._statements.popitem(last=False)
+            else:
+                entry['parameters'] = parameters
+                cls._statements.move_to_end(key)
+            entry['executions'] += 1
+
+    @classmethod
+    def recorded(cls) -> list:
+        """Retorna as queries registradas (SQL, dialeto, últimos parâmetros e número de execuções)."""
+        with cls._lock:
+            return [dict(entry) for entry in cls._statements.values()]
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._statements.clear()
+
+    @classmethod
+    def explain(cls, engine, sql: str, parameters=None):
+        """
+        Executa o EXPLAIN do dialeto e retorna (linhas do plano, tabelas varridas por completo).
+        Levanta ValueError para dialetos sem EXPLAIN suportado (ver EXPLAIN_PREFIX).
+        """
+        dialect_name = engine.dialect.name
+        prefix = cls.EXPLAIN_PREFIX.get(dialect_name)
+        if prefix is None:
+            raise ValueError(f"EXPLAIN não suportado pelo assistente de índices para o dialeto '{dialect_name}'.")
+
+        with engine.connect() as connection:
+            result = connection.exec_driver_sql(prefix + sql, parameters if parameters else ())
+            rows = [row._mapping for row in result]
+
+        if dialect_name == 'sqlite':
+            plan = [row['detail'] for row in rows]
+            scans = [match.group(1) for match in map(_SQLITE_SCAN_PATTERN.match, plan) if match]
+        elif dialect_name == 'postgresql':
+            plan = [str(next(iter(row.values()))) for row in rows]
+            scans = [name for line in plan for name in _POSTGRES_SCAN_PATTERN.findall(line)]
+        else:
+            plan = [f"{row.get('table')}: type={row.get('type')} key={row.get('key')}" for row in rows]
+            scans = [row.get('table') for row in rows if str(row.get('type')).upper() == 'ALL']
+        return plan, [name.lower() for name in scans if name]
+
+    @classmethod
+    def _candidate_columns(cls, sql: str, table_name: str, table_columns: set) -> list:
+        equality, others = [], []
+
+        def belongs(qualifier, column):
+            return column in table_columns and (qualifier is None or qualifier.lower() == table_name)
+
+        for keyword, body in _CLAUSE_PATTERN.findall(sql):
+            if keyword.upper() == 'ON':
+                for qualifier, column in _QUALIFIED_PATTERN.findall(body):
+                    if belongs(qualifier, column.lower()):
+                        equality.append(column.lower())
+                continue
+            for qualifier, column, operator in _PREDICATE_PATTERN.findall(body):
+                if belongs(qualifier or None, column.lower()):
+                    is_equality = operator.upper() in cls.EQUALITY_OPERATORS
+                    (equality if is_equality else others).append(column.lower())
+
+        for body in _ORDER_BY_PATTERN.findall(sql):
+            for item in body.split(','):
+                parts = item.strip().split()
+                if parts:
+                    qualifier, _, column = parts[0].rpartition('.')
+                    if belongs(qualifier or None, column.lower()):
+                        others.append(column.lower())
+        return list(dict.fromkeys(equality + others))
+
+    @classmethod
+    def _indexed_leading_columns(cls, inspector, table_name: str) -> set:
+        leading = set(inspector.get_pk_constraint(table_name).get('constrained_columns', [])[:1])
+        for index in inspector.get_indexes(table_name):
+            if index.get('column_names'):
+                leading.add(index['column_names'][0])
+        for constraint in inspector.get_unique_constraints(table_name):
+            if constraint.get('column_names'):
+                leading.add(constraint['column_names'][0])
+        return {str(column).lower() for column in leading if column}
+
+    @classmethod
+    def suggest_index(cls, engine, sql: str, table_name: str):
+        """Sugere o CREATE INDEX que eliminaria a varredura de 'table_name' nesta query, ou None."""
+        inspector = inspect(engine)
+        table_columns = {column['name'].lower() for column in inspector.get_columns(table_name)}
+        indexed = cls._indexed_leading_columns(inspector, table_name)
+        candidates = [col for col in cls._candidate_columns(sql, table_name, table_columns) if col not in indexed]
+        if not candidates:
+            return None
+        columns = candidates[:3]
+        return f"CREATE INDEX idx_{table_name}_{'_'.join(columns)} ON {table_name} ({', '.join(columns)})"
+
+    @classmethod
+    def analyze(cls, engine=None) -> list:
+        """
+        Roda o EXPLAIN de cada query registrada no dialeto da engine e retorna uma linha por
+        tabela varrida por completo: SQL, tabela, execuções, plano e índice sugerido.
+        """
+        engine = engine or DatabaseManager.get_engine()
+        if engine is None:
+            return []
+        if engine.dialect.name not in cls.EXPLAIN_PREFIX:
+            logging.warning(f"Assistente de índices não suporta o dialeto '{engine.dialect.name}'; "
+                            f"nenhuma query foi analisada.")
+            return []
+        user_tables = {name.lower() for name in inspect(engine).get_table_names()}
+        findings = []
+        for entry in cls.recorded():
+            if entry['dialect'] != engine.dialect.name:
+                continue
+            try:
+                plan, scans = cls.explain(engine, entry['sql'], entry['parameters'])
+            except SQLAlchemyError as e:
+                logging.warning(f"Não foi possível obter o plano da query: {entry['sql']}\nErro: {e}")
+                continue
+            for table_name in dict.fromkeys(name for name in scans if name in user_tables):
+                try:
+                    suggestion = cls.suggest_index(engine, entry['sql'], table_name)
+                except SQLAlchemyError:
+                    suggestion = None
+                findings.append({
+                    'sql': entry['sql'],
+                    'tabela': table_name,
+                    'execucoes': entry['executions'],
+                    'plano': ' | '.join(plan),
+                    'indice_sugerido': suggestion,
+                })
+        findings.sort(key=lambda finding: finding['execucoes'], reverse=True)
+        return findings
+
+    @classmethod
+    def report_dataframe(cls, engine=None) -> pd.DataFrame:
+        """Resultado de analyze() como DataFrame, para exibição em painéis."""
+        return pd.DataFrame(cls.analyze(engine),
+                            columns=['tabela', 'execucoes', 'indice_sugerido', 'sql', 'plano'])
+
+if config.INDEX_ADVISOR_ENABLED:
+    IndexAdvisor.install()
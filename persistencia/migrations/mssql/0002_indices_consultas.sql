@@ -0,0 +1,8 @@
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'idx_vegetais_nome' AND object_id = OBJECT_ID('dbo.vegetais'))
+    CREATE INDEX idx_vegetais_nome ON vegetais (nome);
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'idx_vegetais_id_tipo' AND object_id = OBJECT_ID('dbo.vegetais'))
+    CREATE INDEX idx_vegetais_id_tipo ON vegetais (id_tipo);
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'idx_log_alteracoes_timestamp' AND object_id = OBJECT_ID('dbo.log_alteracoes'))
+    CREATE INDEX idx_log_alteracoes_timestamp ON log_alteracoes (timestamp);
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'idx_log_alteracoes_login_usuario' AND object_id = OBJECT_ID('dbo.log_alteracoes'))
+    CREATE INDEX idx_log_alteracoes_login_usuario ON log_alteracoes (login_usuario);
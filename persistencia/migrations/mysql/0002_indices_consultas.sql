@@ -0,0 +1,20 @@
+SET @ddl = (SELECT IF(COUNT(*) = 0, 'CREATE INDEX idx_vegetais_nome ON vegetais (nome)', 'DO 0') FROM information_schema.statistics
+    WHERE table_schema = DATABASE() AND table_name = 'vegetais' AND index_name = 'idx_vegetais_nome');
+PREPARE stmt FROM @ddl;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+SET @ddl = (SELECT IF(COUNT(*) = 0, 'CREATE INDEX idx_vegetais_id_tipo ON vegetais (id_tipo)', 'DO 0') FROM information_schema.statistics
+    WHERE table_schema = DATABASE() AND table_name = 'vegetais' AND index_name = 'idx_vegetais_id_tipo');
+PREPARE stmt FROM @ddl;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+SET @ddl = (SELECT IF(COUNT(*) = 0, 'CREATE INDEX idx_log_alteracoes_timestamp ON log_alteracoes (timestamp)', 'DO 0') FROM information_schema.statistics
+    WHERE table_schema = DATABASE() AND table_name = 'log_alteracoes' AND index_name = 'idx_log_alteracoes_timestamp');
+PREPARE stmt FROM @ddl;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+SET @ddl = (SELECT IF(COUNT(*) = 0, 'CREATE INDEX idx_log_alteracoes_login_usuario ON log_alteracoes (login_usuario)', 'DO 0') FROM information_schema.statistics
+    WHERE table_schema = DATABASE() AND table_name = 'log_alteracoes' AND index_name = 'idx_log_alteracoes_login_usuario');
+PREPARE stmt FROM @ddl;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
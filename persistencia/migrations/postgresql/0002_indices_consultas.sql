@@ -0,0 +1,4 @@
+CREATE INDEX IF NOT EXISTS idx_vegetais_nome ON vegetais (nome);
+CREATE INDEX IF NOT EXISTS idx_vegetais_id_tipo ON vegetais (id_tipo);
+CREATE INDEX IF NOT EXISTS idx_log_alteracoes_timestamp ON log_alteracoes (timestamp);
+CREATE INDEX IF NOT EXISTS idx_log_alteracoes_login_usuario ON log_alteracoes (login_usuario);
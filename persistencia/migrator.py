@@ -0,0 +1,208 @@
+import hashlib
+import logging
+import re
+import time
+from collections import namedtuple
+from datetime import datetime
+from pathlib import Path
+from sqlalchemy import MetaData, Table, Column, Integer, String, DateTime, inspect, insert, select
+
+MIGRATIONS_PATH = Path(__file__).parent / "migrations"
+
+Migration = namedtuple('Migration', ['version', 'description', 'path', 'script', 'checksum'])
+
+_metadata = MetaData()
+schema_version = Table(
+    'schema_version', _metadata,
+    Column('version', Integer, primary_key=True, autoincrement=False),
+    Column('description', String(255), nullable=False),
+    Column('checksum', String(64), nullable=False),
+    Column('applied_at', DateTime, nullable=False),
+    Column('duration_ms', Integer, nullable=False),
+)
+
+_FILE_PATTERN = re.compile(r'^(\d+)_(\w+)\.sql$')
+_GO_PATTERN = re.compile(r'^\s*GO\s*$', re.IGNORECASE | re.MULTILINE)
+
+def split_sql_statements(script: str) -> list:
+    """Divide um script em comandos pelo ';', ignorando os que aparecem em strings e comentários '--'."""
+    statements, current = [], []
+    quote = None
+    index = 0
+    while index < len(script):
+        char = script[index]
+        if quote:
+            current.append(char)
+            if char == quote:
+                if script[index + 1:index + 2] == quote:
+                    current.append(quote)
+                    index += 1
+                else:
+                    quote = None
+        elif char in ("'", '"'):
+            quote = char
+            current.append(char)
+        elif script.startswith('--', index):
+            end = script.find('\n', index)
+            index = len(script) if end == -1 else end
+            continue
+        elif char == ';':
+            statements.append(''.join(current).strip())
+            current = []
+        else:
+            current.append(char)
+        index += 1
+    statements.append(''.join(current).strip())
+    return [statement for statement in statements if statement]
+
+class MigrationRunner:
+    """
+    Aplica em ordem as migrações de persistencia/migrations/<dialeto>/NNNN_descricao.sql, cada uma numa
+    transação registrada em schema_version; bancos anteriores às migrações recebem a versão 1 como base.
+    """
+
+    DIALECT_DIRECTORIES = {
+        'sqlite': 'sqlite',
+        'postgresql': 'postgresql',
+        'mysql': 'mysql',
+        'mariadb': 'mysql',
+        'mssql': 'mssql',
+    }
+
+    def __init__(self, engine, migrations_path: Path = MIGRATIONS_PATH):
+        self.engine = engine
+        self.migrations_path = migrations_path
+
+    @staticmethod
+    def checksum(script: str) -> str:
+        return hashlib.sha256(script.replace('\r\n', '\n').encode('utf-8')).hexdigest()
+
+    def directory(self):
+        name = self.DIALECT_DIRECTORIES.get(self.engine.dialect.name)
+        return self.migrations_path / name if name else None
+
+    def discover(self) -> list:
+        """Lista as migrações do dialeto ativo, ordenadas pela versão."""
+        directory = self.directory()
+        if directory is None or not directory.is_dir():
+            return []
+        migrations = []
+        for path in directory.glob('*.sql'):
+            match = _FILE_PATTERN.match(path.name)
+            if not match:
+                logging.warning(f"Arquivo de migração ignorado (nome fora do padrão NNNN_descricao.sql): {path.name}")
+                continue
+            script = path.read_text(encoding='utf-8')
+            migrations.append(Migration(int(match.group(1)), match.group(2), path, script, self.checksum(script)))
+        migrations.sort(key=lambda migration: migration.version)
+        versions = [migration.version for migration in migrations]
+        if len(versions) != len(set(versions)):
+            raise RuntimeError(f"Versões de migração duplicadas em '{directory}'.")
+        return migrations
+
+    def applied(self) -> dict:
+        """Retorna {versão: checksum} das migrações já registradas em schema_version."""
+        if not inspect(self.engine).has_table('schema_version'):
+            return {}
+        with self.engine.connect() as connection:
+            rows = connection.execute(select(schema_version.c.version, schema_version.c.checksum)).all()
+        return {version: checksum for version, checksum in rows}
+
+    def pending(self, migrations: list = None, applied: dict = None) -> list:
+        """Migrações ainda não aplicadas; falha se alguma já aplicada teve o arquivo alterado."""
+        applied = self.applied() if applied is None else applied
+        pending = []
+        for migration in (self.discover() if migrations is None else migrations):
+            checksum = applied.get(migration.version)
+            if checksum is None:
+                pending.append(migration)
+            elif checksum != migration.checksum:
+                raise RuntimeError(f"A migração {migration.version:04d} ({migration.path.name}) foi alterada "
+                                   f"depois de aplicada (checksum divergente).")
+        return pending
+
+    def _record(self, connection, migration: Migration, duration_ms: int, description: str = None):
+        connection.execute(insert(schema_version).values(
+            version=migration.version, description=description or migration.description,
+            checksum=migration.checksum, applied_at=datetime.now(), duration_ms=duration_ms))
+
+    def _prepare(self, migrations: list) -> dict:
+        """Cria schema_version quando falta (com linha de base para bancos já existentes) e retorna applied()."""
+        table_names = {name.lower() for name in inspect(self.engine).get_table_names()}
+        if 'schema_version' in table_names:
+            return self.applied()
+        with self.engine.begin() as connection:
+            _metadata.create_all(connection, tables=[schema_version], checkfirst=False)
+            if table_names:
+                baseline = migrations[0]
+                self._record(connection, baseline, 0, f"{baseline.description} (linha de base)")
+                logging.info(f"Banco existente sem schema_version: migração {baseline.version:04d} "
+                             f"registrada como linha de base.")
+                return {baseline.version: baseline.checksum}
+        return {}
+
+    def _apply_sqlite(self, migration: Migration) -> int:
+        raw_connection = self.engine.raw_connection()
+        try:
+            dbapi_connection = raw_connection.driver_connection
+            start = time.perf_counter()
+            try:
+                dbapi_connection.executescript(f"BEGIN IMMEDIATE;\n{migration.script}")
+                duration_ms = int((time.perf_counter() - start) * 1000)
+                dbapi_connection.execute(
+                    "INSERT INTO schema_version (version, description, checksum, applied_at, duration_ms) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (migration.version, migration.description, migration.checksum,
+                     datetime.now().isoformat(sep=' '), duration_ms))
+                dbapi_connection.commit()
+            except Exception:
+                if dbapi_connection.in_transaction:
+                    dbapi_connection.rollback()
+                raise
+            return duration_ms
+        finally:
+            raw_connection.close()
+
+    def _batches(self, script: str) -> list:
+        dialect_name = self.engine.dialect.name
+        if dialect_name == 'mssql':
+            return [batch.strip() for batch in _GO_PATTERN.split(script) if batch.strip()]
+        if dialect_name in ('mysql', 'mariadb'):
+            return split_sql_statements(script)
+        return [script]
+
+    def _apply_batches(self, migration: Migration) -> int:
+        with self.engine.begin() as connection:
+            start = time.perf_counter()
+            for batch in self._batches(migration.script):
+                connection.exec_driver_sql(batch)
+            duration_ms = int((time.perf_counter() - start) * 1000)
+            self._record(connection, migration, duration_ms)
+        return duration_ms
+
+    def migrate(self) -> list:
+        """Aplica as migrações pendentes e retorna as versões aplicadas nesta chamada."""
+        dialect_name = self.engine.dialect.name
+        migrations = self.discover()
+        if not migrations:
+            logging.info(f"Nenhuma migração disponível para '{dialect_name}'. Atualização de schema pulada.")
+            return []
+
+        start = time.perf_counter()
+        applied = self._prepare(migrations)
+        applied_versions = []
+        for migration in self.pending(migrations, applied):
+            logging.info(f"Aplicando migração {migration.version:04d} ({migration.description})...")
+            if dialect_name == 'sqlite':
+                duration_ms = self._apply_sqlite(migration)
+            else:
+                duration_ms = self._apply_batches(migration)
+            applied_versions.append(migration.version)
+            logging.info(f"Migração {migration.version:04d} aplicada em {duration_ms} ms.")
+
+        elapsed = time.perf_counter() - start
+        if applied_versions:
+            logging.info(f"{len(applied_versions)} migração(ões) aplicada(s) em {elapsed:.3f}s.")
+        else:
+            logging.info("Schema do banco já está na versão mais recente.")
+        return applied_versions
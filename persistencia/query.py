@@ -0,0 +1,142 @@
+import copy
+from sqlalchemy import select, func, bindparam, Integer
+
+from .schema import SchemaRegistry
+from .filters import as_filter
+from .repository import GenericRepository
+
+class TableQuery:
+    """
+    Consulta preguiçosa sobre uma tabela, obtida com GenericRepository.table('nome'); cada método devolve
+    uma nova consulta e nada é executado até to_pandas(), to_arrow(), count() ou iter_chunks().
+    """
+
+    def __init__(self, table_name: str):
+        self.table_name = table_name.lower()
+        self._columns = ()
+        self._criteria = None
+        self._joins = ()
+        self._order = ()
+        self._limit = None
+        self._offset = None
+
+    def __repr__(self):
+        return f"TableQuery({self.table_name!r}, shape={self._shape()!r})"
+
+    def _copy(self, **changes):
+        query = copy.copy(self)
+        for name, value in changes.items():
+            setattr(query, name, value)
+        return query
+
+    def select(self, *columns):
+        """Define as colunas da tabela principal (por padrão, todas)."""
+        return self._copy(_columns=tuple(SchemaRegistry.validate_columns(self.table_name, columns)))
+
+    def where(self, criteria=None, **equals):
+        """Acrescenta (com E) um Filter, um dict de igualdades ou igualdades nomeadas."""
+        new_filters = [as_filter(item) for item in (criteria, equals or None) if item]
+        if not new_filters:
+            return self
+        combined = self._criteria
+        for item in new_filters:
+            combined = item if combined is None else combined & item
+        SchemaRegistry.validate_columns(self.table_name, combined.columns())
+        return self._copy(_criteria=combined)
+
+    def join(self, table_name: str, left_on: str, right_on: str, columns=None, outer: bool = False):
+        """
+        Junta outra tabela por igualdade (left_on na principal, right_on na juntada).
+        columns é uma lista ou um dict {coluna: apelido} das colunas da tabela juntada a incluir.
+        """
+        SchemaRegistry.validate_columns(self.table_name, [left_on])
+        SchemaRegistry.validate_columns(table_name, [right_on])
+        if isinstance(columns, dict):
+            aliases = {col.lower(): alias for col, alias in columns.items()}
+        else:
+            aliases = {col.lower(): col.lower() for col in (columns or ())}
+        SchemaRegistry.validate_columns(table_name, aliases.keys())
+        join = (table_name.lower(), left_on.lower(), right_on.lower(), tuple(aliases.items()), bool(outer))
+        return self._copy(_joins=self._joins + (join,))
+
+    def order_by(self, *columns):
+        """Ordena pelas colunas informadas; prefixo '-' indica ordem decrescente (ex.: '-timestamp')."""
+        order = tuple((col[1:].lower(), True) if col.startswith('-') else (col.lower(), False) for col in columns)
+        aliases = {alias for join in self._joins for _, alias in join[3]}
+        SchemaRegistry.validate_columns(self.table_name, [col for col, _ in order if col not in aliases])
+        return self._copy(_order=self._order + order)
+
+    def limit(self, count: int):
+        return self._copy(_limit=int(count))
+
+    def offset(self, count: int):
+        return self._copy(_offset=int(count))
+
+    def _shape(self):
+        return (self.table_name, self._columns, self._criteria.shape() if self._criteria else None, self._joins,
+                self._order, self._limit is not None, self._offset is not None)
+
+    def _params(self) -> dict:
+        params = self._criteria.params() if self._criteria else {}
+        if self._limit is not None:
+            params['q_limit'] = self._limit
+        if self._offset is not None:
+            params['q_offset'] = self._offset
+        return params
+
+    def _build(self, engine):
+        table = SchemaRegistry.get_table(self.table_name, engine)
+        selected = [table.c[col] for col in self._columns] if self._columns else list(table.c)
+        from_clause = table
+        labeled = {}
+        for join_name, left_on, right_on, aliases, outer in self._joins:
+            joined = SchemaRegistry.get_table(join_name, engine)
+            for col, alias in aliases:
+                labeled[alias] = joined.c[col].label(alias)
+                selected.append(labeled[alias])
+            from_clause = from_clause.join(joined, table.c[left_on] == joined.c[right_on], isouter=outer)
+
+        statement = select(*selected).select_from(from_clause)
+        if self._criteria is not None:
+            statement = statement.where(self._criteria.to_clause(table))
+        for col, descending in self._order:
+            expression = labeled[col] if col in labeled else table.c[col]
+            statement = statement.order_by(expression.desc() if descending else expression)
+        if self._limit is not None:
+            statement = statement.limit(bindparam('q_limit', type_=Integer, literal_execute=True))
+        if self._offset is not None:
+            statement = statement.offset(bindparam('q_offset', type_=Integer, literal_execute=True))
+        return statement
+
+    def statement(self):
+        """Retorna o par (statement Core memorizado, parâmetros) da consulta."""
+        return SchemaRegistry._memoize(('query',) + self._shape(), self._build), self._params()
+
+    def count_statement(self):
+        """Retorna o par (SELECT COUNT(*) sobre a consulta, parâmetros)."""
+        def build(engine):
+            inner = self._build(engine)
+            if self._limit is None and self._offset is None:
+                inner = inner.order_by(None)
+            return select(func.count().label('total')).select_from(inner.subquery())
+
+        return SchemaRegistry._memoize(('count',) + self._shape(), build), self._params()
+
+    def to_pandas(self, use_cache: bool = True):
+        statement, params = self.statement()
+        return GenericRepository.execute_query_to_dataframe(statement, params=params or None, use_cache=use_cache)
+
+    def to_arrow(self, use_cache: bool = True):
+        statement, params = self.statement()
+        return GenericRepository.execute_query_to_arrow(statement, params=params or None, use_cache=use_cache)
+
+    def count(self) -> int:
+        """Conta as linhas da consulta no próprio banco."""
+        statement, params = self.count_statement()
+        df = GenericRepository.execute_query_to_dataframe(statement, params=params or None)
+        return int(df.iloc[0, 0]) if not df.empty else 0
+
+    def iter_chunks(self, chunk_size: int = 10000):
+        """Itera sobre a consulta em DataFrames de até chunk_size linhas, sem carregar tudo."""
+        statement, params = self.statement()
+        return GenericRepository.iter_query_dataframes(statement, params=params or None, chunk_size=chunk_size)
@@ -0,0 +1,213 @@
+import bisect
+import itertools
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict, Counter, deque
+from pathlib import Path
+from sqlalchemy import event
+
+import config
+from .cache import normalize_sql
+
+slow_query_logger = logging.getLogger("slow_query")
+
+def redact_parameters(parameters):
+    """Substitui os valores dos parâmetros pelo tipo (e tamanho, para textos), sem expor dados."""
+    if isinstance(parameters, dict):
+        return {key: redact_parameters(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [redact_parameters(value) for value in parameters]
+    if parameters is None:
+        return None
+    if isinstance(parameters, (str, bytes)):
+        return f"<{type(parameters).__name__}:{len(parameters)}>"
+    return f"<{type(parameters).__name__}>"
+
+class StatementStats:
+    """Estatísticas acumuladas de um statement: histograma de latência, linhas e origens."""
+
+    BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+    SAMPLE_SIZE = 512
+
+    def __init__(self, sql: str):
+        self.sql = sql
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.buckets = [0] * (len(self.BUCKETS_MS) + 1)
+        self.samples = deque(maxlen=self.SAMPLE_SIZE)
+        self.callers = Counter()
+
+    def add(self, elapsed_ms: float, rows, caller: str):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        if rows is not None and rows >= 0:
+            self.rows += rows
+        self.buckets[bisect.bisect_left(self.BUCKETS_MS, elapsed_ms)] += 1
+        self.samples.append(elapsed_ms)
+        if caller is not None:
+            self.callers[caller] += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Percentil aproximado pelas últimas SAMPLE_SIZE execuções."""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+    def as_dict(self) -> dict:
+        labels = [f"<={limit}ms" for limit in self.BUCKETS_MS] + [f">{self.BUCKETS_MS[-1]}ms"]
+        return {
+            'sql': self.sql,
+            'execucoes': self.count,
+            'total_ms': self.total_ms,
+            'media_ms': self.total_ms / self.count if self.count else 0.0,
+            'p50_ms': self.percentile(0.50),
+            'p95_ms': self.percentile(0.95),
+            'p99_ms': self.percentile(0.99),
+            'max_ms': self.max_ms,
+            'linhas': self.rows,
+            'origens': dict(self.callers.most_common(5)),
+            'histograma': dict(zip(labels, self.buckets)),
+        }
+
+class QueryMetrics:
+    """
+    Latência e linhas por statement nas engines do DatabaseManager; queries acima de SLOW_QUERY_THRESHOLD_MS
+    vão para SLOW_QUERY_LOG_PATH, criado na primeira delas. 'origens' é uma amostra (CALLER_SAMPLE_EVERY).
+    """
+
+    max_statements = 500
+    CALLER_SAMPLE_EVERY = 16
+    _executions = itertools.count()
+    _statements = OrderedDict()
+    _lock = threading.Lock()
+    _slow_log_handler = None
+
+    @classmethod
+    def install(cls, engine):
+        """Registra os eventos de medição na engine (idempotente)."""
+        if not config.QUERY_METRICS_ENABLED:
+            return
+        if not event.contains(engine, "before_cursor_execute", cls._before_execute):
+            event.listen(engine, "before_cursor_execute", cls._before_execute)
+            event.listen(engine, "after_cursor_execute", cls._after_execute)
+            event.listen(engine, "handle_error", cls._handle_error)
+
+    @classmethod
+    def _open_slow_query_log(cls):
+        """Cria o handler de arquivo do log de queries lentas na primeira query lenta."""
+        with cls._lock:
+            if cls._slow_log_handler is not None:
+                return
+            try:
+                log_path = Path(config.SLOW_QUERY_LOG_PATH)
+                log_path.parent.mkdir(parents=True, exist_ok=True)
+                handler = logging.FileHandler(log_path, mode='a', encoding='utf-8')
+                handler.setFormatter(logging.Formatter(config.LOG_FORMAT))
+            except OSError as e:
+                logging.error(f"Não foi possível criar o log de queries lentas: {e}")
+                handler = logging.NullHandler()
+            slow_query_logger.addHandler(handler)
+            slow_query_logger.setLevel(logging.WARNING)
+            slow_query_logger.propagate = False
+            cls._slow_log_handler = handler
+
+    @classmethod
+    def close_slow_query_log(cls):
+        """Fecha o log de queries lentas; a próxima query lenta o reabre em SLOW_QUERY_LOG_PATH."""
+        with cls._lock:
+            handler, cls._slow_log_handler = cls._slow_log_handler, None
+        if handler is not None:
+            slow_query_logger.removeHandler(handler)
+            handler.close()
+
+    @staticmethod
+    def caller() -> str:
+        """Identifica o controller (components.*) ou a página (pages/*) mais próxima na pilha."""
+        frame = sys._getframe(2)
+        while frame is not None:
+            module = frame.f_globals.get('__name__', '')
+            if module.startswith('components.'):
+                return f"{module.rpartition('.')[2]}.{frame.f_code.co_name}"
+            path = Path(frame.f_code.co_filename)
+            if path.parent.name == 'pages':
+                return path.stem
+            frame = frame.f_back
+        return 'desconhecido'
+
+    @classmethod
+    def _before_execute(cls, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_metrics', []).append((time.perf_counter(), statement))
+
+    @classmethod
+    def _after_execute(cls, conn, cursor, statement, parameters, context, executemany):
+        stack = conn.info.get('query_metrics')
+        if not stack:
+            return
+        start, _ = stack.pop()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        rows = cursor.rowcount if cursor.rowcount is not None and cursor.rowcount >= 0 else None
+        sql = normalize_sql(statement)
+        conn.info['query_metrics_last'] = sql if rows is None else None
+        slow = elapsed_ms >= config.SLOW_QUERY_THRESHOLD_MS
+        caller = None
+        if slow or next(cls._executions) % cls.CALLER_SAMPLE_EVERY == 0:
+            caller = cls.caller()
+        cls.record(sql, elapsed_ms, rows, caller)
+        if slow:
+            cls._open_slow_query_log()
+            slow_query_logger.warning(
+                f"{elapsed_ms:.1f} ms | linhas={rows if rows is not None else '?'} | origem={caller} | "
+                f"{sql} | parametros={redact_parameters(parameters)}")
+
+    @classmethod
+    def _handle_error(cls, context):
+        """Descarta a medição do statement que falhou, que não chega ao after_cursor_execute."""
+        connection = context.connection
+        if connection is None:
+            return
+        stack = connection.info.get('query_metrics')
+        if stack and stack[-1][1] == context.statement:
+            stack.pop()
+
+    @classmethod
+    def record(cls, sql: str, elapsed_ms: float, rows=None, caller: str = None):
+        with cls._lock:
+            stats = cls._statements.get(sql)
+            if stats is None:
+                stats = StatementStats(sql)
+                cls._statements[sql] = stats
+                while len(cls._statements) > cls.max_statements:
+                    cls._statements.popitem(last=False)
+            else:
+                cls._statements.move_to_end(sql)
+            stats.add(elapsed_ms, rows, caller)
+
+    @classmethod
+    def add_rows(cls, connection, rows: int):
+        """Soma as linhas lidas ao último statement executado na conexão (para drivers sem rowcount)."""
+        sql = connection.info.get('query_metrics_last')
+        if sql is None:
+            return
+        with cls._lock:
+            stats = cls._statements.get(sql)
+            if stats is not None:
+                stats.rows += rows
+
+    @classmethod
+    def snapshot(cls) -> list:
+        """Estatísticas de cada statement, da maior para a menor latência total."""
+        with cls._lock:
+            rows = [stats.as_dict() for stats in cls._statements.values()]
+        rows.sort(key=lambda row: row['total_ms'], reverse=True)
+        return rows
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._statements.clear()
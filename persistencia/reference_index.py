@@ -0,0 +1,67 @@
+import threading
+
+class ReferenceIndex:
+    """
+    Índices nome <-> id das tabelas de referência, carregados com uma query na primeira consulta
+    e descartados a cada escrita confirmada na tabela (invalidate).
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._versions = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._loads = 0
+        self._invalidations = 0
+
+    def get(self, table_name: str, loader, reload: bool = False):
+        """
+        Retorna (nome -> id, id -> nome) da tabela. 'loader(table_name)' devolve as linhas
+        (id, nome) e só é chamado quando o índice não está carregado ou quando reload=True.
+        """
+        table = table_name.lower()
+        with self._lock:
+            entry = None if reload else self._entries.get(table)
+            if entry is not None:
+                self._hits += 1
+                return entry
+            self._misses += 1
+            version = self._versions.get(table, 0)
+
+        rows = loader(table)
+        entry = ({name: row_id for row_id, name in rows}, {row_id: name for row_id, name in rows})
+        with self._lock:
+            self._loads += 1
+            if self._versions.get(table, 0) == version:
+                self._entries[table] = entry
+        return entry
+
+    def invalidate(self, *table_names):
+        """
+        Descarta o índice das tabelas escritas; a próxima consulta recarrega do banco.
+        Chamado por GenericRepository.register_write, sempre depois do commit.
+        """
+        with self._lock:
+            for name in table_names:
+                table = name.lower()
+                self._versions[table] = self._versions.get(table, 0) + 1
+                if self._entries.pop(table, None) is not None:
+                    self._invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Retorna os contadores de acertos, carregamentos e invalidações dos índices."""
+        with self._lock:
+            return {
+                'tables': {table: len(entry[0]) for table, entry in self._entries.items()},
+                'hits': self._hits,
+                'misses': self._misses,
+                'loads': self._loads,
+                'invalidations': self._invalidations,
+            }
+
+reference_index = ReferenceIndex()
@@ -1,8 +1,25 @@
+import base64
+import csv
+import importlib
+import io
+import itertools
+import json
+import sqlite3
+import threading
+import time
 import pandas as pd
+import pyarrow as pa
 from sqlalchemy import text, exc
+from sqlalchemy.dialects.postgresql import asyncpg as asyncpg_dialect
 import logging
 import config
 from .database import DatabaseManager
+from .cache import query_cache, QueryCache, normalize_sql, tables_in_query
+from .reference_index import reference_index
+from .schema import SchemaRegistry
+from .filters import Filter, Condition, or_ as filter_or
+from .index_advisor import IndexAdvisor
+from .query_metrics import QueryMetrics
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -12,36 +29,316 @@ class GenericRepository:
     Verifica se o banco está habilitado antes de cada operação.
     """
 
+    PAGINATION_KEYS = {'usuarios': 'login_usuario'}
+
+    CASCADE_DEPENDENTS = {'tipos_vegetais': ('vegetais',), 'usuarios': ('log_alteracoes',)}
+
+    REFERENCE_TABLES = {'tipos_vegetais': ['id', 'nome']}
+
+    _warm_up_lock = threading.Lock()
+    _warm_up_result = None
+
     @staticmethod
     def get_engine():
         """Retorna a instância do motor do DatabaseManager."""
         return DatabaseManager.get_engine()
 
     @staticmethod
-    def execute_query_to_dataframe(query: str, params: dict = None):
-        """Executa uma query e retorna um DataFrame com colunas minúsculas."""
+    def get_read_engine():
+        """Retorna a engine usada pelas leituras (pool somente leitura quando disponível)."""
+        return DatabaseManager.get_read_engine()
+
+    @staticmethod
+    def invalidate_cache(*table_names):
+        """
+        Descarta do cache de queries as leituras das tabelas (e das dependentes por cascata)
+        e os índices nome <-> id das tabelas de referência escritas.
+        """
+        affected = set()
+        for name in table_names:
+            affected.add(name.lower())
+            affected.update(GenericRepository.CASCADE_DEPENDENTS.get(name.lower(), ()))
+        query_cache.invalidate(*affected)
+        reference_index.invalidate(*table_names)
+
+    @staticmethod
+    def register_write(*table_names):
+        """
+        Deve ser chamado após cada escrita confirmada: invalida o cache das tabelas e faz
+        as próximas leituras da sessão irem ao primário (read-your-writes com réplicas).
+        """
+        GenericRepository.invalidate_cache(*table_names)
+        DatabaseManager.note_write()
+
+    @staticmethod
+    def _connect_for_read(engine):
+        """Abre uma conexão de leitura; se a réplica (ou o pool de leitura) falhar, usa o primário."""
+        try:
+            return engine.connect()
+        except exc.DBAPIError as e:
+            if not DatabaseManager.report_read_failure(engine):
+                raise
+            logging.warning(f"Falha ao conectar na engine de leitura, repetindo no primário. Erro: {e}")
+            return GenericRepository.get_engine().connect()
+
+    @staticmethod
+    def _run_read(engine, read):
+        """Executa read(connection) na engine de leitura, repetindo uma vez no primário se ela falhar."""
+        try:
+            with engine.connect() as connection:
+                return read(connection)
+        except exc.OperationalError as e:
+            if not DatabaseManager.report_read_failure(engine):
+                raise
+            logging.warning(f"Leitura falhou na engine de leitura, repetindo no primário. Erro: {e}")
+        with GenericRepository.get_engine().connect() as connection:
+            return read(connection)
+
+    @staticmethod
+    def warm_up(connections: int = 2) -> dict:
+        """
+        Abre conexões, reflete o schema e carrega os índices de REFERENCE_TABLES, uma vez por processo.
+        Chamadas seguintes retornam o resultado da primeira.
+        """
+        if not config.DATABASE_ENABLED:
+            return {}
+        with GenericRepository._warm_up_lock:
+            if GenericRepository._warm_up_result is not None:
+                return GenericRepository._warm_up_result
+            start = time.perf_counter()
+            result = {'conexoes': DatabaseManager.warm_up(connections)}
+            result['tabelas_refletidas'] = len(SchemaRegistry.reflect().tables)
+            for table_name in GenericRepository.REFERENCE_TABLES:
+                reference_index.get(table_name, GenericRepository._load_reference_rows)
+            result['tabelas_referencia'] = list(GenericRepository.REFERENCE_TABLES)
+            result['duracao_ms'] = (time.perf_counter() - start) * 1000
+            GenericRepository._warm_up_result = result
+            logging.info(f"Pré-aquecimento concluído em {result['duracao_ms']:.1f} ms: {result}")
+            return result
+
+    @staticmethod
+    def _load_reference_rows(table_name: str) -> list:
+        """Linhas (id, nome) de uma tabela de referência, lidas com uma única query fora do cache."""
+        id_column, name_column = GenericRepository.REFERENCE_TABLES[table_name]
+        df = GenericRepository.execute_query_to_dataframe(
+            SchemaRegistry.select_statement(table_name, [id_column, name_column]), use_cache=False)
+        if df.empty:
+            return []
+        return [(int(row_id), name) for row_id, name in zip(df[id_column], df[name_column])]
+
+    @staticmethod
+    def reference_id(table_name: str, name: str):
+        """
+        Id de uma linha de REFERENCE_TABLES pelo nome, via índice em memória; um nome ausente recarrega
+        o índice uma vez antes de retornar None.
+        """
+        names_to_ids, _ = reference_index.get(table_name, GenericRepository._load_reference_rows)
+        if name not in names_to_ids:
+            names_to_ids, _ = reference_index.get(table_name, GenericRepository._load_reference_rows, reload=True)
+        return names_to_ids.get(name)
+
+    @staticmethod
+    def reference_name(table_name: str, row_id: int):
+        """Nome de uma linha de tabela de referência pelo id; mesmo índice e recarga de reference_id."""
+        _, ids_to_names = reference_index.get(table_name, GenericRepository._load_reference_rows)
+        if row_id not in ids_to_names:
+            _, ids_to_names = reference_index.get(table_name, GenericRepository._load_reference_rows, reload=True)
+        return ids_to_names.get(row_id)
+
+    @staticmethod
+    def cache_stats() -> dict:
+        """Retorna os contadores do cache de queries e dos índices de referência do processo."""
+        stats = query_cache.stats()
+        stats['reference_index'] = reference_index.stats()
+        return stats
+
+    @staticmethod
+    def index_report(engine=None) -> pd.DataFrame:
+        """Varreduras completas nas queries executadas até aqui, com o índice sugerido (ver IndexAdvisor)."""
+        if not config.DATABASE_ENABLED:
+            return pd.DataFrame()
+        return IndexAdvisor.report_dataframe(engine)
+
+    @staticmethod
+    def _as_statement(query):
+        """Retorna o par (statement executável, SQL em texto) para uma string ou construção Core."""
+        if isinstance(query, str):
+            return text(query), query
+        return query, SchemaRegistry.statement_sql(query)
+
+    @staticmethod
+    def execute_query_to_dataframe(query, params: dict = None, use_cache: bool = True):
+        """
+        Executa uma query (SQL ou Core) e retorna um DataFrame com colunas minúsculas.
+        Leituras usam o cache de queries, exceto as servidas por réplica.
+        """
         if not config.DATABASE_ENABLED:
             logging.warning("Banco de dados desabilitado. A query não será executada.")
             return pd.DataFrame()
 
-        engine = GenericRepository.get_engine()
+        statement, query = GenericRepository._as_statement(query)
+        is_read = normalize_sql(query).lower().startswith(('select', 'with'))
+        cache_key = None
+        if use_cache and query_cache.enabled and is_read:
+            cache_key = QueryCache.make_key(query, params)
+            cached = query_cache.get(cache_key)
+            if cached is not None:
+                return cached.copy()
+            versions = query_cache.versions_for(tables_in_query(query))
+
+        engine = GenericRepository.get_read_engine() if is_read else GenericRepository.get_engine()
         if not engine:
             logging.error("Acesso ao banco falhou: engine não disponível.")
             return pd.DataFrame()
 
+        def read(connection):
+            df = pd.read_sql_query(statement, connection, params=params)
+            QueryMetrics.add_rows(connection, len(df))
+            df.columns = [str(col).lower() for col in df.columns]
+            return df
+
         try:
-            with engine.connect() as connection:
-                df = pd.read_sql_query(text(query), connection, params=params)
-                                                     
-                df.columns = [str(col).lower() for col in df.columns]
-                return df
+            if is_read:
+                df = GenericRepository._run_read(engine, read)
+            else:
+                with engine.connect() as connection:
+                    df = read(connection)
+            if cache_key is not None and not DatabaseManager.is_replica(engine):
+                query_cache.put(cache_key, df.copy(), versions)
+            return df
         except exc.SQLAlchemyError as e:
             logging.error(f"Erro ao executar a query: {query}\nErro: {e}")
             raise
 
     @staticmethod
-    def write_dataframe_to_table(df: pd.DataFrame, table_name: str):
-        """Escreve um DataFrame em uma tabela (espera nome da tabela minúsculo)."""
+    def _fetch_arrow_adbc(engine, statement, params: dict):
+        """
+        Lê o resultado como pyarrow.Table pelo driver ADBC da engine recebida (SQLite/PostgreSQL).
+        Retorna None sem driver ADBC ou se a leitura falhar, para seguir pelo cursor.
+        """
+        dialect_name = engine.dialect.name
+        if dialect_name == 'sqlite' and engine.url.database not in (None, '', ':memory:'):
+            module_name, uri, compile_dialect = 'adbc_driver_sqlite.dbapi', engine.url.database, engine.dialect
+        elif dialect_name == 'postgresql':
+            module_name = 'adbc_driver_postgresql.dbapi'
+            uri = engine.url.set(drivername='postgresql').render_as_string(hide_password=False)
+            compile_dialect = asyncpg_dialect.dialect()
+        else:
+            return None
+        try:
+            adbc = importlib.import_module(module_name)
+        except ImportError:
+            return None
+
+        bound = statement.params(**params) if params else statement
+        compiled = bound.compile(dialect=compile_dialect, compile_kwargs={'render_postcompile': True})
+        positional = [compiled.params[name] for name in (compiled.positiontup or [])]
+        try:
+            with adbc.connect(uri) as connection:
+                with connection.cursor() as cursor:
+                    cursor.execute(compiled.string, positional or None)
+                    return cursor.fetch_arrow_table()
+        except adbc.Error as e:
+            logging.warning(f"Leitura ADBC falhou em '{engine.url.render_as_string(hide_password=True)}'; "
+                            f"usando o cursor da engine. Erro: {e}")
+            return None
+
+    @staticmethod
+    def _fetch_arrow_rows(engine, statement, params: dict):
+        """Fallback vetorizado: transpõe as tuplas do cursor em colunas e monta os arrays Arrow."""
+        def read(connection):
+            result = connection.execute(statement, params or {})
+            rows = result.fetchall()
+            QueryMetrics.add_rows(connection, len(rows))
+            return list(result.keys()), rows
+
+        names, rows = GenericRepository._run_read(engine, read)
+        if not rows:
+            return pa.table({name: pa.array([], type=pa.null()) for name in names})
+        return pa.Table.from_arrays([pa.array(column) for column in zip(*rows)], names=names)
+
+    @staticmethod
+    def execute_query_to_arrow(query, params: dict = None, use_cache: bool = True):
+        """
+        Executa uma query (SQL ou Core) e retorna um pyarrow.Table com colunas minúsculas, sem DataFrame.
+        Usa o driver ADBC quando disponível.
+        """
+        if not config.DATABASE_ENABLED:
+            logging.warning("Banco de dados desabilitado. A query não será executada.")
+            return pa.table({})
+
+        statement, query = GenericRepository._as_statement(query)
+        cache_key = None
+        if use_cache and query_cache.enabled:
+            cache_key = ('arrow',) + QueryCache.make_key(query, params)
+            cached = query_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            versions = query_cache.versions_for(tables_in_query(query))
+
+        engine = GenericRepository.get_read_engine()
+        if not engine:
+            logging.error("Acesso ao banco falhou: engine não disponível.")
+            return pa.table({})
+
+        try:
+            table = GenericRepository._fetch_arrow_adbc(engine, statement, params)
+            if table is None:
+                table = GenericRepository._fetch_arrow_rows(engine, statement, params)
+        except exc.SQLAlchemyError as e:
+            logging.error(f"Erro ao executar a query (Arrow): {query}\nErro: {e}")
+            raise
+        table = table.rename_columns([str(name).lower() for name in table.column_names])
+        if cache_key is not None and not DatabaseManager.is_replica(engine):
+            query_cache.put(cache_key, table, versions)
+        return table
+
+    @staticmethod
+    def iter_query_dataframes(query, params: dict = None, chunk_size: int = 10000):
+        """
+        Gera DataFrames de até 'chunk_size' linhas com cursor do lado do servidor, limitando a memória a um bloco.
+        Falhas da réplica no meio da leitura são propagadas (blocos entregues não se repetem).
+        """
+        if not config.DATABASE_ENABLED:
+            logging.warning("Banco de dados desabilitado. A query não será executada.")
+            return
+
+        engine = GenericRepository.get_read_engine()
+        if not engine:
+            logging.error("Acesso ao banco falhou: engine não disponível.")
+            return
+
+        chunk_size = int(chunk_size)
+        if chunk_size <= 0:
+            raise ValueError("O tamanho do bloco deve ser maior que zero.")
+
+        statement, query = GenericRepository._as_statement(query)
+        try:
+            with GenericRepository._connect_for_read(engine) as connection:
+                engine = connection.engine
+                streaming = connection.execution_options(stream_results=True, yield_per=chunk_size)
+                result = streaming.execute(statement, params or {})
+                columns = [str(col).lower() for col in result.keys()]
+                for rows in result.partitions(chunk_size):
+                    QueryMetrics.add_rows(connection, len(rows))
+                    yield pd.DataFrame.from_records(rows, columns=columns)
+        except exc.OperationalError as e:
+            DatabaseManager.report_read_failure(engine)
+            logging.error(f"Erro ao executar a query em blocos: {query}\nErro: {e}")
+            raise
+        except exc.SQLAlchemyError as e:
+            logging.error(f"Erro ao executar a query em blocos: {query}\nErro: {e}")
+            raise
+
+    @staticmethod
+    def write_dataframe_to_table(df: pd.DataFrame, table_name: str, bulk: bool = False, chunk_size: int = None):
+        """
+        Escreve um DataFrame em uma tabela (espera nome da tabela minúsculo).
+        Com bulk=True delega para bulk_load_dataframe e retorna suas estatísticas.
+        """
+        if bulk:
+            return GenericRepository.bulk_load_dataframe(df, table_name, chunk_size=chunk_size)
+
         if not config.DATABASE_ENABLED:
             logging.warning(f"Banco de dados desabilitado. Nenhum dado será escrito em '{table_name}'.")
             return
@@ -51,12 +348,15 @@ class GenericRepository:
             logging.error(f"Escrita em '{table_name}' falhou: engine não disponível.")
             return
 
+        records = GenericRepository._dataframe_to_records(df)
+        if not records:
+            return
+        statement = SchemaRegistry.insert_statement(table_name, records[0].keys())
+
         try:
-                                                                                
-            df_to_write = df.copy()
-            df_to_write.columns = [str(col).lower() for col in df_to_write.columns]
-                                                                      
-            df_to_write.to_sql(table_name, con=engine, if_exists='append', index=False)
+            with engine.begin() as connection:
+                connection.execute(statement, records)
+            GenericRepository.register_write(table_name)
             logging.info(f"{len(df)} registros inseridos com sucesso na tabela '{table_name}'.")
         except exc.SQLAlchemyError as e:
                                                    
@@ -64,40 +364,300 @@ class GenericRepository:
             raise
 
     @staticmethod
-    def update_table(table_name: str, update_values: dict, where_conditions: dict):
-        """Atualiza registros em uma tabela (espera nome da tabela e chaves minúsculas)."""
-        if not config.DATABASE_ENABLED:
-            logging.warning(f"Banco de dados desabilitado. Nenhum dado será atualizado em '{table_name}'.")
+    def _copy_from_stdin(table, conn, keys, data_iter):
+        """Método de inserção do to_sql que usa COPY FROM STDIN do psycopg2 (PostgreSQL)."""
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(data_iter)
+        buffer.seek(0)
+        columns = ", ".join(f'"{key}"' for key in keys)
+        target = f"{table.schema}.{table.name}" if table.schema else table.name
+        with conn.connection.cursor() as cursor:
+            cursor.copy_expert(f"COPY {target} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+
+    @staticmethod
+    def _insert_multi_values(table, conn, keys, data_iter):
+        """
+        Método de inserção do to_sql que envia cada bloco como um único INSERT com
+        múltiplos VALUES direto pelo cursor DBAPI, sem compilar um statement por bloco.
+        """
+        rows = list(data_iter)
+        if not rows:
             return
+        preparer = conn.dialect.identifier_preparer
+        placeholder = '?' if conn.dialect.paramstyle == 'qmark' else '%s'
+        columns = ", ".join(preparer.quote(key) for key in keys)
+        row_values = "(" + ", ".join([placeholder] * len(keys)) + ")"
+        statement = (f"INSERT INTO {preparer.format_table(table.table)} ({columns}) "
+                     f"VALUES {', '.join([row_values] * len(rows))}")
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute(statement, list(itertools.chain.from_iterable(rows)))
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _bulk_strategy(engine, column_count: int, chunk_size: int):
+        """Escolhe o método do to_sql e o tamanho do bloco para o dialeto ativo."""
+        dialect_name = engine.dialect.name
+        if dialect_name == 'postgresql' and engine.dialect.driver == 'psycopg2':
+            return 'copy', GenericRepository._copy_from_stdin, chunk_size
+        if engine.dialect.paramstyle in ('qmark', 'format', 'pyformat'):
+            if dialect_name in ('mysql', 'mariadb'):
+                return 'multi-values', GenericRepository._insert_multi_values, chunk_size
+            if dialect_name == 'sqlite':
+                max_variables = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+                rows_per_chunk = max(1, min(chunk_size, max_variables // max(column_count, 1)))
+                return 'multi-values', GenericRepository._insert_multi_values, rows_per_chunk
+        return 'executemany', None, chunk_size
+
+    @staticmethod
+    def bulk_load_dataframe(df: pd.DataFrame, table_name: str, chunk_size: int = None):
+        """
+        Carga em massa de um DataFrame numa transação (COPY no PostgreSQL, INSERT multi-VALUES no
+        MySQL/MariaDB/SQLite, executemany nos demais). Retorna as estatísticas da carga.
+        """
+        stats = {'rows': 0, 'seconds': 0.0, 'rows_per_second': 0.0, 'method': None}
+        if not config.DATABASE_ENABLED:
+            logging.warning(f"Banco de dados desabilitado. Nenhum dado será escrito em '{table_name}'.")
+            return stats
 
         engine = GenericRepository.get_engine()
         if not engine:
-            logging.error(f"Update em '{table_name}' falhou: engine não disponível.")
-            return
+            logging.error(f"Carga em massa em '{table_name}' falhou: engine não disponível.")
+            return stats
+
+        df_to_write = df.copy()
+        df_to_write.columns = SchemaRegistry.validate_columns(table_name, df_to_write.columns)
+        method_name, method, rows_per_chunk = GenericRepository._bulk_strategy(
+            engine, len(df_to_write.columns), int(chunk_size or config.BULK_INSERT_CHUNK_SIZE))
+        stats['method'] = method_name
+
+        start = time.perf_counter()
+        try:
+            with engine.begin() as connection:
+                df_to_write.to_sql(table_name, con=connection, if_exists='append', index=False,
+                                   method=method, chunksize=rows_per_chunk)
+        except (exc.SQLAlchemyError, engine.dialect.loaded_dbapi.Error) as e:
+            logging.error(f"Erro na carga em massa da tabela '{table_name}'. Colunas do DF: {list(df.columns)}. Erro: {e}")
+            raise
+        GenericRepository.register_write(table_name)
+
+        elapsed = time.perf_counter() - start
+        stats.update({
+            'rows': len(df_to_write),
+            'seconds': elapsed,
+            'rows_per_second': (len(df_to_write) / elapsed) if elapsed > 0 else 0.0,
+        })
+        logging.info(f"Carga em massa ({method_name}) de {stats['rows']} registros em '{table_name}' "
+                     f"concluída em {elapsed:.2f}s ({stats['rows_per_second']:.0f} linhas/s).")
+        return stats
 
+    @staticmethod
+    def _select_with_params(table_name: str, columns, where_conditions):
+        """Retorna (statement, params) do SELECT para where_conditions em dict ou Filter."""
+        if isinstance(where_conditions, Filter):
+            statement = SchemaRegistry.select_statement(table_name, columns, criteria=where_conditions)
+            return statement, where_conditions.params()
+        params = {k.lower(): v for k, v in (where_conditions or {}).items()}
+        return SchemaRegistry.select_statement(table_name, columns, params.keys()), params
+
+    @staticmethod
+    def _update_with_params(table_name: str, update_values: dict, where_conditions):
+        """Retorna (statement, params) do UPDATE para where_conditions em dict ou Filter."""
         update_values_lower = {k.lower(): v for k, v in update_values.items()}
-        where_conditions_lower = {k.lower(): v for k, v in where_conditions.items()}
+        params = {f'val_{k}': v for k, v in update_values_lower.items()}
+        if isinstance(where_conditions, Filter):
+            statement = SchemaRegistry.update_statement(table_name, update_values_lower.keys(), (),
+                                                        set_prefix='val_', where_prefix='wh_',
+                                                        criteria=where_conditions)
+            params.update(where_conditions.params('wh_'))
+        else:
+            where_conditions_lower = {k.lower(): v for k, v in where_conditions.items()}
+            statement = SchemaRegistry.update_statement(table_name, update_values_lower.keys(),
+                                                        where_conditions_lower.keys(), set_prefix='val_',
+                                                        where_prefix='wh_')
+            params.update({f'wh_{k}': v for k, v in where_conditions_lower.items()})
+        return statement, params
+
+    @staticmethod
+    def _delete_with_params(table_name: str, where_conditions):
+        """Retorna (statement, params) do DELETE para where_conditions em dict ou Filter."""
+        if isinstance(where_conditions, Filter):
+            return SchemaRegistry.delete_statement(table_name, (), criteria=where_conditions), where_conditions.params()
+        params = {k.lower(): v for k, v in where_conditions.items()}
+        return SchemaRegistry.delete_statement(table_name, params.keys()), params
 
-        set_clause = ", ".join([f"{key} = :{key}_val" for key in update_values_lower.keys()])
-        where_clause = " AND ".join([f"{key} = :wh_{key}" for key in where_conditions_lower.keys()])
+    @staticmethod
+    def _require_where(table_name: str, where_conditions, operation: str):
+        """Recusa UPDATE/DELETE sem condições, que atingiriam todas as linhas da tabela."""
+        if isinstance(where_conditions, Filter):
+            empty = not where_conditions.conditions()
+        else:
+            empty = not where_conditions
+        if empty:
+            raise ValueError(f"{operation} em '{table_name}' exige where_conditions não vazio "
+                             f"(a operação atingiria todas as linhas).")
 
-        params = {f'{k}_val': v for k, v in update_values_lower.items()}
-        params.update({f'wh_{k}': v for k, v in where_conditions_lower.items()})
+    @staticmethod
+    def update_table(table_name: str, update_values: dict, where_conditions):
+        """
+        Atualiza registros em uma tabela (espera nome da tabela e chaves minúsculas).
+        where_conditions é um dict de igualdades ou um Filter e não pode ser vazio.
+        """
+        GenericRepository._require_where(table_name, where_conditions, 'Update')
+        if not config.DATABASE_ENABLED:
+            logging.warning(f"Banco de dados desabilitado. Nenhum dado será atualizado em '{table_name}'.")
+            return
+
+        engine = GenericRepository.get_engine()
+        if not engine:
+            logging.error(f"Update em '{table_name}' falhou: engine não disponível.")
+            return
 
-        query = f"UPDATE {table_name} SET {set_clause} WHERE {where_clause}"
+        statement, params = GenericRepository._update_with_params(table_name, update_values, where_conditions)
 
         try:
             with engine.connect() as connection:
                 with connection.begin():
-                    connection.execute(text(query), params)
+                    connection.execute(statement, params)
+            GenericRepository.register_write(table_name)
             logging.info(f"Tabela '{table_name}' atualizada com sucesso.")
         except exc.SQLAlchemyError as e:
             logging.error(f"Erro ao atualizar a tabela '{table_name}': {e}")
             raise
 
     @staticmethod
-    def delete_from_table(table_name: str, where_conditions: dict):
-        """Deleta registros de uma tabela (espera nome da tabela e chaves minúsculas)."""
+    def _dataframe_to_records(df: pd.DataFrame) -> list:
+        """Converte um DataFrame em lista de dicts com chaves minúsculas, trocando NaN por None."""
+        df_lower = df.copy()
+        df_lower.columns = [str(col).lower() for col in df_lower.columns]
+        df_lower = df_lower.astype(object).where(pd.notna(df_lower), None)
+        return df_lower.to_dict(orient='records')
+
+    @staticmethod
+    def _split_key_columns(table_name: str, df: pd.DataFrame, key_columns: list):
+        """Valida as colunas (contra o schema refletido) e separa as colunas que serão atualizadas."""
+        keys = [key.lower() for key in key_columns]
+        columns = SchemaRegistry.validate_columns(table_name, df.columns)
+        missing = [key for key in keys if key not in columns]
+        if not keys or missing:
+            raise ValueError(f"Colunas-chave ausentes no DataFrame: {missing or key_columns}")
+        return keys, [col for col in columns if col not in keys]
+
+    @staticmethod
+    def _upsert_query(dialect_name: str, table_name: str, columns: list, keys: list, updates: list) -> str:
+        """Monta o upsert nativo do dialeto (ON CONFLICT, ON DUPLICATE KEY, MERGE ou UPDATE OR INSERT)."""
+        cols_str = ", ".join(columns)
+        values_str = ", ".join(f":{col}" for col in columns)
+        if dialect_name in ('postgresql', 'sqlite'):
+            action = "DO NOTHING"
+            if updates:
+                action = "DO UPDATE SET " + ", ".join(f"{col} = excluded.{col}" for col in updates)
+            return (f"INSERT INTO {table_name} ({cols_str}) VALUES ({values_str}) "
+                    f"ON CONFLICT ({', '.join(keys)}) {action}")
+        if dialect_name in ('mysql', 'mariadb'):
+            assignments = ", ".join(f"{col} = VALUES({col})" for col in (updates or keys[:1]))
+            return f"INSERT INTO {table_name} ({cols_str}) VALUES ({values_str}) ON DUPLICATE KEY UPDATE {assignments}"
+        if dialect_name in ('mssql', 'oracle'):
+            source_cols = ", ".join(f":{col} AS {col}" for col in columns)
+            source = f"SELECT {source_cols}" + (" FROM dual" if dialect_name == 'oracle' else "")
+            alias = " " if dialect_name == 'oracle' else " AS "
+            match = " AND ".join(f"tgt.{key} = src.{key}" for key in keys)
+            query = f"MERGE INTO {table_name}{alias}tgt USING ({source}){alias}src ON ({match})"
+            if updates:
+                query += " WHEN MATCHED THEN UPDATE SET " + ", ".join(f"tgt.{col} = src.{col}" for col in updates)
+            query += (f" WHEN NOT MATCHED THEN INSERT ({cols_str}) "
+                      f"VALUES ({', '.join(f'src.{col}' for col in columns)})")
+            return query + (";" if dialect_name == 'mssql' else "")
+        if dialect_name == 'firebird':
+            return (f"UPDATE OR INSERT INTO {table_name} ({cols_str}) VALUES ({values_str}) "
+                    f"MATCHING ({', '.join(keys)})")
+        raise ValueError(f"Upsert não suportado para o dialeto '{dialect_name}'.")
+
+    @staticmethod
+    def update_many(table_name: str, df: pd.DataFrame, key_columns: list):
+        """
+        Atualiza várias linhas, localizadas pelas colunas-chave, com um único executemany em uma transação.
+        Retorna {'rows': linhas enviadas, 'affected': linhas afetadas}.
+        """
+        result = {'rows': 0, 'affected': 0}
+        if not config.DATABASE_ENABLED:
+            logging.warning(f"Banco de dados desabilitado. Nenhum dado será atualizado em '{table_name}'.")
+            return result
+
+        engine = GenericRepository.get_engine()
+        if not engine:
+            logging.error(f"Update em massa em '{table_name}' falhou: engine não disponível.")
+            return result
+
+        keys, updates = GenericRepository._split_key_columns(table_name, df, key_columns)
+        if not updates:
+            raise ValueError("Nenhuma coluna para atualizar além das colunas-chave.")
+        records = GenericRepository._dataframe_to_records(df)
+        if not records:
+            return result
+
+        statement = SchemaRegistry.update_statement(table_name, updates, keys, set_prefix='val_', where_prefix='wh_')
+        params = [{**{f'val_{col}': row[col] for col in updates}, **{f'wh_{key}': row[key] for key in keys}}
+                  for row in records]
+
+        try:
+            with engine.begin() as connection:
+                cursor_result = connection.execute(statement, params)
+            GenericRepository.register_write(table_name)
+        except exc.SQLAlchemyError as e:
+            logging.error(f"Erro no update em massa da tabela '{table_name}': {e}")
+            raise
+
+        result.update({'rows': len(records), 'affected': max(cursor_result.rowcount, 0)})
+        logging.info(f"Update em massa em '{table_name}': {result['rows']} linhas enviadas, "
+                     f"{result['affected']} afetadas.")
+        return result
+
+    @staticmethod
+    def upsert_many(table_name: str, df: pd.DataFrame, key_columns: list):
+        """
+        Insere ou atualiza várias linhas em uma transação com o upsert nativo do dialeto (chaves UNIQUE/PK).
+        Retorna {'rows': linhas enviadas, 'affected': linhas afetadas}.
+        """
+        result = {'rows': 0, 'affected': 0}
+        if not config.DATABASE_ENABLED:
+            logging.warning(f"Banco de dados desabilitado. Nenhum dado será gravado em '{table_name}'.")
+            return result
+
+        engine = GenericRepository.get_engine()
+        if not engine:
+            logging.error(f"Upsert em '{table_name}' falhou: engine não disponível.")
+            return result
+
+        keys, updates = GenericRepository._split_key_columns(table_name, df, key_columns)
+        records = GenericRepository._dataframe_to_records(df)
+        if not records:
+            return result
+
+        columns = list(records[0].keys())
+        query = GenericRepository._upsert_query(engine.dialect.name, table_name, columns, keys, updates)
+
+        try:
+            with engine.begin() as connection:
+                cursor_result = connection.execute(text(query), records)
+            GenericRepository.register_write(table_name)
+        except exc.SQLAlchemyError as e:
+            logging.error(f"Erro no upsert em massa da tabela '{table_name}': {e}")
+            raise
+
+        result.update({'rows': len(records), 'affected': max(cursor_result.rowcount, 0)})
+        logging.info(f"Upsert em massa em '{table_name}': {result['rows']} linhas enviadas, "
+                     f"{result['affected']} afetadas.")
+        return result
+
+    @staticmethod
+    def delete_from_table(table_name: str, where_conditions):
+        """
+        Deleta registros de uma tabela (espera nome da tabela e chaves minúsculas).
+        where_conditions é um dict de igualdades ou um Filter e não pode ser vazio.
+        """
+        GenericRepository._require_where(table_name, where_conditions, 'Delete')
         if not config.DATABASE_ENABLED:
             logging.warning(f"Banco de dados desabilitado. Nenhum dado será deletado de '{table_name}'.")
             return
@@ -107,53 +667,153 @@ class GenericRepository:
             logging.error(f"Delete em '{table_name}' falhou: engine não disponível.")
             return
 
-        where_conditions_lower = {k.lower(): v for k, v in where_conditions.items()}
-
-        where_clause = " AND ".join([f"{key} = :{key}" for key in where_conditions_lower.keys()])
-        params = where_conditions_lower
-
-        query = f"DELETE FROM {table_name} WHERE {where_clause}"
+        statement, params = GenericRepository._delete_with_params(table_name, where_conditions)
 
         try:
             with engine.connect() as connection:
                 with connection.begin():
-                    connection.execute(text(query), params)
+                    connection.execute(statement, params)
+            GenericRepository.register_write(table_name)
             logging.info(f"Registros da tabela '{table_name}' deletados com sucesso.")
         except exc.SQLAlchemyError as e:
             logging.error(f"Erro ao deletar da tabela '{table_name}': {e}")
             raise
 
+    @staticmethod
+    def table(table_name: str):
+        """
+        Retorna uma consulta preguiçosa (TableQuery) sobre a tabela, que pode ser refinada com
+        select/where/join/order_by/limit/offset e só é executada em to_pandas, to_arrow, count ou iter_chunks.
+        """
+        from .query import TableQuery
+        return TableQuery(table_name)
+
+    @staticmethod
+    def _vegetais_com_tipo_base():
+        return (GenericRepository.table('vegetais')
+                .select('id', 'nome')
+                .join('tipos_vegetais', 'id_tipo', 'id', columns={'nome': 'tipo'}, outer=True))
+
+    @staticmethod
+    def vegetais_com_tipo_query():
+        """Vegetais com o nome do tipo (LEFT JOIN em tipos_vegetais), ordenados por nome."""
+        return GenericRepository._vegetais_com_tipo_base().order_by('nome')
+
     @staticmethod
     def read_vegetais_com_tipo():
         """Busca todos os vegetais com o nome do tipo (usa nomes minúsculos)."""
-                                                 
-        query = """
-                SELECT v.id, v.nome, tv.nome as tipo
-                FROM vegetais v
-                         LEFT JOIN tipos_vegetais tv ON v.id_tipo = tv.id
-                ORDER BY v.nome;
-                """
-        return GenericRepository.execute_query_to_dataframe(query)
+        if not config.DATABASE_ENABLED:
+            return pd.DataFrame()
+        return GenericRepository.vegetais_com_tipo_query().to_pandas()
 
     @staticmethod
-    def read_table_to_dataframe(table_name: str, columns: list = None, where_conditions: dict = None):
-        """Lê dados de uma tabela (espera nome da tabela minúsculo) e retorna DataFrame."""
+    def read_vegetais_com_tipo_arrow():
+        """Mesma consulta de read_vegetais_com_tipo, retornada como pyarrow.Table."""
+        if not config.DATABASE_ENABLED:
+            return pa.table({})
+        return GenericRepository.vegetais_com_tipo_query().to_arrow()
+
+    @staticmethod
+    def read_vegetais_com_tipo_page(page_size: int = 50, cursor: str = None):
+        """
+        Uma página de read_vegetais_com_tipo_arrow (pyarrow.Table) em ordem de nome, com paginação
+        keyset em (nome, id). Retorna (tabela, próximo_cursor); o cursor é None na última página.
+        """
+        if not config.DATABASE_ENABLED:
+            return pa.table({}), None
+        return GenericRepository._seek_page(GenericRepository._vegetais_com_tipo_base(), ('nome', 'id'),
+                                            page_size, cursor, arrow=True)
+
+    @staticmethod
+    def read_table_to_dataframe(table_name: str, columns: list = None, where_conditions=None):
+        """
+        Lê dados de uma tabela (espera nome da tabela minúsculo) e retorna DataFrame.
+        where_conditions é um dict de igualdades ou um Filter, aplicado no próprio banco.
+        """
         if not config.DATABASE_ENABLED:
             return pd.DataFrame()
 
-        cols_str = "*"
-        if columns:
-             cols_lower = [col.lower() for col in columns]
-             cols_str = ", ".join(cols_lower)
+        statement, params = GenericRepository._select_with_params(table_name, columns, where_conditions)
+        return GenericRepository.execute_query_to_dataframe(statement, params=params or None)
 
-        query = f"SELECT {cols_str} FROM {table_name}"
+    @staticmethod
+    def _encode_cursor(key_columns, last_values) -> str:
+        """Serializa as últimas chaves lidas em um cursor opaco (base64 url-safe)."""
+        values = [value.item() if hasattr(value, 'item') else value for value in last_values]
+        payload = json.dumps({'k': list(key_columns), 'v': values}, default=str)
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
 
-        params_lower = None
-        if where_conditions:
-                                                                              
-            where_conditions_lower = {k.lower(): v for k, v in where_conditions.items()}
-            conditions = " AND ".join([f"{key} = :{key}" for key in where_conditions_lower.keys()])
-            query += f" WHERE {conditions}"
-            params_lower = where_conditions_lower                                         
+    @staticmethod
+    def _decode_cursor(cursor: str, key_columns) -> list:
+        """Recupera as últimas chaves lidas a partir de um cursor gerado por _encode_cursor."""
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8'))
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Cursor de paginação inválido: {cursor!r}") from e
+        if (not isinstance(payload, dict) or payload.get('k') != list(key_columns)
+                or not isinstance(payload.get('v'), list) or len(payload['v']) != len(key_columns)):
+            raise ValueError(f"Cursor de paginação não pertence às chaves {list(key_columns)}.")
+        return payload['v']
 
-        return GenericRepository.execute_query_to_dataframe(query, params=params_lower)
\ No newline at end of file
+    @staticmethod
+    def _seek_condition(key_columns, last_values, descending: bool) -> Filter:
+        """(k1 > v1) OU (k1 = v1 E k2 > v2) ...: linhas depois da última lida na ordem de key_columns."""
+        operator = 'lt' if descending else 'gt'
+        clauses = []
+        for index, column in enumerate(key_columns):
+            clause = Condition(column, operator, last_values[index])
+            for previous_column, previous_value in zip(key_columns[:index], last_values[:index]):
+                clause = Condition(previous_column, 'eq', previous_value) & clause
+            clauses.append(clause)
+        return clauses[0] if len(clauses) == 1 else filter_or(*clauses)
+
+    @staticmethod
+    def _seek_page(query, key_columns: tuple, page_size: int, cursor: str = None, descending: bool = False,
+                   arrow: bool = False):
+        """
+        Página de 'query' por paginação keyset em key_columns (combinação única), lendo page_size + 1 linhas.
+        Retorna (DataFrame ou pyarrow.Table, próximo_cursor ou None).
+        """
+        page_size = int(page_size)
+        if page_size <= 0:
+            raise ValueError("O tamanho da página deve ser maior que zero.")
+        if cursor:
+            last_values = GenericRepository._decode_cursor(cursor, key_columns)
+            query = query.where(GenericRepository._seek_condition(key_columns, last_values, descending))
+        prefix = '-' if descending else ''
+        query = query.order_by(*[f"{prefix}{column}" for column in key_columns]).limit(page_size + 1)
+
+        if arrow:
+            page = query.to_arrow()
+            if page.num_rows <= page_size:
+                return page, None
+            page = page.slice(0, page_size)
+            last_values = [page.column(column)[page_size - 1].as_py() for column in key_columns]
+        else:
+            page = query.to_pandas()
+            if len(page) <= page_size:
+                return page, None
+            page = page.iloc[:page_size]
+            last_values = [page.iloc[-1][column] for column in key_columns]
+        return page, GenericRepository._encode_cursor(key_columns, last_values)
+
+    @staticmethod
+    def read_table_page(table_name: str, page_size: int = 50, cursor: str = None, columns: list = None,
+                        where_conditions=None, key_column: str = None, descending: bool = False):
+        """
+        Página de uma tabela por paginação keyset na chave primária (PAGINATION_KEYS ou 'id').
+        Retorna (DataFrame, próximo_cursor); o cursor é None na última página.
+        """
+        if not config.DATABASE_ENABLED:
+            return pd.DataFrame(), None
+
+        key_column = (key_column or GenericRepository.PAGINATION_KEYS.get(table_name, 'id')).lower()
+        query = GenericRepository.table(table_name)
+        if columns:
+            cols_lower = [col.lower() for col in columns]
+            if key_column not in cols_lower:
+                cols_lower.insert(0, key_column)
+            query = query.select(*cols_lower)
+        if where_conditions:
+            query = query.where(where_conditions)
+        return GenericRepository._seek_page(query, (key_column,), page_size, cursor, descending=descending)
@@ -0,0 +1,165 @@
+import logging
+import threading
+from sqlalchemy import MetaData, Table, select, insert, update, delete, bindparam, and_
+from sqlalchemy.exc import NoSuchTableError
+
+from .database import DatabaseManager
+
+class SchemaRegistry:
+    """
+    Metadados das tabelas do sistema, refletidos uma vez por engine, e statements Core memorizados
+    com bindparams nomeados.
+    """
+
+    TABLES = ('usuarios', 'tipos_vegetais', 'vegetais', 'log_alteracoes', 'especie_gatos')
+
+    _metadata = {}
+    _statements = {}
+    _statement_sql = {}
+    _lock = threading.RLock()
+
+    @classmethod
+    def reflect(cls, engine=None) -> MetaData:
+        """Reflete as tabelas do sistema para a engine (apenas na primeira chamada)."""
+        engine = engine or DatabaseManager.get_engine()
+        with cls._lock:
+            metadata = cls._metadata.get(engine)
+            if metadata is None:
+                metadata = MetaData()
+                metadata.reflect(bind=engine, only=lambda name, _: name.lower() in cls.TABLES)
+                cls._metadata[engine] = metadata
+                logging.info(f"Schema refletido para '{engine.dialect.name}': {sorted(metadata.tables)}")
+            return metadata
+
+    @classmethod
+    def reset(cls):
+        """Descarta metadados e statements memorizados (ex.: após uma migração de schema)."""
+        with cls._lock:
+            cls._metadata.clear()
+            cls._statements.clear()
+            cls._statement_sql.clear()
+
+    @classmethod
+    def get_table(cls, table_name: str, engine=None) -> Table:
+        """Retorna o objeto Table refletido; tabelas fora do registro são refletidas sob demanda."""
+        engine = engine or DatabaseManager.get_engine()
+        metadata = cls.reflect(engine)
+        name = table_name.lower()
+        table = metadata.tables.get(name)
+        if table is None:
+            with cls._lock:
+                table = metadata.tables.get(name)
+                if table is None:
+                    try:
+                        table = Table(name, metadata, autoload_with=engine)
+                    except NoSuchTableError as e:
+                        raise ValueError(f"Tabela desconhecida: '{table_name}'.") from e
+        return table
+
+    @classmethod
+    def validate_columns(cls, table_name: str, columns, engine=None) -> list:
+        """Normaliza as colunas para minúsculas e rejeita as que não existem na tabela."""
+        table = cls.get_table(table_name, engine)
+        columns_lower = [str(col).lower() for col in columns]
+        unknown = [col for col in columns_lower if col not in table.c]
+        if unknown:
+            raise ValueError(f"Coluna(s) desconhecida(s) na tabela '{table.name}': {unknown}")
+        return columns_lower
+
+    @classmethod
+    def statement_sql(cls, statement) -> str:
+        """Retorna o SQL (dialeto genérico) de um statement memorizado, sem recompilar."""
+        entry = cls._statement_sql.get(id(statement))
+        if entry is not None and entry[0] is statement:
+            return entry[1]
+        return str(statement)
+
+    @classmethod
+    def _memoize(cls, key, builder):
+        engine = DatabaseManager.get_engine()
+        with cls._lock:
+            statement = cls._statements.get((engine,) + key)
+            if statement is None:
+                statement = builder(engine)
+                cls._statements[(engine,) + key] = statement
+                cls._statement_sql[id(statement)] = (statement, str(statement))
+            return statement
+
+    @classmethod
+    def _where(cls, table: Table, where_keys, prefix: str = ""):
+        return and_(*[table.c[key] == bindparam(f"{prefix}{key}") for key in where_keys])
+
+    @classmethod
+    def _criteria_shape(cls, table_name: str, criteria):
+        if criteria is None:
+            return None
+        cls.validate_columns(table_name, criteria.columns())
+        return criteria.shape()
+
+    @classmethod
+    def _filter_clause(cls, table: Table, where_keys, criteria, prefix: str):
+        if criteria is not None:
+            return criteria.to_clause(table, prefix)
+        return cls._where(table, where_keys, prefix)
+
+    @classmethod
+    def select_statement(cls, table_name: str, columns=None, where_keys=(), criteria=None):
+        """
+        SELECT das colunas informadas (ou todas) com igualdade nos bindparams ':<coluna>',
+        ou com o Filter 'criteria' (bindparams 'f<n>_<coluna>', ver filters.Filter.params).
+        """
+        columns = tuple(cls.validate_columns(table_name, columns)) if columns else None
+        where_keys = tuple(cls.validate_columns(table_name, where_keys))
+        shape = cls._criteria_shape(table_name, criteria)
+
+        def build(engine):
+            table = cls.get_table(table_name, engine)
+            statement = select(*[table.c[col] for col in columns]) if columns else select(table)
+            if where_keys or criteria is not None:
+                statement = statement.where(cls._filter_clause(table, where_keys, criteria, "f" if criteria else ""))
+            return statement
+
+        return cls._memoize(('select', table_name.lower(), columns, where_keys, shape), build)
+
+    @classmethod
+    def insert_statement(cls, table_name: str, columns):
+        """INSERT das colunas informadas, para executemany com uma lista de dicts."""
+        columns = tuple(cls.validate_columns(table_name, columns))
+
+        def build(engine):
+            table = cls.get_table(table_name, engine)
+            return insert(table).values({col: bindparam(col) for col in columns})
+
+        return cls._memoize(('insert', table_name.lower(), columns), build)
+
+    @classmethod
+    def update_statement(cls, table_name: str, set_keys, where_keys, set_prefix: str = "", where_prefix: str = "",
+                         criteria=None):
+        """
+        UPDATE com bindparams '<set_prefix><coluna>' no SET e '<where_prefix><chave>' no WHERE
+        (ou '<where_prefix><n>_<coluna>' quando o WHERE vem do Filter 'criteria').
+        """
+        set_keys = tuple(cls.validate_columns(table_name, set_keys))
+        where_keys = tuple(cls.validate_columns(table_name, where_keys))
+        shape = cls._criteria_shape(table_name, criteria)
+
+        def build(engine):
+            table = cls.get_table(table_name, engine)
+            return (update(table)
+                    .where(cls._filter_clause(table, where_keys, criteria, where_prefix))
+                    .values({col: bindparam(f"{set_prefix}{col}") for col in set_keys}))
+
+        return cls._memoize(('update', table_name.lower(), set_keys, where_keys, set_prefix, where_prefix, shape),
+                            build)
+
+    @classmethod
+    def delete_statement(cls, table_name: str, where_keys, criteria=None):
+        """DELETE com igualdade nos bindparams ':<coluna>', ou com o Filter 'criteria' ('f<n>_<coluna>')."""
+        where_keys = tuple(cls.validate_columns(table_name, where_keys))
+        shape = cls._criteria_shape(table_name, criteria)
+
+        def build(engine):
+            table = cls.get_table(table_name, engine)
+            return delete(table).where(cls._filter_clause(table, where_keys, criteria, "f" if criteria else ""))
+
+        return cls._memoize(('delete', table_name.lower(), where_keys, shape), build)
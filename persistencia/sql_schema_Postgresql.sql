@@ -51,6 +51,10 @@ CREATE TABLE especie_gatos (
     pais_origem VARCHAR(255),
     temperamento VARCHAR(255)
 );
+CREATE INDEX idx_vegetais_nome ON vegetais (nome);
+CREATE INDEX idx_vegetais_id_tipo ON vegetais (id_tipo);
+CREATE INDEX idx_log_alteracoes_timestamp ON log_alteracoes (timestamp);
+CREATE INDEX idx_log_alteracoes_login_usuario ON log_alteracoes (login_usuario);
 GRANT ALL PRIVILEGES ON ALL TABLES IN SCHEMA public TO gato;
 GRANT USAGE, SELECT ON ALL SEQUENCES IN SCHEMA public TO gato;
 INSERT INTO usuarios (login_usuario, senha_criptografada, nome_completo, tipo_acesso) VALUES
@@ -48,6 +48,10 @@ CREATE TABLE especie_gatos (
     pais_origem NVARCHAR(255),
     temperamento NVARCHAR(255)
 );
+CREATE INDEX idx_vegetais_nome ON vegetais (nome);
+CREATE INDEX idx_vegetais_id_tipo ON vegetais (id_tipo);
+CREATE INDEX idx_log_alteracoes_timestamp ON log_alteracoes (timestamp);
+CREATE INDEX idx_log_alteracoes_login_usuario ON log_alteracoes (login_usuario);
 GO
 INSERT INTO usuarios (login_usuario, senha_criptografada, nome_completo, tipo_acesso) VALUES
 ('admin', '$2b$12$TgcQ51usbRmBjfGtris6eueXiKMbJpfSpsFpuyM4QE/qwqmcEX9By', 'Usuário Administrador', 'Administrador Global'),
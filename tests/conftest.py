@@ -0,0 +1,17 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic_db import create_database, use_database
+
+@pytest.fixture
+def sqlite_db(tmp_path):
+    """Banco SQLite temporário com o schema do projeto, 50 vegetais e 20 registros de auditoria."""
+    db_path = create_database(tmp_path / "nexlify_teste.db", vegetais_rows=50, log_rows=20)
+    with use_database(db_path) as engine:
+        yield engine
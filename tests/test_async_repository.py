@@ -0,0 +1,78 @@
+import pytest
+from sqlalchemy import create_engine
+
+from persistencia.async_repository import AsyncDatabaseManager, AsyncGenericRepository
+from persistencia.database import DatabaseManager, _remember_spec
+
+@pytest.fixture
+def async_db(sqlite_db):
+    yield sqlite_db
+    AsyncDatabaseManager.shutdown()
+
+def _async_engines():
+    loop = AsyncDatabaseManager.background_loop()
+    return AsyncDatabaseManager._engines.get(loop, (None, {}))[1]
+
+def _async_engine():
+    return _async_engines().get(DatabaseManager.get_engine())
+
+def test_gather_reaproveita_loop_e_engine(async_db):
+    vegetais, logs = AsyncGenericRepository.gather(
+        AsyncGenericRepository.read_table_to_dataframe('vegetais', columns=['id']),
+        AsyncGenericRepository.read_table_to_dataframe('log_alteracoes', columns=['id']),
+    )
+    assert len(vegetais) == 50
+    assert len(logs) == 20
+
+    loop, engine = AsyncDatabaseManager.background_loop(), _async_engine()
+    AsyncGenericRepository.gather(AsyncGenericRepository.read_vegetais_com_tipo())
+    assert AsyncDatabaseManager.background_loop() is loop
+    if AsyncDatabaseManager.async_driver_name() is not None:
+        assert engine is not None
+        assert _async_engine() is engine
+
+def test_shutdown_fecha_o_loop_de_fundo(async_db):
+    AsyncGenericRepository.gather(AsyncGenericRepository.read_table_to_dataframe('vegetais', columns=['id']))
+    loop = AsyncDatabaseManager.background_loop()
+    AsyncDatabaseManager.shutdown()
+    assert loop.is_closed()
+    assert AsyncDatabaseManager.background_loop() is not loop
+
+def test_leitura_assincrona_usa_o_pool_somente_leitura(async_db):
+    if AsyncDatabaseManager.async_driver_name() is None:
+        pytest.skip("driver assíncrono do SQLite não instalado")
+    vegetais, = AsyncGenericRepository.gather(AsyncGenericRepository.read_table_to_dataframe('vegetais', columns=['id']))
+    assert len(vegetais) == 50
+    read_engine = DatabaseManager.get_read_engine()
+    assert read_engine is not DatabaseManager.get_engine()
+    assert read_engine in _async_engines()
+    assert DatabaseManager.engine_spec(read_engine)['read_only']
+
+    async def _escrever_na_engine_de_leitura():
+        async with AsyncDatabaseManager.engine_for(read_engine).begin() as connection:
+            await connection.exec_driver_sql("DELETE FROM vegetais")
+
+    with pytest.raises(Exception):
+        AsyncGenericRepository.gather(_escrever_na_engine_de_leitura())
+
+def test_engine_assincrona_herda_as_opcoes_de_pool(async_db, tmp_path):
+    if AsyncDatabaseManager.async_driver_name() is None:
+        pytest.skip("driver assíncrono do SQLite não instalado")
+    sync_engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}")
+    _remember_spec(sync_engine, sync_engine.url, {'pool_size': 3, 'max_overflow': 1, 'pool_timeout': 7.0})
+
+    async def _pool():
+        return AsyncDatabaseManager.engine_for(sync_engine).pool
+
+    pool, = AsyncGenericRepository.gather(_pool())
+    assert pool.size() == 3
+    assert pool._max_overflow == 1
+    assert pool.timeout() == 7.0
+    sync_engine.dispose()
+
+def test_escrita_assincrona_marca_a_sessao_de_quem_chamou(async_db, monkeypatch):
+    monkeypatch.setattr(DatabaseManager, '_replica_engines', [DatabaseManager.get_engine()])
+    monkeypatch.setattr(DatabaseManager, '_recent_writes', {})
+    assert not DatabaseManager._is_sticky()
+    AsyncGenericRepository.gather(AsyncGenericRepository.update_table('vegetais', {'id_tipo': 2}, {'id': 1}))
+    assert DatabaseManager._is_sticky()
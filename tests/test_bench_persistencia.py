@@ -0,0 +1,17 @@
+import json
+
+from benchmarks.bench_persistencia import PersistenciaBenchmark, main
+
+def test_suite_completa_roda_num_banco_pequeno(tmp_path):
+    output = tmp_path / "resultados.json"
+    codigo = main(['--rows', '200', '--repeat', '2', '--warmup', '1', '--write-batch', '20',
+                   '--output', str(output), '--baseline', str(tmp_path / "baseline.json"), '--save-baseline'])
+    assert codigo == 0
+    resultados = json.loads(output.read_text(encoding='utf-8'))['resultados']['200']
+    nomes = [nome for nome, _ in PersistenciaBenchmark(200, 200, repeat=2).cases()]
+    assert list(resultados) == nomes
+    assert resultados['auditoria']['linhas_por_s'] > 0
+
+    codigo = main(['--rows', '200', '--repeat', '2', '--write-batch', '20', '--only', 'update_table',
+                   '--output', str(output), '--baseline', str(tmp_path / "baseline.json"), '--tolerance', '1000'])
+    assert codigo == 0
@@ -0,0 +1,62 @@
+import pandas as pd
+
+from benchmarks.synthetic_db import BENCH_USER, create_database, use_database
+from persistencia.data_service import DataService
+from persistencia.repository import GenericRepository
+
+RECLASSIFICACOES = [
+    ('Vegetal 0000001', 'Frutos'),
+    ('Vegetal 0000002', 'Flores e Inflorescências'),
+    ('Vegetal inexistente', 'Folhas'),
+    ('Vegetal 0000003', 'Tipo inexistente'),
+    ('Vegetal 0000004', 'Frutos'),
+]
+
+def _executar(tmp_path, nome, reclassificar):
+    """Roda 'reclassificar' num banco novo com um nome de vegetal repetido e retorna o resultado e o estado final."""
+    db_path = create_database(tmp_path / f"{nome}.db", vegetais_rows=10, log_rows=0)
+    with use_database(db_path):
+        GenericRepository.write_dataframe_to_table(pd.DataFrame([{'nome': 'Vegetal 0000004', 'id_tipo': 1}]), 'vegetais')
+        resultado = reclassificar()
+        vegetais = GenericRepository.read_table_to_dataframe('vegetais', columns=['id', 'nome', 'id_tipo'])
+        logs = GenericRepository.read_table_to_dataframe('log_alteracoes', columns=['login_usuario', 'acao'])
+    return resultado, vegetais.sort_values('id', ignore_index=True), logs.sort_values('acao', ignore_index=True)
+
+def test_lote_equivale_as_chamadas_unitarias(tmp_path):
+    unitario, vegetais_unitario, logs_unitario = _executar(tmp_path, 'unitario', lambda: [
+        DataService.reclassificar_vegetal_e_logar(vegetal, tipo, BENCH_USER) for vegetal, tipo in RECLASSIFICACOES])
+    lote, vegetais_lote, logs_lote = _executar(tmp_path, 'lote', lambda: [
+        (item['sucesso'], item['mensagem'])
+        for item in DataService.reclassificar_vegetais_em_lote(RECLASSIFICACOES, BENCH_USER)])
+
+    assert lote == unitario
+    assert [sucesso for sucesso, _ in lote] == [True, False, False, False, True]
+    assert vegetais_lote.equals(vegetais_unitario)
+    assert logs_lote.equals(logs_unitario)
+    assert len(logs_lote) == 2
+
+def test_nome_repetido_reclassifica_o_primeiro_id(tmp_path):
+    _, vegetais, logs = _executar(tmp_path, 'repetido', lambda: DataService.reclassificar_vegetais_em_lote(
+        [('Vegetal 0000004', 'Frutos')], BENCH_USER))
+    repetidos = vegetais[vegetais['nome'] == 'Vegetal 0000004'].set_index('id')['id_tipo'].to_dict()
+    assert repetidos == {4: 4, 11: 1}
+    assert "(ID: 4)" in logs['acao'].iloc[0]
+
+def test_vegetal_repetido_no_lote(sqlite_db):
+    resultado = DataService.reclassificar_vegetais_em_lote(
+        [('Vegetal 0000001', 'Frutos'), ('Vegetal 0000001', 'Legumes')], BENCH_USER)
+    assert [item['sucesso'] for item in resultado] == [True, False]
+    assert resultado[1]['mensagem'] == "O vegetal aparece mais de uma vez no lote."
+    df = GenericRepository.read_table_to_dataframe('vegetais', columns=['id_tipo'], where_conditions={'id': 1})
+    assert df['id_tipo'].tolist() == [4]
+
+def test_par_rejeitado_nao_bloqueia_o_mesmo_vegetal_no_lote(sqlite_db):
+    resultado = DataService.reclassificar_vegetais_em_lote(
+        [('Vegetal 0000001', 'Folhas'), ('Vegetal 0000001', 'Frutos')], BENCH_USER)
+    assert [item['sucesso'] for item in resultado] == [False, True]
+    assert resultado[0]['mensagem'] == "O vegetal já pertence a este tipo."
+    df = GenericRepository.read_table_to_dataframe('vegetais', columns=['id_tipo'], where_conditions={'id': 1})
+    assert df['id_tipo'].tolist() == [4]
+
+def test_lote_vazio(sqlite_db):
+    assert DataService.reclassificar_vegetais_em_lote([], BENCH_USER) == []
@@ -0,0 +1,80 @@
+import pandas as pd
+import pytest
+from sqlalchemy import Column as SqlColumn, Integer, MetaData, String, Table
+
+from persistencia.filters import Column, Condition, Filter, Group, and_, as_filter, or_
+from persistencia.repository import GenericRepository
+from persistencia.schema import SchemaRegistry
+
+@pytest.fixture
+def tabela():
+    return Table('vegetais', MetaData(), SqlColumn('id', Integer), SqlColumn('nome', String), SqlColumn('id_tipo', Integer))
+
+def _sql(clause):
+    return str(clause.compile())
+
+def test_filter_e_abstrato():
+    with pytest.raises(TypeError):
+        Filter()
+
+def test_condicao_simples_usa_bindparam_nomeado_pela_posicao(tabela):
+    condicao = Column('ID_TIPO').eq(3)
+    assert _sql(condicao.to_clause(tabela)) == 'vegetais.id_tipo = :f0_id_tipo'
+    assert condicao.params() == {'f0_id_tipo': 3}
+    assert condicao.columns() == ['id_tipo']
+
+def test_grupos_numeram_as_condicoes_na_ordem(tabela):
+    filtro = Column('id_tipo').in_([1, 2]) & (Column('nome').eq('a') | Column('id').between(1, 9))
+    sql = _sql(filtro.to_clause(tabela))
+    assert 'vegetais.id_tipo IN (__[POSTCOMPILE_f0_id_tipo])' in sql
+    assert 'vegetais.nome = :f1_nome OR vegetais.id BETWEEN :f2_id_de AND :f2_id_ate' in sql
+    assert filtro.params() == {'f0_id_tipo': [1, 2], 'f1_nome': 'a', 'f2_id_de': 1, 'f2_id_ate': 9}
+
+def test_grupos_do_mesmo_tipo_sao_achatados():
+    filtro = Column('a').eq(1) & Column('b').eq(2) & Column('c').eq(3)
+    assert isinstance(filtro, Group)
+    assert len(filtro.filters) == 3
+    assert or_(Column('a').eq(1), and_(Column('b').eq(2))).shape() == ('or', ('eq', 'a'), ('and', ('eq', 'b')))
+
+def test_forma_ignora_os_valores():
+    assert (Column('id').gt(1) | Column('nome').like('x%')).shape() == (Column('id').gt(99) | Column('nome').like('y')).shape()
+    assert Column('id').gt(1).shape() != Column('id').ge(1).shape()
+
+def test_startswith_escapa_curingas():
+    assert Column('nome').startswith('50%_a/b').params() == {'f0_nome': '50/%/_a//b%'}
+
+def test_nulos_nao_tem_parametros(tabela):
+    filtro = Column('nome').is_null() | Column('id').not_null()
+    assert filtro.params() == {}
+    assert _sql(filtro.to_clause(tabela)) == 'vegetais.nome IS NULL OR vegetais.id IS NOT NULL'
+
+def test_as_filter():
+    assert as_filter({'id': 1}).shape() == ('eq', 'id')
+    assert as_filter({'id': 1, 'nome': 'x'}).shape() == ('and', ('eq', 'id'), ('eq', 'nome'))
+    condicao = Column('id').eq(1)
+    assert as_filter(condicao) is condicao
+    with pytest.raises(ValueError):
+        as_filter({})
+    with pytest.raises(TypeError):
+        as_filter([('id', 1)])
+    with pytest.raises(ValueError):
+        Condition('id', 'regex', '.*')
+    with pytest.raises(ValueError):
+        Group('xor', condicao)
+
+def test_filtros_de_mesma_forma_reusam_o_statement(sqlite_db):
+    primeiro = SchemaRegistry.select_statement('vegetais', criteria=Column('id').in_([1, 2]))
+    segundo = SchemaRegistry.select_statement('vegetais', criteria=Column('id').in_([3, 4, 5]))
+    assert primeiro is segundo
+
+def test_leitura_com_filtro_no_banco(sqlite_db):
+    GenericRepository.write_dataframe_to_table(
+        pd.DataFrame([{'nome': '50%_off', 'id_tipo': 1}, {'nome': '50x_off', 'id_tipo': 1}]), 'vegetais')
+
+    df = GenericRepository.read_table_to_dataframe('vegetais', columns=['nome'],
+                                                   where_conditions=Column('nome').startswith('50%_'))
+    assert df['nome'].tolist() == ['50%_off']
+
+    df = GenericRepository.read_table_to_dataframe(
+        'vegetais', columns=['id'], where_conditions=Column('id').in_([3, 7]) | Column('id').between(10, 11))
+    assert sorted(df['id'].tolist()) == [3, 7, 10, 11]
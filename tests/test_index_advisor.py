@@ -0,0 +1,19 @@
+from persistencia.filters import Column
+from persistencia.index_advisor import IndexAdvisor
+from persistencia.repository import GenericRepository
+
+def _plano(engine, criteria):
+    statement, params = GenericRepository.table('vegetais').select('id', 'id_tipo').where(criteria).statement()
+    compiled = statement.params(**params).compile(dialect=engine.dialect, compile_kwargs={'render_postcompile': True})
+    positional = tuple(compiled.params[name] for name in (compiled.positiontup or []))
+    return IndexAdvisor.explain(engine, compiled.string, positional)
+
+def test_igualdade_usa_o_indice_de_nome(sqlite_db):
+    plan, scans = _plano(sqlite_db, Column('nome').eq('Vegetal 0000010'))
+    assert scans == []
+    assert any(line.startswith('SEARCH') and 'idx_vegetais_nome' in line for line in plan)
+
+def test_prefixo_com_escape_varre_a_tabela_no_sqlite(sqlite_db):
+    plan, scans = _plano(sqlite_db, Column('nome').startswith('Vegetal 00000'))
+    assert scans == ['vegetais']
+    assert not any(line.startswith('SEARCH') for line in plan)
@@ -0,0 +1,51 @@
+import pandas as pd
+import pytest
+
+from persistencia.filters import Column
+from persistencia.repository import GenericRepository
+
+def _walk(read_page):
+    pages, cursor = [], None
+    while True:
+        page, cursor = read_page(cursor)
+        pages.append(page)
+        if cursor is None:
+            return pages
+
+def test_read_table_page_percorre_todas_as_linhas(sqlite_db):
+    pages = _walk(lambda cursor: GenericRepository.read_table_page('vegetais', page_size=7, cursor=cursor,
+                                                                   columns=['nome']))
+    ids = pd.concat(pages)['id'].tolist()
+    assert len(pages) == 8
+    assert ids == list(range(1, 51))
+
+def test_read_table_page_decrescente(sqlite_db):
+    pages = _walk(lambda cursor: GenericRepository.read_table_page('log_alteracoes', page_size=6, cursor=cursor,
+                                                                   descending=True))
+    assert pd.concat(pages)['id'].tolist() == list(range(20, 0, -1))
+
+def test_read_table_page_com_filtro(sqlite_db):
+    pages = _walk(lambda cursor: GenericRepository.read_table_page(
+        'vegetais', page_size=4, cursor=cursor, where_conditions=Column('id_tipo').eq(2)))
+    df = pd.concat(pages)
+    assert not df.empty
+    assert set(df['id_tipo']) == {2}
+    assert df['id'].is_monotonic_increasing
+
+def test_read_table_page_cursor_de_outra_chave(sqlite_db):
+    _, cursor = GenericRepository.read_table_page('vegetais', page_size=5)
+    with pytest.raises(ValueError):
+        GenericRepository.read_table_page('usuarios', page_size=5, cursor=cursor)
+    with pytest.raises(ValueError):
+        GenericRepository.read_table_page('vegetais', page_size=5, cursor='não-é-um-cursor')
+
+def test_vegetais_com_tipo_paginado_por_nome_com_nomes_repetidos(sqlite_db):
+    repetidos = pd.DataFrame([{'nome': 'Vegetal 0000010', 'id_tipo': 1}, {'nome': 'Vegetal 0000010', 'id_tipo': 3}])
+    GenericRepository.write_dataframe_to_table(repetidos, 'vegetais')
+
+    pages = _walk(lambda cursor: GenericRepository.read_vegetais_com_tipo_page(page_size=9, cursor=cursor))
+    paged = pd.concat([page.to_pandas() for page in pages], ignore_index=True)
+    full = GenericRepository.read_vegetais_com_tipo().sort_values(['nome', 'id'], ignore_index=True)
+
+    assert len(paged) == 52
+    assert paged[['id', 'nome', 'tipo']].equals(full[['id', 'nome', 'tipo']])
@@ -0,0 +1,57 @@
+import re
+from contextlib import contextmanager
+from pathlib import Path
+
+import sqlalchemy
+from sqlalchemy.engine import Engine
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.synthetic_db import BENCH_USER
+from components.vegetais_auditoria_view import VegetaisAuditoriaView
+from persistencia.repository import GenericRepository
+
+PAGINA_VEGETAIS = Path(__file__).parent.parent / "pages" / "4_🌿_Vegetais_e_Auditoria.py"
+TABELAS_DO_APP = re.compile(r"\bFROM (vegetais|tipos_vegetais|log_alteracoes)\b")
+
+@contextmanager
+def _selects_executados():
+    """Coleta (sql, colunas retornadas) de cada SELECT executado nas tabelas do app."""
+    executados = []
+
+    def registrar(conn, cursor, statement, parameters, context, executemany):
+        if TABELAS_DO_APP.search(statement):
+            executados.append((statement, [coluna[0] for coluna in cursor.description or ()]))
+
+    sqlalchemy.event.listen(Engine, 'after_cursor_execute', registrar)
+    try:
+        yield executados
+    finally:
+        sqlalchemy.event.remove(Engine, 'after_cursor_execute', registrar)
+
+def test_pagina_de_vegetais_com_tipo_busca_so_as_colunas_exibidas(sqlite_db):
+    with _selects_executados() as executados:
+        pagina, cursor = GenericRepository.read_vegetais_com_tipo_page(page_size=5)
+        GenericRepository.read_vegetais_com_tipo_page(page_size=5, cursor=cursor)
+
+    assert pagina.column_names == ['id', 'nome', 'tipo']
+    assert len(executados) == 2
+    for sql, colunas in executados:
+        lista_select = sql.split('FROM')[0]
+        assert lista_select.strip() == "SELECT vegetais.id, vegetais.nome, tipos_vegetais.nome AS tipo"
+        assert colunas == ['id', 'nome', 'tipo']
+
+def test_view_de_vegetais_busca_so_as_colunas_renderizadas(sqlite_db):
+    app_test = AppTest.from_file(str(PAGINA_VEGETAIS), default_timeout=30)
+    app_test.session_state.user_info = {'username': BENCH_USER, 'name': 'Usuário de Teste',
+                                        'access_level': 'Administrador Global'}
+    with _selects_executados() as executados:
+        app_test.run()
+
+    assert not app_test.exception
+    renderizadas = [list(tabela.value.columns) for tabela in app_test.dataframe]
+    assert renderizadas == [['id', 'nome', 'tipo'], VegetaisAuditoriaView.LOG_COLUMNS]
+    esperadas = renderizadas + [VegetaisAuditoriaView.TIPO_COLUMNS, VegetaisAuditoriaView.VEGETAL_OPTION_COLUMNS]
+    assert executados
+    for sql, colunas in executados:
+        assert '*' not in sql.split('FROM')[0]
+        assert colunas in esperadas, sql
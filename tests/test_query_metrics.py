@@ -0,0 +1,70 @@
+import pytest
+from sqlalchemy import exc
+
+import config
+from persistencia.async_repository import AsyncDatabaseManager, AsyncGenericRepository
+from persistencia.query_metrics import QueryMetrics
+
+SQL = "SELECT id FROM vegetais WHERE id = ?"
+
+@pytest.fixture
+def metrics(sqlite_db, tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'SLOW_QUERY_LOG_PATH', tmp_path / "logs" / "slow_queries.log")
+    QueryMetrics.close_slow_query_log()
+    QueryMetrics.reset()
+    yield sqlite_db
+    QueryMetrics.close_slow_query_log()
+    QueryMetrics.reset()
+
+def _stats(sql):
+    return next(row for row in QueryMetrics.snapshot() if row['sql'] == sql)
+
+def test_erro_descarta_a_medicao_pendente(metrics):
+    with metrics.connect() as connection:
+        for _ in range(3):
+            with pytest.raises(exc.OperationalError):
+                connection.exec_driver_sql("SELECT * FROM tabela_inexistente")
+        assert not connection.info.get('query_metrics')
+        connection.exec_driver_sql(SQL, (1,)).fetchall()
+        assert not connection.info.get('query_metrics')
+    assert _stats(SQL)['execucoes'] == 1
+
+def test_origem_e_amostrada(metrics):
+    total = QueryMetrics.CALLER_SAMPLE_EVERY * 2
+    with metrics.connect() as connection:
+        for index in range(total):
+            connection.exec_driver_sql(SQL, (index,)).fetchall()
+    stats = _stats(SQL)
+    assert stats['execucoes'] == total
+    assert sum(stats['origens'].values()) == 2
+
+def test_queries_lentas_sempre_tem_origem(metrics, monkeypatch):
+    monkeypatch.setattr(config, 'SLOW_QUERY_THRESHOLD_MS', 0.0)
+    with metrics.connect() as connection:
+        for index in range(5):
+            connection.exec_driver_sql(SQL, (index,)).fetchall()
+    assert sum(_stats(SQL)['origens'].values()) == 5
+
+def test_log_de_queries_lentas_so_e_criado_na_primeira_query_lenta(metrics, monkeypatch):
+    QueryMetrics.install(metrics)
+    with metrics.connect() as connection:
+        connection.exec_driver_sql(SQL, (1,)).fetchall()
+    assert not config.SLOW_QUERY_LOG_PATH.parent.exists()
+
+    monkeypatch.setattr(config, 'SLOW_QUERY_THRESHOLD_MS', 0.0)
+    with metrics.connect() as connection:
+        connection.exec_driver_sql(SQL, (2,)).fetchall()
+    QueryMetrics.close_slow_query_log()
+    conteudo = config.SLOW_QUERY_LOG_PATH.read_text(encoding='utf-8')
+    assert SQL in conteudo
+    assert "parametros=['<int>']" in conteudo
+
+def test_engine_assincrona_e_instrumentada(metrics):
+    if AsyncDatabaseManager.async_driver_name() is None:
+        pytest.skip("driver assíncrono do SQLite não instalado")
+    try:
+        AsyncGenericRepository.gather(AsyncGenericRepository.execute_query_to_dataframe(
+            "SELECT nome FROM tipos_vegetais", use_cache=False))
+    finally:
+        AsyncDatabaseManager.shutdown()
+    assert _stats("SELECT nome FROM tipos_vegetais")['execucoes'] == 1
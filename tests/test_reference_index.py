@@ -0,0 +1,40 @@
+from sqlalchemy import text
+
+from benchmarks.synthetic_db import BENCH_USER
+from persistencia.data_service import DataService
+from persistencia.reference_index import ReferenceIndex
+from persistencia.repository import GenericRepository
+
+def test_escrita_nao_confirmada_nao_altera_o_indice(sqlite_db):
+    assert GenericRepository.reference_id('tipos_vegetais', 'Folhas') == 2
+    with sqlite_db.connect() as connection:
+        transaction = connection.begin()
+        connection.execute(text("UPDATE tipos_vegetais SET nome = 'Hortaliças' WHERE id = 2"))
+        assert GenericRepository.reference_id('tipos_vegetais', 'Folhas') == 2
+        assert GenericRepository.reference_id('tipos_vegetais', 'Hortaliças') is None
+        transaction.rollback()
+    assert GenericRepository.reference_id('tipos_vegetais', 'Folhas') == 2
+    assert GenericRepository.reference_name('tipos_vegetais', 2) == 'Folhas'
+
+def test_escrita_confirmada_invalida_o_indice(sqlite_db):
+    assert GenericRepository.reference_name('tipos_vegetais', 2) == 'Folhas'
+    GenericRepository.update_table('tipos_vegetais', {'nome': 'Hortaliças'}, {'id': 2})
+    assert GenericRepository.reference_name('tipos_vegetais', 2) == 'Hortaliças'
+    assert GenericRepository.reference_id('tipos_vegetais', 'Folhas') is None
+
+    sucesso, _ = DataService.reclassificar_vegetal_e_logar('Vegetal 0000001', 'Hortaliças', BENCH_USER)
+    assert not sucesso
+    sucesso, _ = DataService.reclassificar_vegetal_e_logar('Vegetal 0000002', 'Hortaliças', BENCH_USER)
+    assert sucesso
+
+def test_carga_concorrente_com_escrita_nao_e_publicada():
+    index = ReferenceIndex()
+
+    def loader_com_escrita(table_name):
+        index.invalidate(table_name)
+        return [(1, 'antigo')]
+
+    assert index.get('tipos_vegetais', loader_com_escrita)[0] == {'antigo': 1}
+    assert index.stats()['tables'] == {}
+    assert index.get('tipos_vegetais', lambda table_name: [(1, 'novo')])[0] == {'novo': 1}
+    assert index.stats()['tables'] == {'tipos_vegetais': 1}
@@ -0,0 +1,89 @@
+import sqlite3
+import threading
+
+import pytest
+from sqlalchemy import create_engine
+
+from persistencia.async_repository import AsyncDatabaseManager, AsyncGenericRepository
+from persistencia.database import DatabaseManager
+from persistencia.repository import GenericRepository
+
+@pytest.fixture
+def replica_sem_schema(sqlite_db, tmp_path, monkeypatch):
+    """Réplica SQLite vazia: conecta normalmente, mas toda query falha com OperationalError."""
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica_vazia.db'}")
+    monkeypatch.setattr(DatabaseManager, '_replica_engines', [replica])
+    monkeypatch.setattr(DatabaseManager, '_replica_down_until', {})
+    monkeypatch.setattr(DatabaseManager, '_recent_writes', {})
+    yield replica
+    replica.dispose()
+
+@pytest.fixture
+def replica_atrasada(sqlite_db, tmp_path, monkeypatch):
+    """Réplica SQLite com uma cópia do banco que não recebe as escritas feitas depois dela."""
+    copia = tmp_path / 'replica_atrasada.db'
+    with sqlite3.connect(sqlite_db.url.database) as origem, sqlite3.connect(copia) as destino:
+        origem.backup(destino)
+    replica = create_engine(f"sqlite:///{copia}")
+    monkeypatch.setattr(DatabaseManager, '_replica_engines', [replica])
+    monkeypatch.setattr(DatabaseManager, '_replica_down_until', {})
+    monkeypatch.setattr(DatabaseManager, '_recent_writes', {})
+    yield replica
+    replica.dispose()
+
+def _em_outra_sessao(funcao):
+    resultado = {}
+    thread = threading.Thread(target=lambda: resultado.update(valor=funcao()))
+    thread.start()
+    thread.join()
+    return resultado['valor']
+
+def _replica_saudavel():
+    return DatabaseManager.pool_status()['replicas'][0]['healthy']
+
+def test_dataframe_repete_no_primario_quando_a_replica_falha_na_query(replica_sem_schema):
+    assert DatabaseManager.get_read_engine() is replica_sem_schema
+    df = GenericRepository.execute_query_to_dataframe("SELECT id FROM vegetais ORDER BY id", use_cache=False)
+    assert df['id'].tolist() == list(range(1, 51))
+    assert not _replica_saudavel()
+    assert DatabaseManager.get_read_engine() is DatabaseManager.get_engine()
+
+def test_arrow_repete_no_primario_quando_a_replica_falha_na_query(replica_sem_schema):
+    table = GenericRepository.execute_query_to_arrow("SELECT id FROM vegetais ORDER BY id", use_cache=False)
+    assert table.column('id').to_pylist() == list(range(1, 51))
+    assert not _replica_saudavel()
+
+def test_blocos_tiram_a_replica_do_rodizio(replica_sem_schema):
+    with pytest.raises(Exception):
+        list(GenericRepository.iter_query_dataframes("SELECT id FROM vegetais", chunk_size=10))
+    assert not _replica_saudavel()
+
+def test_leitura_assincrona_repete_no_primario_quando_a_replica_falha(replica_sem_schema):
+    try:
+        df, = AsyncGenericRepository.gather(
+            AsyncGenericRepository.execute_query_to_dataframe("SELECT id FROM vegetais ORDER BY id", use_cache=False))
+    finally:
+        AsyncDatabaseManager.shutdown()
+    assert df['id'].tolist() == list(range(1, 51))
+    assert not _replica_saudavel()
+
+def test_quem_escreveu_le_a_propria_escrita_apesar_da_replica_atrasada(replica_atrasada):
+    sql = "SELECT id_tipo FROM vegetais WHERE id = 1"
+    GenericRepository.update_table('vegetais', {'id_tipo': 5}, {'id': 1})
+
+    outra_sessao = _em_outra_sessao(lambda: GenericRepository.execute_query_to_dataframe(sql))
+    assert outra_sessao['id_tipo'].tolist() == [2]
+    outra_sessao = _em_outra_sessao(lambda: GenericRepository.execute_query_to_arrow(sql))
+    assert outra_sessao.column('id_tipo').to_pylist() == [2]
+
+    assert GenericRepository.execute_query_to_dataframe(sql)['id_tipo'].tolist() == [5]
+    assert GenericRepository.execute_query_to_arrow(sql).column('id_tipo').to_pylist() == [5]
+
+    try:
+        outra_sessao, = _em_outra_sessao(lambda: AsyncGenericRepository.gather(
+            AsyncGenericRepository.execute_query_to_dataframe(sql + " AND 1 = 1")))
+        assert outra_sessao['id_tipo'].tolist() == [2]
+        propria, = AsyncGenericRepository.gather(AsyncGenericRepository.execute_query_to_dataframe(sql + " AND 1 = 1"))
+    finally:
+        AsyncDatabaseManager.shutdown()
+    assert propria['id_tipo'].tolist() == [5]
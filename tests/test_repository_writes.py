@@ -0,0 +1,65 @@
+import pytest
+
+from persistencia.async_repository import AsyncDatabaseManager, AsyncGenericRepository
+from persistencia.filters import Column
+from persistencia.repository import GenericRepository
+
+@pytest.fixture
+def async_db(sqlite_db):
+    yield sqlite_db
+    AsyncDatabaseManager.shutdown()
+
+def _especies():
+    return GenericRepository.read_table_to_dataframe('especie_gatos', columns=['id', 'nome_especie', 'pais_origem'])
+
+@pytest.mark.parametrize('where', [{}, None])
+def test_update_sem_condicoes_e_recusado(sqlite_db, where):
+    antes = _especies()
+    with pytest.raises(ValueError):
+        GenericRepository.update_table('especie_gatos', {'pais_origem': 'ZZ'}, where)
+    assert _especies().equals(antes)
+
+@pytest.mark.parametrize('where', [{}, None])
+def test_delete_sem_condicoes_e_recusado(sqlite_db, where):
+    total = len(_especies())
+    with pytest.raises(ValueError):
+        GenericRepository.delete_from_table('especie_gatos', where)
+    assert len(_especies()) == total
+
+def test_update_com_dict_atinge_apenas_a_linha(sqlite_db):
+    antes = _especies()
+    alvo = antes.iloc[0]
+    GenericRepository.update_table('especie_gatos', {'pais_origem': 'ZZ'}, {'id': int(alvo['id'])})
+    depois = _especies().set_index('id')
+    assert depois.loc[alvo['id'], 'pais_origem'] == 'ZZ'
+    assert (depois['pais_origem'] == 'ZZ').sum() == 1
+
+def test_update_e_delete_com_filter(sqlite_db):
+    ids = _especies()['id'].tolist()
+    GenericRepository.update_table('especie_gatos', {'pais_origem': 'ZZ'}, Column('id').in_(ids[:2]))
+    assert (_especies()['pais_origem'] == 'ZZ').sum() == 2
+
+    GenericRepository.delete_from_table('especie_gatos', Column('pais_origem').eq('ZZ'))
+    assert sorted(_especies()['id'].tolist()) == sorted(ids[2:])
+
+@pytest.mark.parametrize('where', [{}, None])
+def test_update_assincrono_sem_condicoes_e_recusado(async_db, where):
+    antes = _especies()
+    with pytest.raises(ValueError):
+        AsyncGenericRepository.gather(AsyncGenericRepository.update_table('especie_gatos', {'pais_origem': 'ZZ'}, where))
+    assert _especies().equals(antes)
+
+@pytest.mark.parametrize('where', [{}, None])
+def test_delete_assincrono_sem_condicoes_e_recusado(async_db, where):
+    total = len(_especies())
+    with pytest.raises(ValueError):
+        AsyncGenericRepository.gather(AsyncGenericRepository.delete_from_table('especie_gatos', where))
+    assert len(_especies()) == total
+
+def test_update_e_delete_assincronos_com_condicoes(async_db):
+    ids = _especies()['id'].tolist()
+    AsyncGenericRepository.gather(
+        AsyncGenericRepository.update_table('especie_gatos', {'pais_origem': 'ZZ'}, {'id': ids[0]}))
+    assert (_especies()['pais_origem'] == 'ZZ').sum() == 1
+    AsyncGenericRepository.gather(AsyncGenericRepository.delete_from_table('especie_gatos', Column('id').eq(ids[0])))
+    assert sorted(_especies()['id'].tolist()) == sorted(ids[1:])
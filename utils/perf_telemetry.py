@@ -0,0 +1,106 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+class RenderStats:
+    """Tempos de renderização de uma página (últimas SAMPLE_SIZE execuções para os percentis)."""
+
+    SAMPLE_SIZE = 256
+
+    def __init__(self, page: str):
+        self.page = page
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.samples = deque(maxlen=self.SAMPLE_SIZE)
+
+    def add(self, elapsed_ms: float):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.samples.append(elapsed_ms)
+
+    def percentile(self, fraction: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+    def as_dict(self) -> dict:
+        return {
+            'pagina': self.page,
+            'renderizacoes': self.count,
+            'media_ms': self.total_ms / self.count if self.count else 0.0,
+            'p50_ms': self.percentile(0.50),
+            'p95_ms': self.percentile(0.95),
+            'max_ms': self.max_ms,
+        }
+
+class PerfTelemetry:
+    """
+    Telemetria da interface neste processo: sessões Streamlit ativas (registradas por
+    st_check_session) e tempo de renderização de cada página (medido com measure_render).
+    """
+
+    SESSION_IDLE_SECONDS = 900
+
+    _sessions = {}
+    _renders = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _session_id():
+        try:
+            from streamlit.runtime.scriptrunner import get_script_run_ctx
+        except ImportError:
+            return None
+        ctx = get_script_run_ctx()
+        return ctx.session_id if ctx is not None else None
+
+    @classmethod
+    def touch_session(cls, page: str, user: str = None):
+        """Registra atividade da sessão atual na página informada."""
+        session_id = cls._session_id()
+        if session_id is None:
+            return
+        with cls._lock:
+            cls._sessions[session_id] = {'usuario': user, 'pagina': page, 'ultimo_acesso': time.time()}
+
+    @classmethod
+    def active_sessions(cls) -> list:
+        """Sessões com atividade nos últimos SESSION_IDLE_SECONDS; as inativas são descartadas."""
+        limit = time.time() - cls.SESSION_IDLE_SECONDS
+        with cls._lock:
+            for session_id in [key for key, info in cls._sessions.items() if info['ultimo_acesso'] < limit]:
+                del cls._sessions[session_id]
+            sessions = [dict(info, sessao=session_id[:8]) for session_id, info in cls._sessions.items()]
+        sessions.sort(key=lambda info: info['ultimo_acesso'], reverse=True)
+        return sessions
+
+    @classmethod
+    @contextmanager
+    def measure_render(cls, page: str):
+        """Mede o tempo de renderização do bloco (normalmente controller.run()) para a página."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            with cls._lock:
+                stats = cls._renders.get(page)
+                if stats is None:
+                    stats = cls._renders[page] = RenderStats(page)
+                stats.add(elapsed_ms)
+
+    @classmethod
+    def render_stats(cls) -> list:
+        with cls._lock:
+            rows = [stats.as_dict() for stats in cls._renders.values()]
+        rows.sort(key=lambda row: row['p95_ms'], reverse=True)
+        return rows
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._renders.clear()
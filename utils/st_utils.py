@@ -1,6 +1,9 @@
 import streamlit as st
 import logging
+import sys
+from pathlib import Path
 import config
+from utils.perf_telemetry import PerfTelemetry
 
 def st_check_session():
     """
@@ -9,12 +12,16 @@ def st_check_session():
     Se sim, e se o login estiver ativado, renderiza a barra lateral com
     informações do usuário e botão de logout.
     A navegação de páginas é gerenciada automaticamente pelo Streamlit.
+    Também registra a sessão e a página atual no PerfTelemetry.
     """
     if 'user_info' not in st.session_state or st.session_state.user_info is None:
         st.warning("Acesso negado. Por favor, faça o login.")
         st.switch_page("Home.py")
         st.stop()
 
+    PerfTelemetry.touch_session(Path(sys._getframe(1).f_code.co_filename).stem,
+                                st.session_state.user_info.get('username'))
+
     if config.USE_LOGIN:
                              
         st.sidebar.title("Painel de Controle")